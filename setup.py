@@ -18,6 +18,7 @@
 import os, re
 from setuptools import setup, find_packages
 from setuptools.command.install import install
+from setuptools.command.build_py import build_py
 
 SOURCE = os.path.relpath(os.path.join(os.path.dirname(__file__), 'svROS'))
 DATA   = ""
@@ -31,6 +32,17 @@ class PostInstallCommand(install):
         install.run(self)
         os.system("cat ./INFO")
 
+class BuildPyCommand(build_py):
+    """Generates svROS/grammars/helpers.py (stand-alone LALR parser) from helpers.lark before building."""
+    def run(self):
+        try:
+            from svROS.grammars.generate import generate
+            generate()
+        except Exception as error:
+            # No lark at build time => svROS compiles helpers.lark on first use instead.
+            print(f'[svROS] Stand-alone helper parser not generated: {error}')
+        build_py.run(self)
+
 def info(keyword : str) -> str:
     re_ = fr"^__{keyword}__\s*=\s*(u|f|r)?['\"]([^'\"]*)['\"]"
     match = re.search(re_, open(DATA, "rt").read(), re.M)
@@ -61,6 +73,7 @@ __README__  = os.path.join(os.path.dirname(__file__), 'README.md')
 extra = package_files(UTILS+'/bin')
 extra = extra + package_files(UTILS+'/visualizer')
 extra = extra + package_files(UTILS+'/schemas')
+extra = extra + package_files(UTILS+'/grammars')
 
 setup(
     name             = "svROS",
@@ -85,6 +98,7 @@ setup(
     extras_require   = {},
     cmdclass={
         'install': PostInstallCommand,
+        'build_py': BuildPyCommand,
     },
     zip_safe         = True
 )
@@ -1,4 +1,3 @@
-
 import edu.mit.csail.sdg.alloy4.A4Reporter;
 import edu.mit.csail.sdg.ast.Command;
 import edu.mit.csail.sdg.parser.CompModule;
@@ -8,30 +7,142 @@ import edu.mit.csail.sdg.translator.A4Solution;
 import edu.mit.csail.sdg.translator.A4SolutionWriter;
 import edu.mit.csail.sdg.translator.TranslateAlloyToKodkod;
 
+import java.io.BufferedReader;
 import java.io.File;
+import java.io.FileWriter;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.nio.file.Files;
 import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
 import java.util.List;
-import java.util.stream.Collectors;
+import java.util.Map;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicBoolean;
 
 public class Generator {
+    private final String alloy;
     private CompModule model;
+    private Map<String, Command> commands;
     private A4Options options;
     private A4Reporter rep;
+    private long lastModified;
+    private long parseTime;
+
+    /* PARSED MODULES KEPT RESIDENT BY THE DAEMON */
+    private static final Map<String, Generator> MODULES = new HashMap<>();
+
+    /* SAT BACKENDS => name used by svROS, Alloy solver and the native library it needs (null => pure Java). */
+    private static final Map<String, A4Options.SatSolver> SOLVERS = new LinkedHashMap<>();
+    private static final Map<A4Options.SatSolver, String> LIBRARIES = new HashMap<>();
+    private static final Map<A4Options.SatSolver, Boolean> AVAILABLE = new HashMap<>();
+    static {
+        SOLVERS.put("minisatprover", A4Options.SatSolver.MiniSatProverJNI);
+        SOLVERS.put("minisat", A4Options.SatSolver.MiniSatJNI);
+        SOLVERS.put("glucose", A4Options.SatSolver.GlucoseJNI);
+        SOLVERS.put("sat4j", A4Options.SatSolver.SAT4J);
+        LIBRARIES.put(A4Options.SatSolver.MiniSatProverJNI, "minisatprover");
+        LIBRARIES.put(A4Options.SatSolver.MiniSatJNI, "minisat");
+        LIBRARIES.put(A4Options.SatSolver.GlucoseJNI, "glucose");
+    }
+    private static final File GENERATED_MODELS = new File(System.getProperty("java.io.tmpdir"), "generated_models");
 
 
     public Generator(String alloy){
+        this.alloy = alloy;
         rep = new A4Reporter();
         options = new A4Options();
-        options.solver = A4Options.SatSolver.MiniSatProverJNI;
+        options.solver = solver("minisatprover");
+        lastModified = new File(alloy).lastModified();
+        long start = System.currentTimeMillis();
         model = CompUtil.parseEverything_fromFile(rep, null, alloy, 2);
+        parseTime = System.currentTimeMillis() - start;
+        // COMMANDS BY LABEL => first one wins, as in the Alloy Analyzer.
+        commands = new LinkedHashMap<>();
+        for (Command command : model.getAllCommands()) commands.putIfAbsent(command.label, command);
+    }
+
+    /* A JNI backend whose native library cannot be loaded on this host falls back to SAT4J. */
+    private static synchronized boolean available(A4Options.SatSolver solver) {
+        String library = LIBRARIES.get(solver);
+        if (library == null) return true;
+        return AVAILABLE.computeIfAbsent(solver, s -> {
+            try {
+                System.loadLibrary(library);
+                return true;
+            } catch (Throwable error) {
+                return false;
+            }
+        });
     }
 
-    public void generateRun(String type, String property){
-        Command command = model.getAllCommands().stream().filter(x -> x.toString().split(" ")[1].equals(property)).collect(Collectors.toList()).get(0);
-        // List<Command> commands = model.getAllCommands().stream().collect(Collectors.toList());
+    private static A4Options.SatSolver solver(String name) {
+        A4Options.SatSolver solver = SOLVERS.get(name.toLowerCase());
+        if (solver == null) {
+            throw new IllegalArgumentException("Unknown solver " + name);
+        }
+        return available(solver) ? solver : A4Options.SatSolver.SAT4J;
+    }
+
+    /*
+     * STATISTICS => one reporter per command.
+     *   translation : from execute_command until the CNF is handed to the SAT solver (first solve callback)
+     *   sat         : from then on until a verdict is reached
+     */
+    private static class Stats extends A4Reporter {
+        long start = System.currentTimeMillis(), solving = -1;
+        int primaryVars, totalVars, clauses;
+
+        /* Alloy 6 => called once per trace length. */
+        public void solve(int step, int primaryVars, int totalVars, int clauses) {
+            solve(primaryVars, totalVars, clauses);
+        }
+
+        /* Alloy 4/5 */
+        public void solve(int primaryVars, int totalVars, int clauses) {
+            if (solving < 0) solving = System.currentTimeMillis();
+            this.primaryVars = Math.max(this.primaryVars, primaryVars);
+            this.totalVars   = Math.max(this.totalVars, totalVars);
+            this.clauses     = Math.max(this.clauses, clauses);
+        }
+
+        void record(Map<String, Object> record, long end) {
+            long translated = solving < 0 ? end : solving;
+            record.put("translation_ms", translated - start);
+            record.put("sat_ms", end - translated);
+            record.put("primary_vars", primaryVars);
+            record.put("vars", totalVars);
+            record.put("clauses", clauses);
+        }
+    }
+
+    /* Reuses the parsed module for as long as the file is left untouched. */
+    public static Generator load(String alloy) {
+        Generator g = MODULES.get(alloy);
+        if (g == null || g.lastModified != new File(alloy).lastModified()) {
+            g = new Generator(alloy);
+            MODULES.put(alloy, g);
+        }
+        return g;
+    }
+
+    /*
+     * Solves property, appends its record to dir/manifest.jsonl and returns it:
+     *   {"property": ..., "command": ..., "solver": ..., "outcome": SAT | UNSAT, "file": counterexample (if SAT),
+     *    "parse_ms": ..., "translation_ms": ..., "sat_ms": ..., "primary_vars": ..., "vars": ..., "clauses": ...}
+     */
+    public Map<String, Object> generateRun(File dir, String property, String solver) throws Exception {
+        Command command = commands.get(property);
+        if (command == null) {
+            throw new IllegalArgumentException("No command named " + property);
+        }
 
         /* SET DIR UP */
-        File dir = new File("/tmp/generated_models/" + type);
         if (!dir.exists()) {
             dir.mkdirs();
         }
@@ -41,17 +152,178 @@ public class Generator {
         System.out.println();
 
         // SOLUTION
-        A4Solution solution= TranslateAlloyToKodkod.execute_command(rep, model.getAllReachableSigs(), command, options);
+        Map<String, Object> record = new LinkedHashMap<>();
+        record.put("property", property);
+        record.put("command", command.toString());
+        Object[] winner = execute(command, solver == null ? options.solver : solver(solver));
+        A4Solution solution = (A4Solution) winner[0];
+        Stats stats = (Stats) winner[1];
+        record.put("solver", ((A4Options.SatSolver) winner[2]).id());
+        record.put("outcome", solution.satisfiable() ? "SAT" : "UNSAT");
+        // Parse time is paid once per module => reused modules report what it cost when loaded.
+        record.put("parse_ms", parseTime);
+        stats.record(record, (Long) winner[3]);
         if (solution.satisfiable()) {
-            solution.writeXML(dir + "/" + property + ".xml");
+            File xml = new File(dir, property + ".xml");
+            solution.writeXML(xml.getPath());
+            record.put("file", xml.getPath());
         }
+        manifest(dir, record);
+        return record;
+    }
+
+    /* {solution, statistics, solver, end time} */
+    private Object[] execute(Command command, A4Options.SatSolver solver) {
+        A4Options copy = options.dup();
+        copy.solver = solver;
+        Stats stats = new Stats();
+        A4Solution solution = TranslateAlloyToKodkod.execute_command(stats, model.getAllReachableSigs(), command, copy);
+        return new Object[] {solution, stats, solver, System.currentTimeMillis()};
     }
 
-    public static void main(String[] args) {
-        String alloy     = args[0];
-        String type      = args[1];
-        String property  = args[2];
+    /* MANIFEST => one JSON record per solved command, read back by svROS instead of listing the directory. */
+    private static synchronized void manifest(File dir, Map<String, Object> record) throws IOException {
+        try (FileWriter writer = new FileWriter(new File(dir, "manifest.jsonl"), true)) {
+            writer.write(toJson(record) + "\n");
+        }
+    }
+
+    /*
+     * BATCH MODE => model parsed once per worker thread, every property solved (in sequence or by a pool of threads),
+     * one JSON record per command printed to out as soon as it is known.
+     * Neither CompModule nor the Kodkod translation is thread-safe => the first worker takes this module, every other one parses its own.
+     */
+    public void generateBatch(File dir, List<String> properties, int threads, String solver, PrintStream out) throws InterruptedException {
+        ExecutorService pool = Executors.newFixedThreadPool(Math.max(1, threads));
+        AtomicBoolean claimed = new AtomicBoolean(false);
+        ThreadLocal<Generator> modules = ThreadLocal.withInitial(() -> claimed.compareAndSet(false, true) ? this : new Generator(alloy));
+        for (String property : properties) {
+            pool.submit(() -> {
+                Map<String, Object> record = new LinkedHashMap<>();
+                record.put("property", property);
+                try {
+                    record = modules.get().generateRun(dir, property, solver);
+                } catch (OutOfMemoryError error) {
+                    record.put("outcome", "UNKNOWN");
+                    record.put("message", "memory");
+                } catch (Throwable error) {
+                    record.put("outcome", "ERROR");
+                    record.put("message", String.valueOf(error.getMessage()));
+                }
+                synchronized (out) {
+                    out.println(toJson(record));
+                    out.flush();
+                }
+            });
+        }
+        pool.shutdown();
+        pool.awaitTermination(Long.MAX_VALUE, TimeUnit.MILLISECONDS);
+    }
+
+    /*
+     * DAEMON MODE => one request per line on stdin, one JSON answer per line on stdout.
+     *   request : action=solve<TAB>file=...<TAB>output=...<TAB>property=...[<TAB>solver=...]
+     *             action=quit
+     */
+    public static void daemon() throws Exception {
+        PrintStream protocol = System.out;
+        // Anything Alloy (or generateRun) prints must not corrupt the protocol stream.
+        System.setOut(System.err);
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in));
+        protocol.println("{\"status\": \"READY\"}");
+        protocol.flush();
+        String line;
+        while ((line = in.readLine()) != null) {
+            if (line.trim().isEmpty()) continue;
+            Map<String, String> request = parseRequest(line);
+            String action = request.getOrDefault("action", "");
+            if (action.equals("quit")) break;
+            Map<String, Object> answer = new LinkedHashMap<>();
+            answer.put("property", request.getOrDefault("property", ""));
+            try {
+                if (!action.equals("solve")) {
+                    throw new IllegalArgumentException("Unknown action " + action);
+                }
+                Generator g = Generator.load(request.get("file"));
+                answer = g.generateRun(new File(request.get("output")), request.get("property"), request.get("solver"));
+            } catch (OutOfMemoryError error) {
+                // Heap cap (-Xmx) reached => verdict unknown, svROS restarts this process.
+                answer.put("outcome", "UNKNOWN");
+                answer.put("message", "memory");
+            } catch (Throwable error) {
+                answer.put("outcome", "ERROR");
+                answer.put("message", String.valueOf(error.getMessage()));
+            }
+            protocol.println(toJson(answer));
+            protocol.flush();
+        }
+    }
+
+    private static Map<String, String> parseRequest(String line) {
+        Map<String, String> request = new HashMap<>();
+        for (String field : line.split("\t")) {
+            int eq = field.indexOf('=');
+            if (eq > 0) request.put(field.substring(0, eq), field.substring(eq + 1));
+        }
+        return request;
+    }
+
+    private static String toJson(Map<String, ?> values) {
+        List<String> fields = new ArrayList<>();
+        for (Map.Entry<String, ?> entry : values.entrySet()) {
+            Object value = entry.getValue();
+            fields.add(quote(entry.getKey()) + ": " + (value instanceof Number ? value.toString() : quote(String.valueOf(value))));
+        }
+        return "{" + String.join(", ", fields) + "}";
+    }
+
+    private static String quote(String value) {
+        StringBuilder sb = new StringBuilder("\"");
+        for (char c : value.toCharArray()) {
+            switch (c) {
+                case '"':  sb.append("\\\""); break;
+                case '\\': sb.append("\\\\"); break;
+                case '\n': sb.append("\\n"); break;
+                case '\r': sb.append("\\r"); break;
+                case '\t': sb.append("\\t"); break;
+                default:
+                    if (c < 0x20) sb.append(String.format("\\u%04x", (int) c));
+                    else sb.append(c);
+            }
+        }
+        return sb.append('"').toString();
+    }
+
+    /* No output given => a fresh directory per run (as svSolverPool.run_directory), standalone runs never share counterexamples. */
+    private static String runDirectory(String type) throws IOException {
+        GENERATED_MODELS.mkdirs();
+        String output = Files.createTempDirectory(GENERATED_MODELS.toPath(), type + "-").toString();
+        System.err.println("Output: " + output);
+        return output;
+    }
+
+    public static void main(String[] args) throws Exception {
+        if (args.length == 1 && args[0].equals("--daemon")) {
+            daemon();
+            return;
+        }
+        /* <file> <type> (<property>[,<property>...] | --all) [output] [--threads N] [--solver NAME] */
+        List<String> positional = new ArrayList<>();
+        int threads = 1;
+        String solver = null;
+        for (int i = 0; i < args.length; i++) {
+            if (args[i].equals("--threads") && i + 1 < args.length) threads = Integer.parseInt(args[++i]);
+            else if (args[i].equals("--solver") && i + 1 < args.length) solver = args[++i];
+            else positional.add(args[i]);
+        }
+        String alloy     = positional.get(0);
+        String type      = positional.get(1);
+        String selection = positional.get(2);
+        String output    = positional.size() > 3 ? positional.get(3) : runDirectory(type);
+        PrintStream records = System.out;
+        System.setOut(System.err);
         Generator g = new Generator(alloy);
-        g.generateRun(type, property);
+        List<String> properties = selection.equals("--all") ? new ArrayList<>(g.commands.keySet()) : Arrays.asList(selection.split(","));
+        g.generateBatch(new File(output), properties, threads, solver, records);
     }
 }
@@ -0,0 +1,12 @@
+import os
+
+global GRAMMARS, HELPERS, STARTS
+GRAMMARS = os.path.dirname(__file__)
+HELPERS  = os.path.join(GRAMMARS, 'helpers.lark')
+# Start symbols compiled into helpers.py, one per helper grammar.
+STARTS   = ['launch_arg', 'cmd_args', 'state', 'behaviour']
+
+"""
+    This package contains the small helper grammars of svROS (launch substitutions, inline node arguments, states and behaviours).
+    helpers.lark is the source; helpers.py is the LALR stand-alone parser generated from it when building (setup.py build_py or python -m svROS.grammars.generate), never committed.
+"""
@@ -0,0 +1,95 @@
+import argparse, time
+from lark import Lark
+from ..svParser import svParser
+
+"""
+    Benchmark of the helper grammars: the former Earley grammars (ambiguity='explicit') against the stand-alone LALR parser.
+        $ python -m svROS.grammars.benchmark --nodes 5000
+    Inputs are the ones a launch file and a config file with that many nodes produce.
+"""
+"Former Earley grammars, kept for comparison only."
+EARLEY = {
+    'launch_arg': """
+        sentence: /\$/ LP ARG NAME RP
+        LP: "("
+        RP: ")"
+        ARG: "var" | "env"
+        NAME: /[a-zA-Z0-9_\/\-.]+/
+        %import common.WS
+        %ignore WS
+    """,
+    'cmd_args': """
+        sentence: INIT complete?
+        complete: REMAP /\s/ arg_remap
+                | ENCLAVE /\s/ arg_enclave
+                | PARAMETER /\s/ arg_parameter
+        arg_remap: ARG_R ":=" ARG_R (/\s/ (arg_remap | complete))*
+        arg_enclave: ARG_E (/\s/ complete)*
+        arg_parameter: ARG_P ":=" ARG_P (/\s/ (arg_parameter | complete))*
+        INIT: "--ros-args"
+        REMAP:"--remap" | "-r"
+        ENCLAVE: "--enclave" | "-e"
+        PARAMETER: "--parameter" | "-p"
+        ARG_R:/(?!\:\=)[a-zA-Z0-9_\/\-.]+/
+        ARG_E:/(?!\s)[a-zA-Z0-9_\/\-.]+/
+        ARG_P:/(?!\:\=)[a-zA-Z0-9_\/\-.]+/
+        %import common.WS
+        %ignore WS
+    """,
+    'state': """
+        sentence: one | two | three | four
+        one: NAME
+        two: INT NAME
+        three: PUB NAME
+        four: PUB INT NAME
+        INT:"int"
+        PUB:"public"
+        NAME:/(?!\s)[a-zA-Z0-9_\/\-.\:]+/
+        %import common.WS
+        %ignore WS
+    """,
+    'behaviour': """
+        sentence: one | two
+        one: "behaviour" "as" NAME
+        two: "behaviour"
+        NAME:/(?!\s)[a-zA-Z0-9_\/\-.\:]+/
+        %import common.WS
+        %ignore WS
+    """
+}
+
+# Per node => 2 substitutions, inline arguments, 3 states and a behaviour.
+def workload(nodes):
+    texts = {start: [] for start in EARLEY}
+    for n in range(nodes):
+        texts['launch_arg'] += [f'$(var namespace_{n})', f'$(env ROBOT_{n})']
+        texts['cmd_args']   += [f'--ros-args -r scan:=/robot_{n}/scan -r odom:=/robot_{n}/odom -e /enclave_{n} -p rate:=10 ']
+        texts['state']      += [f'speed_{n}', f'int counter_{n}', f'public int mode_{n}']
+        texts['behaviour']  += ['behaviour', f'behaviour as node_{n}']
+    return texts
+
+def run(parse, texts):
+    start = time.perf_counter()
+    for text in texts: parse(text)
+    return time.perf_counter() - start
+
+def benchmark(nodes):
+    texts, rows = workload(nodes=nodes), []
+    for start, grammar in EARLEY.items():
+        parser = Lark(grammar, start='sentence', parser='earley', ambiguity='explicit')
+        earley = run(parse=parser.parse, texts=texts[start])
+        lalr   = run(parse=lambda text: svParser.parse(start=start, text=text), texts=texts[start])
+        rows.append((start, len(texts[start]), earley, lalr))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='Earley vs stand-alone LALR helper grammars.')
+    parser.add_argument('-n', '--nodes', type=int, default=1000, help='Number of nodes in the launch and config files')
+    args = parser.parse_args()
+    svParser.helpers()  # Loading is not part of the measure.
+    print(f'{"grammar":<12} {"inputs":>8} {"earley (s)":>12} {"lalr (s)":>10} {"speedup":>9}')
+    for start, inputs, earley, lalr in benchmark(nodes=args.nodes):
+        print(f'{start:<12} {inputs:>8} {earley:>12.3f} {lalr:>10.3f} {earley / max(lalr, 1e-9):>8.1f}x')
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+import os, sys, subprocess, hashlib
+from . import GRAMMARS, HELPERS, STARTS
+
+"""
+    Regenerates helpers.py (stand-alone LALR parser) from helpers.lark.
+        $ python -m svROS.grammars.generate
+    The digest of the grammar is kept in the generated module, a stale module is never loaded.
+"""
+def digest(path=HELPERS):
+    with open(path, 'rb') as f: return hashlib.sha256(f.read()).hexdigest()
+
+def generate(path=HELPERS, output=os.path.join(GRAMMARS, 'helpers.py')):
+    command = [sys.executable, '-m', 'lark.tools.standalone'] + [option for start in STARTS for option in ('-s', start)] + [path]
+    module  = subprocess.run(command, stdout=subprocess.PIPE, check=True, universal_newlines=True).stdout
+    with open(output, 'w+') as f:
+        f.write(module + f'\nGRAMMAR_DIGEST = "{digest(path=path)}"\n')
+    return output
+
+if __name__ == "__main__":
+    print(f'[svROS] Generated {generate()}.')
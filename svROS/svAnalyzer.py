@@ -10,11 +10,15 @@ from .svInfo import color, svException, svWarning, svInfo
 from lark import Lark, tree
 # Node parser
 from .svData import svNode, svProfile, svEnclave, svTopic, svState, Node, Package, MessageType, svExecution
-from .svLanguage import svPredicate
+from .svLanguage import svPredicate, svAlloyPredicate
+from contextlib import contextmanager
 import xml.etree.ElementTree as ET
 # Visualizer
 from .svVisualizer import svVisualizer
 from .svInitGrammar import GrammarParser
+# Alloy generator
+from .svSolver import svSolverPool, svCache, SOLVERS
+from .svParser import svParser
 
 global WORKDIR, SCHEMAS
 WORKDIR = os.path.dirname(__file__)
@@ -30,10 +34,25 @@ class svAnalyzer(object):
     EXTRACTOR     : object
     MODELS_DIR    : str
     MODE          : int = 0
+    JOBS          : int = 1
+    TIMEOUT       : float = None
+    MEMORY        : str = None
+    BATCH         : bool = False
+    SOLVER        : str = None
     
     def __post_init__(self):
         # GET FROM EXTRACTOR
         project, PROJECT_DIR = self.EXTRACTOR.project, self.EXTRACTOR.PROJECT_DIR
+        # Solver limits and backend => command line first, then configurations/model.
+        timeout, memory = self.EXTRACTOR.limits
+        self.TIMEOUT, self.MEMORY = self.TIMEOUT or timeout, self.MEMORY or memory
+        self.SOLVER     = (self.SOLVER or self.EXTRACTOR.solver or 'minisatprover').lower()
+        if self.SOLVER not in SOLVERS:
+            raise svException(f'Unknown SAT solver {self.SOLVER}: choose one of {", ".join(SOLVERS)}.')
+        if self.BATCH and self.SOLVER == 'portfolio':
+            raise svException('The portfolio solver races one generator process per backend: it cannot be combined with --batch.')
+        # Solver options => part of every cached verdict.
+        self.options = {'solver': self.SOLVER}
         if self.MODE == 0:
             scopes = self.EXTRACTOR.scopes
             self.meta_model, self.sros_model = self.load_configuration(MODELS_DIR=self.MODELS_DIR, PROJECT_DIR=PROJECT_DIR, name=project.lower())
@@ -65,20 +84,65 @@ class svAnalyzer(object):
     def alloy_ros(self):
         counter, file_path = list(), f'{self.EXTRACTOR.PROJECT_DIR}models/ros-concrete.als'
         if not os.path.isfile(path=file_path): return False
+        with open(file_path, 'r') as model: model = model.read()
         # CHECK PROPERTIES if it holds counter-examples
-        properties = re.findall(r'check\s+(.*?)\s+\{', open(file_path, 'r').read())
+        properties = re.findall(r'check\s+(.*?)\s+\{', model)
         properties = list(map(lambda check: check.strip(), properties))
-        # EXECUTE JAVA
-        counter    = svAnalyzer.execute_java(properties=properties, file=file_path, type="ros")
-        if counter == []:
+        # EXECUTE JAVA => escalating bounds, stopping each observation at its first counterexample (or limit).
+        levels, caches  = svAnalyzer.escalation_levels(properties=properties), {}
+        counter, bounds, unknown, stats = {}, {}, {}, {}
+        # PRE-ANALYSIS => observations always publishing the same literal hold without Alloy.
+        flows, flows_file = {}, f'{self.EXTRACTOR.PROJECT_DIR}data/flows.json'
+        if os.path.isfile(flows_file):
+            with open(flows_file, 'r') as data: flows = json.load(data)
+        # Only constant topics are pruned => a flows.json written by an older launch may still mark untainted ones as holding.
+        proven = {obs for obs in levels if flows.get(obs, {}).get('reason') == 'constant'}
+        pending, level  = [obs for obs in levels if obs not in proven], 0
+        # SLICES => an observation is solved against its own minimal model, when launching wrote one.
+        models = {obs: svAnalyzer.slice_file(directory=f'{self.EXTRACTOR.PROJECT_DIR}models/slices', observation=obs) or file_path for obs in levels}
+        with self.solver_pool() as pool:
+            while pending:
+                answers = {}
+                for model_file in sorted(set(models[obs] for obs in pending)):
+                    if model_file not in caches: caches[model_file] = self.cache(type="ros", file=model_file, name=None if model_file == file_path else f'ros-{os.path.basename(model_file)[:-4]}')
+                    answers.update(svAnalyzer.execute_java(properties=[levels[obs][level] for obs in pending if models[obs] == model_file], file=model_file, type="ros", pool=pool, cache=caches[model_file]))
+                stats.update(answers)
+                for obs in pending:
+                    answer, scope = answers.get(levels[obs][level], {}), svCache.scopes(model=model, prop=levels[obs][level])
+                    # UNKNOWN (timeout, memory) or ERROR => this observation stops escalating, the others go on.
+                    if answer.get('outcome') not in ('SAT', 'UNSAT'):
+                        unknown[obs] = (scope, answer.get('message', 'error'))
+                        continue
+                    if answer.get('outcome') == 'SAT': counter[obs] = answer['file']
+                    bounds[obs] = scope
+                level  += 1
+                pending = [obs for obs in pending if obs not in counter and obs not in unknown and level < len(levels[obs])]
+        for obs in levels:
+            topic = color.color("UNDERLINE", obs.split("topic_")[1].replace("_","/").upper())
+            if obs in counter: 
+                steps, inbox = bounds[obs]
+                taint = ', '.join(flows.get(obs, {}).get('tainted_by', []))
+                print(f'\t‣‣ OBSERVATION IN TOPIC {topic} IS NOT PUBLICLY DETERMINISTIC! (counterexample within {steps} steps, inbox {inbox}{f"; private state reaching it: {taint}" if taint else ""})')
+            elif obs in proven:
+                print(f'\t‣‣ OBSERVATION IN TOPIC {topic} holds for any bound (always publishes {", ".join(flows[obs]["values"])}), Alloy not needed.')
+            elif obs in unknown:
+                (steps, inbox), reason = unknown[obs]
+                held = f', holds up to {bounds[obs][0]} steps, inbox {bounds[obs][1]}' if obs in bounds else ''
+                print(f'\t‣‣ OBSERVATION IN TOPIC {topic} IS {color.color("YELLOW", f"UNKNOWN ({reason})")} at {steps} steps, inbox {inbox}{held}.')
+            else:
+                steps, inbox = bounds[obs]
+                print(f'\t‣‣ OBSERVATION IN TOPIC {topic} holds up to {steps} steps, inbox {inbox}.')
+        self.statistics(type="ros", answers=stats)
+        if unknown != {} and counter == {}:
+            print(svInfo(f'{color.color("YELLOW", color.color("BOLD", "VERIFICATION MODEL"))} No counterexample found, but some observations could not be decided within the given limits...'))
+            return True
+        if counter == {}:
             print(svInfo(f'{color.color("GREEN", color.color("BOLD", "VERIFICATION MODEL"))} Every observation seem to hold for the given configuration → It is advisable to run with increased configuration scopes...'))
             return True
         print(svInfo(f'{color.color("RED", color.color("BOLD", "VERIFICATION MODEL"))}: Not every observation seem to hold for the given configuration...'))
         map_dict = {}
-        for prop in properties:
-            if prop in list(map(lambda st: st.split('.xml')[0], counter)):
-                print(f'\t‣‣ OBSERVATION IN TOPIC {color.color("UNDERLINE", prop.split("topic_")[1].replace("_","/").upper())} IS NOT PUBLICLY DETERMINISTIC!')
-                map_dict[prop.split("topic_")[1].replace("_","/")] = f'{prop}.xml'
+        for obs in counter:
+            map_dict[obs.split("topic_")[1].replace("_","/")] = counter[obs]
         # RUN VISUALIZER
         while True:
             # open visualizer
@@ -87,7 +151,7 @@ class svAnalyzer(object):
             if options[choice] == 'Exit':
                 break
             else:
-                viz_directory, file = f'{self.EXTRACTOR.PROJECT_DIR}data/viz', f'/tmp/generated_models/ros/{map_dict[options[choice]]}'
+                viz_directory, file = f'{self.EXTRACTOR.PROJECT_DIR}data/viz', map_dict[options[choice]]
                 viz = svVisualizer(project=self.EXTRACTOR, directory=viz_directory)
                 viz.run_file(type='OD', file=file)
                 print(svInfo(f'Counterexample is being displayed on your browser'), end='')
@@ -95,9 +159,19 @@ class svAnalyzer(object):
         return True
 
     def generate_ros_model(self, NODES, TOPICS):
-        model, file_path = self.meta_model, f'{self.EXTRACTOR.PROJECT_DIR}models/ros-concrete.als'
+        file_path, assumptions = f'{self.EXTRACTOR.PROJECT_DIR}models/ros-concrete.als', self.EXTRACTOR.assumptions
         if not os.path.exists(path=file_path): open(file_path, 'w+').close()
         if not os.path.isfile(path=file_path): raise svException('Unexpected error happend while creating ROS file.')
+        model = self.ros_model(NODES=NODES, assumptions=assumptions)
+        with open(file_path, 'w+') as ros: ros.write(model)
+        # SLICES => one minimal model per observed topic, in models/slices.
+        slices_dir = f'{self.EXTRACTOR.PROJECT_DIR}models/slices'
+        shutil.rmtree(slices_dir, ignore_errors=True)
+        if self.EXTRACTOR.slicing: self.generate_ros_slices(directory=slices_dir, assumptions=assumptions)
+        return file_path
+
+    def ros_model(self, NODES, assumptions=None):
+        model = self.meta_model
         # NODES.
         model += '\n/* === NODES === */\n'
         model += ''.join(list(map(lambda node: str(NODES[node]), NODES)))
@@ -110,25 +184,171 @@ class svAnalyzer(object):
         model += '\n/* === NODE BEHAVIOUR === */\n'
         model += svPredicate.node_behaviour()
         model += '\n/* === NODE BEHAVIOUR === */\n\n/* === OBSERVATIONAL DETERMINISM === */\n'
-        model += svNode.observable_determinism(assumptions=self.EXTRACTOR.assumptions)
+        model += svNode.observable_determinism(assumptions=assumptions)
         model += '\n/* === OBSERVATIONAL DETERMINISM === */'
-        with open(file_path, 'w+') as ros: ros.write(model)
-        return file_path
+        return model
+
+    # SLICING => each observation is checked against the nodes, predicates, topics and states that can influence it.
+    def generate_ros_slices(self, directory, assumptions=None):
+        os.makedirs(directory, exist_ok=True)
+        observed = {re.match(r'check\s+(\S+?)(__s\d+)?\s+\{', check).group(1) for check in svNode.OBSERVATIONS}
+        for topic in svTopic.TOPICS.values():
+            if topic.signature not in observed: continue
+            topics, states, predicates, kept_assumptions = svAnalyzer.influence(topic=topic, assumptions=assumptions)
+            # Nothing can publish it => the whole model is kept.
+            if not predicates: continue
+            with svAnalyzer.narrowed(topic=topic, topics=topics, states=states, predicates=predicates):
+                model = self.ros_model(NODES=svNode.NODES, assumptions=kept_assumptions)
+            with open(f'{directory}/{topic.signature}.als', 'w+') as ros: ros.write(model)
+        return True
+
+    # Topics and states an Alloy formula mentions.
+    @staticmethod
+    def footprint(text):
+        topics = {topic for topic in svTopic.TOPICS.values() if re.search(rf'(?<!\w){re.escape(topic.signature)}(?!\w)', text)}
+        states = {state for state in svState.STATES.values() if re.search(rf'\.{re.escape(state.name.lower())}(?!\w)', text)}
+        return topics | states
+
+    # Cone of influence => everything that can (transitively) write what the observed topic depends on.
+    @staticmethod
+    def influence(topic, assumptions=None):
+        groups = []
+        for predicate in filter(lambda predicate: not predicate.is_sub_predicate, svPredicate.NODE_BEHAVIOURS.values()):
+            members, pending = set(), [predicate]
+            while pending:
+                member = pending.pop()
+                members.add(member)
+                pending += [sub for sub in member.sub_predicates if sub not in members]
+            text     = ''.join([svAlloyPredicate.parse_only_properties(node=member.node, properties=member.properties) for member in members if member.properties])
+            writes   = set([entity for member in members for entity in member.changable_channels + member.changable_variables])
+            groups.append((members, svAnalyzer.footprint(text=text) | writes, writes, None))
+        # Assumptions tie together every state they mention.
+        for assumption in (assumptions or []):
+            entities = svAnalyzer.footprint(text=assumption.__alloy__())
+            groups.append((set(), entities, entities, assumption))
+        kept, predicates, kept_assumptions, included = {topic}, set(), [], set()
+        changed = True
+        while changed:
+            changed = False
+            for index, (members, entities, writes, assumption) in enumerate(groups):
+                if index in included or not (writes & kept): continue
+                included.add(index)
+                kept, predicates, changed = kept | entities, predicates | members, True
+                if assumption is not None: kept_assumptions.append(assumption)
+        topics = set(filter(lambda entity: isinstance(entity, svTopic), kept))
+        states = set(filter(lambda entity: isinstance(entity, svState), kept))
+        return topics, states, predicates, kept_assumptions
+
+    # INFORMATION FLOW => which observed topics private state can reach, and which are provably deterministic.
+    @staticmethod
+    def information_flows():
+        observed = {re.match(r'check\s+(\S+?)(__s\d+)?\s+\{', check).group(1) for check in svNode.OBSERVATIONS}
+        # Taint => private (or assumed) states, propagated from what a predicate reads to what it writes.
+        tainted = {state: {state.name} for state in svState.STATES.values() if state.private or state in svState.ASSUMPTIONS}
+        groups  = []
+        for predicate in svPredicate.NODE_BEHAVIOURS.values():
+            text   = svAlloyPredicate.parse_only_properties(node=predicate.node, properties=predicate.properties) if predicate.properties else ''
+            writes = set(predicate.changable_channels + predicate.changable_variables)
+            groups.append((svAnalyzer.footprint(text=text) | writes, writes))
+        changed = True
+        while changed:
+            changed = False
+            for reads, writes in groups:
+                sources = set().union(*[tainted[entity] for entity in reads if entity in tainted])
+                if not sources: continue
+                for entity in writes:
+                    if not sources <= tainted.get(entity, set()):
+                        tainted[entity], changed = tainted.get(entity, set()) | sources, True
+        # Values => literals published on each topic (None => something that is not a literal).
+        values = defaultdict(set)
+        for predicate in svPredicate.NODE_BEHAVIOURS.values():
+            for topic, value in predicate.publications():
+                values[topic.signature].add(value)
+        flows = {}
+        for topic in filter(lambda topic: topic.signature in observed, svTopic.TOPICS.values()):
+            published, taint = values.get(topic.signature, set()), tainted.get(topic, set())
+            # Pruned checks => constant: the check compares messages published at the same instant (m0 = m1), and a single literal makes every one of them equal.
+            # Taint alone proves nothing => an untainted publication can still depend on inbox contents and ordering, which differ between traces.
+            # A topic never published proves nothing either => Alloy decides both.
+            reason = 'constant' if len(published) == 1 and None not in published else None
+            flows[topic.signature] = {'topic': topic.rosname, 'tainted_by': sorted(taint), 'values': sorted(published) if None not in published else None, 'holds': reason is not None, 'reason': reason}
+        return flows
+
+    # Class registries narrowed to a slice while its model is written, restored afterwards.
+    @staticmethod
+    @contextmanager
+    def narrowed(topic, topics, states, predicates):
+        saved = svTopic.TOPICS, svState.STATES, svPredicate.NODE_BEHAVIOURS, svNode.NODES, svNode.OBSERVATIONS, svNode.PUBSYNC
+        access = {node: (node.advertise, node.subscribe) for node in svNode.NODES.values()}
+        try:
+            svTopic.TOPICS              = {name: t for name, t in svTopic.TOPICS.items() if t in topics}
+            svState.STATES              = {name: state for name, state in svState.STATES.items() if state in states}
+            svPredicate.NODE_BEHAVIOURS = {name: predicate for name, predicate in svPredicate.NODE_BEHAVIOURS.items() if predicate in predicates}
+            for node in svNode.NODES.values():
+                node.advertise = [t for t in node.advertise if t in topics] if node.advertise is not None else None
+                node.subscribe = [t for t in node.subscribe if t in topics] if node.subscribe is not None else None
+            owners = set(map(lambda predicate: predicate.node, predicates))
+            svNode.NODES        = {name: node for name, node in svNode.NODES.items() if node in owners or node.advertise or node.subscribe}
+            svNode.OBSERVATIONS = set(filter(lambda check: re.match(rf'check\s+{re.escape(topic.signature)}(__s\d+)?\s+\{{', check), svNode.OBSERVATIONS))
+            # Synchronised publications => kept for every topic in the slice, each one constrains what reaches the observed topic.
+            svNode.PUBSYNC      = set(filter(lambda sync: any(f', {t.signature},' in sync for t in topics), svNode.PUBSYNC))
+            # Frame conditions => only over the states left.
+            svPredicate.parse_into_alloy()
+            yield
+        finally:
+            svTopic.TOPICS, svState.STATES, svPredicate.NODE_BEHAVIOURS, svNode.NODES, svNode.OBSERVATIONS, svNode.PUBSYNC = saved
+            for node, (advertise, subscribe) in access.items(): node.advertise, node.subscribe = advertise, subscribe
+            svPredicate.parse_into_alloy()
     
     # ALLOY => Runs Structure Checking in SROS_MODEL
     def security_verification(self):
         ENCLAVES, OBJECTS, PROFILES = svEnclave.ENCLAVES, svTopic.TOPICS, svProfile.PROFILES
         SROS_FILE = self.generate_sros_model(PROFILES=PROFILES, ENCLAVES=ENCLAVES, OBJECTS=OBJECTS)
         if not os.path.isfile(path=SROS_FILE): return False
-        else: return True
+        # Conflicting privileges => checked in-process, kept for analyzing (no Alloy needed).
+        nodes, edges = svAnalyzer.sros_conflicts(PROFILES=PROFILES)
+        os.makedirs(f'{self.EXTRACTOR.PROJECT_DIR}data', exist_ok=True)
+        with open(f'{self.EXTRACTOR.PROJECT_DIR}data/sros.json', 'w+') as data:
+            json.dump({'nodes': nodes, 'edges': edges}, data, sort_keys=False, indent=4)
+        conflicts = sum(edge['rule'] == 'Deny' for edge in edges)
+        if conflicts: print(svWarning(f'{conflicts} privileges are both ALLOWED and DENIED by the same profile.'))
+        return True
+
+    # (enclave + profile, role, object) => rules. A key holding both ALLOW and DENY is a conflict.
+    @staticmethod
+    def sros_conflicts(PROFILES):
+        rules = defaultdict(set)
+        for profile in PROFILES.values():
+            for privilege in profile.privileges:
+                # Index => same profile name in two enclaves is two profiles.
+                rules[(profile.index, privilege.role, privilege.topic.rosname)].add(privilege.rule)
+        # Same JSON as SecurityInstanceParser (edges keyed by relation) => the role is part of the relation, one pair of edges per conflict.
+        nodes, edges = dict(), dict()
+        for (profile, role, object), rule in rules.items():
+            if not {'Allow', 'Deny'} <= rule: continue
+            nodes[f'obj_{object}']   = {'id': f'obj_{object}', 'name': object,  'type': 'object'}
+            nodes[f'prof_{profile}'] = {'id': f'prof_{profile}', 'name': profile, 'type': 'profile'}
+            edges[f'{profile}_to_{object}_{role.lower()}_priv_all']  = {'relation': f'{profile}_to_{object}_{role.lower()}_priv_all', 'source': f'prof_{profile}', 'target': f'obj_{object}', 'role': role, 'rule': 'Allow'}
+            edges[f'{profile}_to_{object}_{role.lower()}_priv_deny'] = {'relation': f'{profile}_to_{object}_{role.lower()}_priv_deny', 'source': f'prof_{profile}', 'target': f'obj_{object}', 'role': role, 'rule': 'Deny'}
+        return list(nodes.values()), list(edges.values())
     
-    def alloy_sros(self):
-        counter, file_path = list(), f'{self.EXTRACTOR.PROJECT_DIR}models/sros-concrete.als'
+    def alloy_sros(self, alloy=False):
+        counter, file_path, data_path = list(), f'{self.EXTRACTOR.PROJECT_DIR}models/sros-concrete.als', f'{self.EXTRACTOR.PROJECT_DIR}data/sros.json'
+        # IN-PROCESS => conflicts found when launching, Alloy only when asked for (or never launched with it).
+        if not alloy and os.path.isfile(path=data_path):
+            with open(data_path, 'r') as data: data = json.load(data)
+            return self.sros_report(data=(data['nodes'], data['edges']) if data['edges'] else None)
         if not os.path.isfile(path=file_path): return False
         properties = ['valid_configuration']
         # EXECUTE JAVA
-        counter    = svAnalyzer.execute_java(properties=properties, file=file_path, type="sros")
-        if counter == []:
+        with self.solver_pool() as pool:
+            answers = svAnalyzer.execute_java(properties=properties, file=file_path, type="sros", pool=pool, cache=self.cache(type="sros", file=file_path))
+        counter    = {prop: answer['file'] for prop, answer in answers.items() if answer.get('outcome') == 'SAT'}
+        return self.sros_report(file=counter.get('valid_configuration'))
+
+    # Either an Alloy counterexample (file) or precomputed (nodes, edges) => same report and visualizer.
+    def sros_report(self, file=None, data=None):
+        if file is None and data is None:
             print(svInfo(f'{color.color("BOLD", "Alloy-SROS")} → Every property seem to hold for the given configuration:\n\t‣‣ No profile has different privileges of access (ALLOW, DENY) to the same object {color.color("GREEN", "✅")}'))
         else:
             print(svInfo(f'{color.color("BOLD", "Alloy-SROS")} → Failed to verify SROS configuration.'))
@@ -138,23 +358,78 @@ class svAnalyzer(object):
             if choice == 1:
                 return True
             else:
-                viz_directory, file = f'{self.EXTRACTOR.PROJECT_DIR}data/viz', f'/tmp/generated_models/sros/valid_configuration.xml'
+                viz_directory = f'{self.EXTRACTOR.PROJECT_DIR}data/viz'
                 viz = svVisualizer(project=self.EXTRACTOR, directory=viz_directory)
-                return viz.run_file(type='SROS', file=file)    
+                return viz.run_file(type='SROS', file=file, data=data)
         return True
 
+    # Observation => its check commands ordered by increasing steps (a single one unless escalating).
     @staticmethod
-    def execute_java(file, properties, type):
-        models_path = f'/tmp/generated_models/{type}' 
-        # clear directory
-        files = glob.glob(f'{models_path}/*')
-        for f in files:
-            os.remove(f)  
-        # execute 
+    def escalation_levels(properties):
+        levels = defaultdict(list)
         for prop in properties:
-            javacmd = "java -jar ~/.svROS/.bin/generator.jar " + file + " " + type + " " + prop
-            os.system(javacmd)
-        return os.listdir(models_path)
+            escalation = re.match(r'^(.*)__s(\d+)$', prop)
+            if escalation: levels[escalation.group(1)].append((int(escalation.group(2)), prop))
+            else: levels[prop].append((0, prop))
+        return {obs: [prop for _, prop in sorted(levels[obs])] for obs in levels}
+
+    # STATISTICS => kept in data/stats/{type}.json, largest CNFs printed first.
+    def statistics(self, type, answers):
+        directory = f'{self.EXTRACTOR.PROJECT_DIR}data/stats'
+        os.makedirs(directory, exist_ok=True)
+        with open(f'{directory}/{type}.json', 'w+') as data:
+            json.dump(list(answers.values()), data, sort_keys=False, indent=4)
+        columns = [('property', 'PROPERTY'), ('outcome', 'OUTCOME'), ('parse_ms', 'PARSE (ms)'), ('translation_ms', 'TRANSLATION (ms)'), ('sat_ms', 'SAT (ms)'), ('primary_vars', 'PRIMARY VARS'), ('vars', 'VARS'), ('clauses', 'CLAUSES'), ('solver', 'SOLVER')]
+        rows    = sorted(answers.values(), key=lambda answer: answer.get('clauses', 0), reverse=True)
+        rows    = [[str(answer.get(key, '-')) for key, _ in columns] for answer in rows]
+        widths  = [max([len(title)] + [len(row[index]) for row in rows]) for index, (_, title) in enumerate(columns)]
+        print(svInfo(f'{color.color("BOLD", "SOLVER STATISTICS")} (also in {directory}/{type}.json)'))
+        print('\t' + '  '.join(title.ljust(width) for (_, title), width in zip(columns, widths)))
+        for row in rows:
+            print('\t' + '  '.join(value.ljust(width) for value, width in zip(row, widths)))
+        return True
+
+    def solver_pool(self):
+        return svSolverPool(jobs=self.JOBS, timeout=self.TIMEOUT, memory=self.MEMORY, batch=self.BATCH, solver=self.SOLVER)
+
+    @staticmethod
+    def slice_file(directory, observation):
+        slice_file = f'{directory}/{observation}.als'
+        return slice_file if os.path.isfile(slice_file) else None
+
+    # One cache per model file => data/cache/{type} for the whole model, data/cache/{type}-{slice} for slices.
+    def cache(self, type, file, name=None):
+        with open(file, 'r') as model: model = model.read()
+        return svCache(directory=f'{self.EXTRACTOR.PROJECT_DIR}data/cache/{name or type}', model=model, options=self.options)
+
+    @staticmethod
+    def execute_java(file, properties, type, pool, cache=None):
+        # cached verdicts first => unchanged model and scopes need no solving.
+        answers = {}
+        if cache is not None:
+            answers = {prop: cache.get(prop) for prop in properties}
+            answers = {prop: answer for prop, answer in answers.items() if answer is not None}
+            if answers: print(svInfo(f'{len(answers)} of {len(properties)} properties answered from cache.'))
+        pending = [prop for prop in properties if prop not in answers]
+        if not pending: return answers
+        # execute => independent properties spread over warm generator processes, inside this run's own directory.
+        run_dir = svSolverPool.run_directory(type=type)
+        try:
+            solved  = pool.solve(file=file, properties=pending, output=run_dir)
+            records = svSolverPool.manifest(output=run_dir)
+            for prop in pending:
+                answer = records.get(prop, solved.get(prop, {}))
+                if answer.get('outcome') == 'ERROR':
+                    print(svWarning(f'Failed to check {prop}: {answer.get("message")}'))
+                elif cache is not None and cache.put(prop, answer):
+                    answer = cache.get(prop)
+                answers[prop] = answer
+        finally:
+            # Counterexamples are copied into the cache => the run directory is only kept while (uncached) answers still point into it.
+            if not any(str(answer.get('file') or '').startswith(run_dir + os.sep) for answer in answers.values()):
+                shutil.rmtree(run_dir, ignore_errors=True)
+        # Every verdict => property: {outcome, file (counterexample, if SAT), message (if UNKNOWN or ERROR)}.
+        return answers
         
     def generate_sros_model(self, PROFILES, ENCLAVES, OBJECTS):
         model, file_path = self.sros_model, f'{self.EXTRACTOR.PROJECT_DIR}models/sros-concrete.als'
@@ -192,6 +467,9 @@ class svProjectExtractor:
         data_json = {'packages': list(set(map(lambda package: package.name.lower(), Package.PACKAGES))), 'nodes': list(map(lambda node: svNode.to_json(node) , svNode.NODES)), 'connections': svNode.connections_to_json(), 'states': list(set(map(lambda state: state.name.lower(), svState.STATES.values()))), 'predicates': dict(map(lambda predicate: (predicate.signature.lower(), predicate.node.rosname), svPredicate.NODE_BEHAVIOURS.values()))}
         with open(f'{DATADIR}/configurations.json', 'w+') as data:
             json.dump(data_json, data, sort_keys=False, indent=4)
+        # Information-flow pre-analysis => read by analyze, which does not load the config file.
+        with open(f'{DATADIR}/flows.json', 'w+') as data:
+            json.dump(svAnalyzer.information_flows(), data, sort_keys=False, indent=4)
         enclaves_json = list(map(lambda enclave: enclave.to_json(), svEnclave.ENCLAVES.values()))
         json_object = json.dumps(enclaves_json, indent=4)
         with open(f'{DATADIR}/enclaves.json', 'w+') as data:
@@ -290,25 +568,16 @@ class svProjectExtractor:
         svPredicate.parse_into_alloy()
         #if type.lower() == "od" or type.lower() == "observable determinism":
         # Observable determinism in Unsecured Nodes.
-        if not svNode.observalDeterminism(steps=steps, inbox=inbox): 
+        if not svNode.observalDeterminism(steps=steps, inbox=inbox, escalation=self.escalation): 
             return False
         return True
 
     def node_behaviour(self, node, behaviour, properties): 
-        # LOAD PROPERTIES ==> PARSING...
-        grammar = """
-        sentence: one | two
-        one: "behaviour" "as" NAME
-        two: "behaviour"
-        NAME:/(?!\s)[a-zA-Z0-9_\/\-.\:]+/
-        %import common.WS
-        %ignore WS
-        """
-        parser, key = Lark(grammar, start='sentence', ambiguity='explicit'), behaviour
-        if not parser.parse(behaviour): raise svException(f'Failed to parse node behaviour {node.rosname}.')
-        t      = parser.parse(behaviour)
-        if t.children[0].data == "one":
-            signature = behaviour.split('as')[1].strip()
+        # LOAD PROPERTIES ==> PARSING... => grammars/helpers.lark (behaviour).
+        t = svParser.parse(start='behaviour', text=behaviour)
+        if t is None: raise svException(f'Failed to parse node behaviour {node.rosname}.')
+        if t.children:
+            signature = str(t.children[0])
         else:
             signature = node.rosname[1:]
         # ...
@@ -329,6 +598,34 @@ class svProjectExtractor:
             raise svException('Failed to retrieve scopes on steps: Define type in configurations/model area.')
         return steps, inbox
 
+    @property
+    def escalation(self):
+        return bool(self.config.get('configurations').get('model', {}).get('escalation', False))
+
+    # Slicing => one minimal model per observed topic (on by default).
+    @property
+    def slicing(self):
+        return bool(self.model_config.get('slicing', True))
+
+    # configurations/model => also read when analyzing, where the config file was not extracted.
+    @property
+    def model_config(self):
+        config = getattr(self, 'config', None)
+        if config is None:
+            config_file = f'{self.PROJECT_DIR}config.yml'
+            config      = safe_load(stream=open(config_file, 'r')) if os.path.isfile(config_file) else {}
+        return (config or {}).get('configurations', {}).get('model', {}) or {}
+
+    # Solver limits => (timeout in seconds, JVM heap) per property, None if not set.
+    @property
+    def limits(self):
+        return self.model_config.get('timeout'), self.model_config.get('memory')
+
+    # SAT solver => sat4j, minisat, minisatprover (default), glucose or portfolio.
+    @property
+    def solver(self):
+        return self.model_config.get('solver')
+
     @property
     def assumptions(self):
         behaviour   = self.config.get('configurations').get('model', {}).get('behaviour', {})
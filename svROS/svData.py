@@ -8,6 +8,7 @@ from .svInfo import color, svException, svWarning
 # Parsers
 import xml.etree.ElementTree as ET
 from lark import Lark, tree
+from .svParser import svParser
 
 global WORKDIR
 WORKDIR = os.path.dirname(__file__)
@@ -343,8 +344,18 @@ class svNode(object):
     def abstract(self, tag): return tag.capitalize().replace('/', '_')
 
     # This method will allow to check what the output might be when an unsecured enclave publishes something from one of its topics
+    # Escalating scopes => (steps, inbox) doubling up to the configured maximum.
+    @staticmethod
+    def bounds(steps, inbox, escalation=False):
+        if not escalation: return [(steps, inbox)]
+        bounds, bound = [], 2
+        while bound < steps:
+            bounds.append((bound, min(bound, inbox)))
+            bound *= 2
+        return bounds + [(steps, inbox)]
+
     @classmethod
-    def observalDeterminism(cls, steps, inbox):
+    def observalDeterminism(cls, steps, inbox, escalation=False):
         if list(map(lambda node: node.connection, cls.NODES.values())) == []:
             raise svException(f'Failed to check Observable Determinism: No connections set between public and private parts.')
         if cls.OBSERVATIONS is set():
@@ -355,7 +366,9 @@ class svNode(object):
             if not isinstance(topic, svTopic):
                 raise svException(f'{topic.signature} is not a topic!')
             svNode.PUBSYNC.add(f"""\n\talways ((some m0 : Message | publish[T1, {topic.signature}, m0]) iff (some m1 : Message | publish[T2, {topic.signature}, m1]))""")
-            observations.add(f'check {topic.signature} {{always (all m0, m1 : Message | publish[T1, {topic.signature}, m0] and publish[T2, {topic.signature}, m1] implies m0 = m1)}} for 4 but {inbox} seq, 1..{steps} steps')
+            for bound_steps, bound_inbox in svNode.bounds(steps=steps, inbox=inbox, escalation=escalation):
+                name = f'{topic.signature}__s{bound_steps}' if escalation else topic.signature
+                observations.add(f'check {name} {{always (all m0, m1 : Message | publish[T1, {topic.signature}, m0] and publish[T2, {topic.signature}, m1] implies m0 = m1)}} for 4 but {bound_inbox} seq, 1..{bound_steps} steps')
         cls.OBSERVATIONS = observations
         return True
 
@@ -499,27 +512,12 @@ class svState(object):
 
     @classmethod
     def init_state(cls, name):
-        # Grammar to parse states.
-        grammar = """
-            sentence: one | two | three | four
-            one: NAME
-            two: INT NAME
-            three: PUB NAME
-            four: PUB INT NAME
-            INT:"int"
-            PUB:"public"
-            NAME:/(?!\s)[a-zA-Z0-9_\/\-.\:]+/
-            %import common.WS
-            %ignore WS
-        """
-        parser = Lark(grammar, start='sentence', ambiguity='explicit')
-        if not parser.parse(str(name)): raise svException(f'Failed to parse state {str(name)}.')
-        t      = parser.parse(name)
-        if t.children[0].data == "one":   isint, private = False, True
-        if t.children[0].data == "two":   isint, private = True, True
-        if t.children[0].data == "three": isint, private = False, False
-        if t.children[0].data == "four":  isint, private = True, False
-        name = str(t.children[0].children[::-1][0])
+        # Grammar to parse states => grammars/helpers.lark (state).
+        t = svParser.parse(start='state', text=name)
+        if t is None: raise svException(f'Failed to parse state {str(name)}.')
+        tokens = {token.type for token in t.children}
+        isint, private = 'INT' in tokens, 'PUB' not in tokens
+        name = str(t.children[-1])
         return cls(name=name, isint=isint, private=private)
 
 """ 
@@ -1,10 +1,13 @@
-import os, argparse, time, shutil, glob, warnings, logging, re, sys, subprocess, xmlschema, json, pickle
+import os, argparse, time, shutil, glob, warnings, logging, re, sys, subprocess, xmlschema, json, pickle, hashlib, tempfile, ast
+from concurrent.futures import ProcessPoolExecutor
 from yaml import *
 from dataclasses import dataclass, field
 from logging import FileHandler
 from typing import ClassVar
 # InfoHandler => Prints, Exceptions and Warnings
 from .svInfo import color, svException, svWarning
+from .svParser import svParser
+from .svStore import svStore, CACHE
 # Needed for cpp nodes...
 from haros.cmake_parser import RosCMakeParser
 from haros.extractor    import RoscppExtractor, RospyExtractor
@@ -21,14 +24,16 @@ from distutils.spawn import find_executable
 import xml.etree.ElementTree as ET
 from lark import Lark, tree
 # Launcher
-from .svLauncherXML import LauncherParserXML, NodeTag
-from .svLauncherPY import LauncherParserPY, NodeCall
+from .svLauncherXML import LauncherParserXML, NodeTag, ArgsTag, RemapTag
+from .svLauncherPY import LauncherParserPY, NodeCall, ArgsCall, RemapCall
+from .svInclude import svInclude
 # Data
 from .svData import Node, Topic, Package
 
 global WORKDIR, SCHEMAS
 WORKDIR = os.path.dirname(__file__)
 SCHEMAS = os.path.join(WORKDIR, 'schemas')
+INDEX   = os.path.join(CACHE, "packages.json")
 
 "YAML default dumper"
 # Worth-Mention https://stackoverflow.com/a/39681672
@@ -36,54 +41,132 @@ class DefaultDumper(Dumper):
     def increase_indent(self, flow=False, indentless=False):
         return super(DefaultDumper, self).increase_indent(flow, False)
 
-"Exporter CPP. => Using Regular Expressions only..."
+"Exporter CPP. => Single pass over the C++ source: comments, strings and preprocessor lines are told apart, calls are tokenized where they stand."
 @dataclass
 class ExporterCPP:
     content: str
+    PUBLISHERS : ClassVar[set] = {'create_publisher', 'advertise'}
+    SUBSCRIBERS: ClassVar[set] = {'create_subscription', 'subscribe'}
+    # Whole file => every alternative starts with a fixed character, the regex engine skips everything else.
+    SCAN       : ClassVar[re.Pattern] = re.compile(r"""
+          (?P<comment>//[^\n]*|/\*.*?\*/)
+        | (?P<preprocessor>\#(?:[^\n\\]|\\.)*)
+        | (?P<string>"(?:[^"\\\n]|\\.)*")
+        | (?P<char>'(?:[^'\\\n]|\\.)*')
+        | (?P<call>create_publisher|advertise|create_subscription|subscribe)\b
+    """, re.S | re.X)
+    CALLS      : ClassVar[re.Pattern] = re.compile(r'(?=[acs])\b(create_publisher|advertise|create_subscription|subscribe)\b')
+    RAW        : ClassVar[re.Pattern] = re.compile(r'"(?P<delimiter>[^(\s"]*)\(.*?\)(?P=delimiter)"', re.S)
+    DEFINE     : ClassVar[re.Pattern] = re.compile(r'\#[ \t]*define[ \t]+(\w+)[ \t]+"((?:[^"\\\n]|\\.)*)"\s*(?://.*|/\*.*)?$', re.S)
+    ASSIGNMENT : ClassVar[re.Pattern] = re.compile(r'\b([A-Za-z_]\w*)\s*[={(]$')
+    # Around a call or a constant => every token.
+    TOKENS     : ClassVar[re.Pattern] = re.compile(r"""
+          (?P<comment>//[^\n]*|/\*.*?\*/)
+        | (?P<raw>(?:u8|u|U|L)?R"(?P<delimiter>[^(\s"]*)\((?P<text>.*?)\)(?P=delimiter)")
+        | (?P<string>(?:u8|u|U|L)?"(?P<contents>(?:[^"\\\n]|\\.)*)")
+        | (?P<char>'(?:[^'\\\n]|\\.)*')
+        | (?P<name>[A-Za-z_]\w*(?:\s*::\s*[A-Za-z_]\w*)*)
+        | (?P<literal>\.?\d[\w.']*)
+        | (?P<space>\s+)
+        | (?P<symbol>::|->|.)
+    """, re.S | re.X)
+    """
+        ExporterCPP
+            \_ constants => NAME = "..." | NAME{"..."} | NAME("...") | #define NAME "..."
+            \_ calls     => create_publisher | advertise | create_subscription | subscribe <TYPE>(TOPIC, ...)
+            \_ tokens    => (kind, value): name (std::msg::T), string (contents), literal or symbol
+    """
+    def extract(self):
+        constants, calls = {}, []
+        # Most files (generated code in particular) never mention a call => nothing to scan.
+        if ExporterCPP.CALLS.search(self.content) is None: return [], []
+        match = ExporterCPP.SCAN.search(self.content)
+        while match is not None:
+            kind, end = match.lastgroup, match.end()
+            # R"delimiter( ... )delimiter" => may hold quotes, the scan goes on after it.
+            if kind == 'string' and self.content[match.start()-1:match.start()] == 'R':
+                raw = ExporterCPP.RAW.match(self.content, match.start())
+                if raw is not None: end = raw.end()
+            # Part of a longer name (e.g. my_subscribe) => not a call.
+            if kind == 'call' and match.start() and (self.content[match.start()-1].isalnum() or self.content[match.start()-1] == '_'):
+                kind = None
+            if kind == 'preprocessor':
+                define = ExporterCPP.DEFINE.match(match.group(0))
+                if define: ExporterCPP.constant(constants=constants, name=define.group(1), value=define.group(2))
+            elif kind == 'string':
+                assigned = self.assigned(position=match.start())
+                if assigned is not None: ExporterCPP.constant(constants, *assigned)
+            elif kind == 'call':
+                found = self.call(position=match.end())
+                if found is not None: calls.append((match.group('call') in ExporterCPP.PUBLISHERS,) + found)
+            match = ExporterCPP.SCAN.search(self.content, end)
+        # Topic names held in constants are resolved once every constant of the file is known.
+        pubs, subs = [], []
+        for publisher, topic_type, (kind, name) in calls:
+            if kind == 'name': name = constants.get(name)
+            if not name: continue
+            (pubs if publisher else subs).append(Topic(name=name, topic_type=topic_type))
+        return pubs, subs
+
+    def tokens(self, position):
+        for match in ExporterCPP.TOKENS.finditer(self.content, position):
+            kind = match.lastgroup
+            if kind in ('comment', 'space'): continue
+            if kind == 'raw':              yield 'string', match.group('text')
+            elif kind == 'string':         yield 'string', match.group('contents')
+            elif kind == 'name':           yield 'name', re.sub(r'\s+', '', match.group('name'))
+            elif kind == 'symbol':         yield 'symbol', match.group('symbol')
+            else:                          yield 'literal', match.group(0)
 
+    # NAME = "..." | NAME{"..."} | NAME("...") => (NAME, literal), looked up right before the first literal (string prefixes aside).
+    def assigned(self, position):
+        start  = max(0, position-64)
+        before = self.content[start:position].rstrip('u8ULR').rstrip()
+        if not before.endswith(('=', '{', '(')): return None
+        assignment = ExporterCPP.ASSIGNMENT.search(before)
+        if assignment is None: return None
+        tokens, literal = self.tokens(position=start+assignment.end()-1), None
+        next(tokens, None)
+        token = next(tokens, None)
+        # Adjacent literals ("a" "b") are a single string.
+        while token is not None and token[0] == 'string':
+            literal, token = (literal or '') + token[1], next(tokens, None)
+        if literal is None or token not in (('symbol', ';'), ('symbol', '}'), ('symbol', ')'), ('symbol', ',')): return None
+        return assignment.group(1), literal
+
+    # Same name with two different values => not a constant.
     @staticmethod
-    def call_grammar(topic_call: str):
-        # Grammar to parse arguments.
-        grammar = """
-            sentence: CALL "<" TOPIC_TYPE ">" "(" LIXO? ASP TOPIC_NAME ASP
-
-            CALL:"create_publisher" | "advertise" | "create_subscription" | "subscribe"
-            TOPIC_TYPE:/(?!\>)[a-zA-Z0-9_\/\-.\:]+/
-            TOPIC_NAME:/(?!\,)[a-zA-Z0-9_\/\-.\:]+/
-            LIXO:/(?!\")[^\"]+/
-            ASP:/\"/
-
-            %import common.WS
-            %ignore WS
-        """
-        parser = Lark(grammar, start='sentence', ambiguity='explicit')
-        if not parser.parse(topic_call):
-            return False
-        return True
+    def constant(constants, name, value):
+        constants[name] = value if constants.get(name, value) == value else None
 
-    def extract_publishers(self):
-        publishers  = re.findall(r'((create_publisher|advertise)\<([^\>]*?)\>\s*\([^\"]*?\"([^\"]*?)\")', self.content)
-        pubs        = []
-        for pub in publishers:
-            call, name, topic_type = pub[0], pub[3], pub[2]
-            if not ExporterCPP.call_grammar(topic_call=call):
-                continue
-            topic_type = topic_type.replace('::', '/')
-            topic      = Topic(name=name, topic_type=topic_type)
-            pubs.append(topic)
-        return pubs
-    
-    def extract_subscribers(self):
-        subscribers = re.findall(r'((create_subscription|subscribe)\<([^\>]*?)\>\s*\(\s*\"([^\"]*?)\")', self.content)
-        subs        = []
-        for sub in subscribers:
-            call, name, topic_type = sub[0], sub[3], sub[2]
-            if not ExporterCPP.call_grammar(topic_call=call):
-                continue
-            topic_type = topic_type.replace('::', '/')
-            topic      = Topic(name=name, topic_type=topic_type)
-            subs.append(topic)
-        return subs
+    # <TYPE>(TOPIC, ...) => (type, ('string', topic) | ('name', constant)), None if the call has another shape.
+    def call(self, position):
+        tokens = self.tokens(position=position)
+        if next(tokens, None) != ('symbol', '<'): return None
+        depth, topic_type = 1, ''
+        for kind, value in tokens:
+            if kind not in ('name', 'symbol', 'literal'): return None
+            if kind == 'symbol': depth += {'<': 1, '>': -1}.get(value, 0)
+            if not depth: break
+            topic_type += value
+        if depth or next(tokens, None) != ('symbol', '(') or not topic_type: return None
+        # First argument => topic, everything up to the first comma or closing parenthesis at the same depth.
+        argument, depth = [], 0
+        for kind, value in tokens:
+            if kind == 'symbol' and value in ('(', '{', '['): depth += 1
+            if kind == 'symbol' and value in (')', '}', ']'):
+                if depth == 0: break
+                depth -= 1
+            if kind == 'symbol' and value == ',' and depth == 0: break
+            argument.append((kind, value))
+        topic_type = topic_type.replace('::', '/').strip('/')
+        # this->topic_ | node.topic => topic
+        while len(argument) > 2 and argument[0][0] == 'name' and argument[1] in (('symbol', '->'), ('symbol', '.')): argument = argument[2:]
+        if argument and all(kind == 'string' for kind, _ in argument):
+            return topic_type, ('string', ''.join([value for _, value in argument]))
+        if len(argument) == 1 and argument[0][0] == 'name':
+            return topic_type, ('name', argument[0][1].split('::')[-1])
+        return None
 
 @dataclass
 class ExporterPY:
@@ -165,6 +248,257 @@ class ExporterPY:
             except IndexError:
                 return None
 
+"Exporter PY => single pass over Python's own ast, bonsai (ExporterPY) is only used for what this cannot resolve."
+@dataclass
+class ExporterAST(ast.NodeVisitor):
+    content: str
+    # Call => (message type keyword, position), (topic name keyword, position)
+    PUBLISHERS : ClassVar[dict] = {'create_publisher': (('msg_type', 0), ('topic', 1)), 'Publisher': (('data_class', 1), ('name', 0))}
+    SUBSCRIBERS: ClassVar[dict] = {'create_subscription': (('msg_type', 0), ('topic', 1)), 'Subscriber': (('data_class', 1), ('name', 0))}
+    """
+        ExporterAST
+            \_ imports  => from M import A (as B) => B: M.A (M/A), import M (as N) => N: M (dotted) => same forms as ExporterPY
+            \_ extract  => (publishes, subscribes) in source order, None if any call needs bonsai
+    """
+    def __post_init__(self):
+        self.names, self.pubs, self.subs, self.resolved = {}, [], [], True
+
+    def extract(self):
+        try:
+            tree = ast.parse(self.content)
+        except (SyntaxError, ValueError):
+            return None
+        self.visit(tree)
+        if not self.resolved: return None
+        return [Topic(name=name, topic_type=topic_type) for name, topic_type in self.pubs], [Topic(name=name, topic_type=topic_type) for name, topic_type in self.subs]
+
+    # Name => (module path, separator of the message type it yields).
+    def visit_Import(self, node):
+        for alias in node.names:
+            if alias.asname: self.names[alias.asname] = (alias.name, '.')
+            else: self.names[alias.name.split('.')[0]] = (alias.name.split('.')[0], '.')
+
+    def visit_ImportFrom(self, node):
+        for alias in node.names:
+            # Relative and star imports => left to bonsai, only if a call needs them.
+            if node.level == 0 and node.module and alias.name != '*':
+                self.names[alias.asname or alias.name] = (f'{node.module}.{alias.name}', '/')
+
+    def visit_Call(self, node):
+        call = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, 'id', None)
+        for calls, topics in ((ExporterAST.PUBLISHERS, self.pubs), (ExporterAST.SUBSCRIBERS, self.subs)):
+            if call in calls:
+                topic = self.topic(node=node, ros2=call.startswith('create_'), spec=calls[call])
+                if topic is not None: topics.append(topic)
+        self.generic_visit(node)
+
+    def topic(self, node, ros2, spec):
+        (type_keyword, type_position), (name_keyword, name_position) = spec
+        name, topic_type = ExporterAST.argument(node, name_keyword, name_position), ExporterAST.argument(node, type_keyword, type_position)
+        # Topic held in a variable => skipped by ROS2 calls (same as bonsai), resolved by bonsai for ROS1 ones.
+        if ros2 and isinstance(name, (ast.Name, ast.Attribute)): return None
+        if not (isinstance(name, ast.Constant) and isinstance(name.value, str)):
+            self.resolved = False
+            return None
+        topic_type = self.message_type(node=topic_type)
+        if topic_type is None:
+            self.resolved = False
+            return None
+        return name.value, topic_type
+
+    @staticmethod
+    def argument(node, keyword, position):
+        for argument in node.keywords:
+            if argument.arg == keyword: return argument.value
+        return node.args[position] if len(node.args) > position else None
+
+    # Through the import table => String (from std_msgs.msg import String) as std_msgs/msg/String, std_msgs.msg.String (import std_msgs.msg) as written.
+    def message_type(self, node):
+        dotted = []
+        while isinstance(node, ast.Attribute):
+            dotted.insert(0, node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name) or node.id not in self.names: return None
+        module, separator = self.names[node.id]
+        return separator.join(module.split('.') + dotted)
+
+"Source-file extraction over a process pool => workers hand back (name, type) pairs only, Topics are built in this process."
+class svExtractor(object):
+    EXTRACTED = {}
+    # Bumped whenever an extractor changes what it returns => older cache entries are never read again.
+    VERSION   = 4
+    """
+        svExtractor
+            \_ extract => publishes and subscribes of a single source file, as plain data (or the reason it failed)
+            \_ run     => every source file at once over jobs processes (1 => in-process), kept in EXTRACTED
+            \_ cache   => svStore (extract) keyed by sha256(content, language, VERSION), unchanged files are never parsed again
+    """
+    @staticmethod
+    def plain(value):
+        return value if value is None or isinstance(value, (str, int, float)) else str(value)
+
+    # Runs in a worker => never raises, exceptions of the extractors may not even be picklable.
+    @staticmethod
+    def extract(path, iscpp, workspace):
+        svrosExport.last_workspace = workspace
+        try:
+            pubs, subs = svrosExport.cpp_export(path) if iscpp else svrosExport.python_export(path)
+        except Exception as error:
+            return None, f'{type(error).__name__}: {error}'
+        pubs = [(svExtractor.plain(topic.name), svExtractor.plain(topic.type)) for topic in pubs]
+        subs = [(svExtractor.plain(topic.name), svExtractor.plain(topic.type)) for topic in subs]
+        return (pubs, subs), None
+
+    @staticmethod
+    def key(path, iscpp):
+        try:
+            with open(path, 'rb') as f: content = f.read()
+        except OSError:
+            return None
+        return hashlib.sha256(content + f'\0{"cpp" if iscpp else "py"}\0{svExtractor.VERSION}'.encode()).hexdigest()
+
+    @staticmethod
+    def cached(key):
+        data = svStore.get(kind='extract', key=key)
+        if data is None: return None
+        return [tuple(topic) for topic in data['publishes']], [tuple(topic) for topic in data['subscribes']]
+
+    @staticmethod
+    def store(key, extracted):
+        return svStore.put(kind='extract', key=key, data={'publishes': extracted[0], 'subscribes': extracted[1]})
+
+    @classmethod
+    def run(cls, sources, jobs=None, workspace=''):
+        keys, pending = {}, []
+        for source in sources:
+            keys[source] = svExtractor.key(*source)
+            extracted    = svExtractor.cached(keys[source])
+            if extracted is None: pending.append(source)
+            else: cls.EXTRACTED[source] = extracted
+        sources, jobs = pending, max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        if jobs == 1:
+            results = [svExtractor.extract(path, iscpp, workspace) for path, iscpp in sources]
+        else:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            try:
+                results = list(executor.map(svExtractor.extract, [path for path, _ in sources], [iscpp for _, iscpp in sources], [workspace]*len(sources)))
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                executor.shutdown(wait=True)
+        # Merged in the order sources were given, whichever worker finished first.
+        errors = []
+        for (path, iscpp), (extracted, error) in zip(sources, results):
+            if error is None:
+                cls.EXTRACTED[(path, iscpp)] = extracted
+                svExtractor.store(key=keys[(path, iscpp)], extracted=extracted)
+            else: errors.append((path, error))
+        for path, error in errors:
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "EXTRACTION ERROR"))} {color.color("UNDERLINE", path)} => {error}')
+        if errors:
+            raise svException(message=f'Failed to export/parse source files: {", ".join([path for path, _ in errors])}.')
+        return True
+
+"Executables of each package (CMakeLists.txt or setup.py) => memoised per content, packages parsed over a process pool."
+class svExecutables(object):
+    EXECUTABLES = {}
+    # Bumped whenever parse changes what it returns.
+    VERSION     = 1
+    INCLUDE     = re.compile(r'^\s*(include|add_subdirectory)\s*\(\s*"?([^\s")]+)', re.M | re.I)
+    """
+        svExecutables
+            \_ parse => ({executable: [source files]}, built with CMake) as plain data, or the reason it failed
+            \_ key   => sha256(package path, srcdir, bindir, CMakeLists.txt and included cmake files | setup.py, VERSION)
+            \_ run   => every package at once over jobs processes (1 => in-process), cached by svStore (packages), kept in EXECUTABLES
+    """
+    # Runs in a worker => never raises.
+    @staticmethod
+    def parse(cmake_path, srcdir, bindir, package_path):
+        try:
+            # CPP PACKAGES.
+            if os.path.isfile(cmake_path):
+                "Courtesy to André's work in HAROS."
+                parser = RosCMakeParser(srcdir, bindir)
+                parser.parse(cmake_path)
+                return ({target.name: [str(file) for file in target.files] for target in parser.executables.values()}, True), None
+            # PYTHON PACKAGES.
+            setup_path = f'{package_path}/setup.py'
+            if not os.path.isfile(setup_path):
+                raise svException(message=f'Neither CMakeLists.txt nor setup.py found in {package_path}.')
+            with open(setup_path) as setup:
+                executables = re.findall(r'\'\s*([^\n\s]*?)\s+\=\s+([^\n\s]*?:main)\'', setup.read())
+            target_dict = dict()
+            for target in executables:
+                path = f'{package_path}/{target[1].split(":")[0].replace(".", "/")}.py'
+                if not os.path.isfile(path):
+                    raise svException(message=f'Entry point {target[1]} of {setup_path} not found.')
+                target_dict[target[0]] = [path]
+            return (target_dict, False), None
+        except Exception as error:
+            return None, f'{type(error).__name__}: {getattr(error, "message", error)}'
+
+    # CMakeLists.txt with every include() and add_subdirectory() that resolves to a file of the package.
+    @staticmethod
+    def files(cmake_path):
+        root, files, pending = os.path.dirname(cmake_path), [], [cmake_path]
+        while pending:
+            path = pending.pop(0)
+            if path in files or not os.path.isfile(path): continue
+            files.append(path)
+            directory = os.path.dirname(path)
+            with open(path, 'r', errors='ignore') as f: content = f.read()
+            for command, argument in svExecutables.INCLUDE.findall(content):
+                for variable, value in (('CMAKE_CURRENT_SOURCE_DIR', directory), ('CMAKE_CURRENT_LIST_DIR', directory), ('PROJECT_SOURCE_DIR', root), ('CMAKE_SOURCE_DIR', root)):
+                    argument = argument.replace('${' + variable + '}', value)
+                target = os.path.join(directory, argument)
+                if command.lower() == 'add_subdirectory': pending.append(os.path.join(target, 'CMakeLists.txt'))
+                else: pending.extend([target, f'{target}.cmake', os.path.join(root, 'cmake', f'{argument}.cmake')])
+        return files
+
+    @staticmethod
+    def key(cmake_path, srcdir, bindir, package_path):
+        files = svExecutables.files(cmake_path) if os.path.isfile(cmake_path) else [f'{package_path}/setup.py']
+        digests = []
+        try:
+            for path in files:
+                with open(path, 'rb') as f: digests.append((os.path.relpath(path, package_path), hashlib.sha256(f.read()).hexdigest()))
+        except OSError:
+            return None
+        return hashlib.sha256(json.dumps([package_path, srcdir, bindir, svExecutables.VERSION, digests]).encode()).hexdigest()
+
+    @classmethod
+    def run(cls, packages, jobs=None):
+        keys, pending = {}, []
+        for package in packages:
+            keys[package] = svExecutables.key(*package)
+            cached        = svStore.get(kind='packages', key=keys[package])
+            if cached is None: pending.append(package)
+            else: cls.EXECUTABLES[package] = (cached['nodes'], cached['cpp'])
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        if jobs == 1:
+            results = [svExecutables.parse(*package) for package in pending]
+        else:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            try:
+                results = list(executor.map(svExecutables.parse, *zip(*pending)))
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                executor.shutdown(wait=True)
+        errors = []
+        for package, (executables, error) in zip(pending, results):
+            if error is None:
+                cls.EXECUTABLES[package] = executables
+                svStore.put(kind='packages', key=keys[package], data={'nodes': executables[0], 'cpp': executables[1]})
+            else: errors.append((package[3], error))
+        for path, error in errors:
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "PACKAGE ERROR"))} {color.color("UNDERLINE", path)} => {error}')
+        if errors:
+            raise svException(message=f'Failed to find the executables of packages: {", ".join([path for path, _ in errors])}.')
+        return True
+
 @dataclass
 class SourceFile:
     path : str
@@ -173,11 +507,12 @@ class SourceFile:
     subscribes  : list = field(default_factory=list)
 
     def __post_init__(self):
-        try:    
-            if self.iscpp: self.publishes, self.subscribes = svrosExport.cpp_export(self.path)
-            else: self.publishes, self.subscribes = svrosExport.python_export(self.path)
-        except Exception:
-            raise svException(message=f'Failed to export/parse source file {self.path}.')
+        # Already extracted by svExtractor.run, otherwise extracted right here.
+        if (self.path, self.iscpp) not in svExtractor.EXTRACTED:
+            svExtractor.run(sources=[(self.path, self.iscpp)], jobs=1, workspace=svrosExport.last_workspace)
+        pubs, subs = svExtractor.EXTRACTED[(self.path, self.iscpp)]
+        self.publishes  = [Topic(name=name, topic_type=topic_type) for name, topic_type in pubs]
+        self.subscribes = [Topic(name=name, topic_type=topic_type) for name, topic_type in subs]
 
 @dataclass
 class NodeSource:
@@ -205,6 +540,10 @@ class NodeSource:
 class LauncherParser:
     file      : str
     extension : str  = ''
+    strict    : bool = False
+    jobs      : int  = None
+    # ros2 launch structures are not used yet => launch is not even imported.
+    ROS2_STRUCTURES: ClassVar[bool] = False
 
     def __post_init__(self):
         if not (os.path.exists(self.file) and os.path.isfile(self.file)):
@@ -219,25 +558,38 @@ class LauncherParser:
     # Launch Parser
     def parse(self):
         ### LAUNCH STRUCTURES FROM ROS2 => Still deprecated!
-        from launch.launch_description_sources import get_launch_description_from_any_launch_file
-        using_ros2_structures = False
-        launch_description    = None
-        try:
-            launch_description = get_launch_description_from_any_launch_file(self.file)
-            using_ros2_structures = False # Once will be true.
-        except:
-            pass
-        if using_ros2_structures == True:
-           return self._default_parse(ros2_entities=launch_description.entities)
+        if LauncherParser.ROS2_STRUCTURES == True:
+            from launch.launch_description_sources import get_launch_description_from_any_launch_file
+            try:
+                launch_description = get_launch_description_from_any_launch_file(self.file)
+                return self._default_parse(ros2_entities=launch_description.entities)
+            except:
+                pass
         # PARSING EXTENSION
         if self.extension == '':
             return False
         if self.extension == 'xml':
-            if LauncherParserXML(file=self.file).parse():
-                return NodeTag.NODES, NodeTag.PACKAGES_NODES 
+            if LauncherParserXML(file=self.file, strict=self.strict, jobs=self.jobs).parse():
+                return LauncherParser.registries()
         if self.extension == 'py':
-            if LauncherParserPY(file=self.file).parse():
-                return NodeCall.NODES, NodeCall.PACKAGES_NODES 
+            if LauncherParserPY(file=self.file, strict=self.strict, jobs=self.jobs).parse():
+                return LauncherParser.registries()
+
+    # Included launch files might be of the other format => nodes of both parsers.
+    @staticmethod
+    def registries():
+        nodes, packages = {**NodeTag.NODES, **NodeCall.NODES}, {}
+        for registry in (NodeTag.PACKAGES_NODES, NodeCall.PACKAGES_NODES):
+            for package, package_nodes in registry.items(): packages.setdefault(package, set()).update(package_nodes)
+        return nodes, packages
+
+    # Registries of both parsers emptied => every launch file starts from scratch.
+    @staticmethod
+    def reset():
+        NodeTag.NODES, NodeTag.PACKAGES_NODES, NodeTag.LAUNCHED, ArgsTag.ARGS, ArgsTag.BINDINGS, RemapTag.REMAPS = {}, {}, [], {}, {}, set()
+        NodeCall.NODES, NodeCall.PACKAGES_NODES, NodeCall.LAUNCHED, ArgsCall.ARGS, ArgsCall.BINDINGS, RemapCall.REMAPS = {}, {}, [], {}, {}, set()
+        svInclude.STACK = []
+        return True
 
     "Predefined method to extract entities from ros2! This uses the default ros2 launch structure to parse each entitie."
     def _default_parse(self, ros2_entities):
@@ -254,6 +606,74 @@ class LauncherParser:
         return False
     """ === Predefined functions === """
 
+"Launch files over a process pool => workers hand back the nodes of each file as plain data, merged here in the order files are listed."
+class svLaunch(object):
+    PARSED = {}
+    """
+        svLaunch
+            \_ parse => nodes of a single launch file (and of the files it includes), as plain data (or the reason it failed)
+            \_ run   => every launch file at once over jobs processes (1 => in-process), kept in PARSED
+            \_ merge => nodes by package, in the order files are listed; the same node (Node.index) launched twice is an error, in one file or in two
+    """
+    @staticmethod
+    def parse(file, strict=False, jobs=1, packages=None):
+        try:
+            LauncherParser.reset()
+            svInclude.PACKAGES = packages or {}
+            if not LauncherParser(file=file, strict=strict, jobs=jobs).parse():
+                return None, 'Failed to parse launch file.'
+            # Every launched node => a node started twice by the same file (or its includes) reaches merge too.
+            return [dict(node.__dict__) for node in NodeTag.LAUNCHED + NodeCall.LAUNCHED], None
+        except svException as error:
+            return None, error.message
+        except Exception as error:
+            return None, f'{type(error).__name__}: {error}'
+
+    @classmethod
+    def run(cls, files, jobs=None, strict=False, packages=None):
+        pending = list(dict.fromkeys(file for file in files if file not in cls.PARSED))
+        workers = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        # A single file => its included files get the processes, several => the files do.
+        if workers == 1:
+            results = [svLaunch.parse(file, strict, jobs, packages) for file in pending]
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            try:
+                results = list(executor.map(svLaunch.parse, pending, [strict] * len(pending), [1] * len(pending), [packages] * len(pending)))
+            except KeyboardInterrupt:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                executor.shutdown(wait=True)
+        errors = []
+        for file, (nodes, error) in zip(pending, results):
+            if error is None: cls.PARSED[file] = nodes
+            else: errors.append((file, error))
+        for file, error in errors:
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "EXPORTING ERROR"))} {color.color("BOLD", color.color("UNDERLINE", file))} => {error}')
+        if errors:
+            raise svException(message=f'Failed to parse launch files: {", ".join([file for file, _ in errors])}.')
+        return True
+
+    @classmethod
+    def merge(cls, files):
+        packages, owners, duplicates = {}, {}, []
+        for file in dict.fromkeys(files):
+            for node in cls.PARSED[file]:
+                # Same index as Node.NODES => package/namespace/name.
+                index = '/'.join(filter(None, (node['package'], node['namespace'], node['_name'])))
+                # A file listed twice is already skipped above => any repeat is a conflict ROS2 would hit at runtime.
+                if index in owners:
+                    duplicates.append((index, owners[index], file))
+                    continue
+                owners[index] = file
+                packages.setdefault(node['package'], []).append(node)
+        for index, first, second in duplicates:
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "DUPLICATE NODE"))} {color.color("BOLD", index)} => {f"{first} (twice)" if first == second else f"{first} and {second}"}')
+        if duplicates:
+            raise svException(message=f'Nodes launched more than once: {", ".join(dict.fromkeys(index for index, _, _ in duplicates))}.')
+        return packages
+
 """ 
     This file contains the necessary classes and methods to export information about the ros2 running environment that the user may want to analyze.
 
@@ -262,16 +682,24 @@ class LauncherParser:
 
     NAIVE EXTRACTOR... C++ parser is deprecated...
 """
-"Default Colcon package finder, in order to retrieve information about possible executables"
+"Default package finder, in order to retrieve information about possible executables"
 @dataclass
 class PackageFinder:
     ros_workspace : str  = ''
     ros_distro    : str  = '' 
     packages      : list = field(default_factory=list)
-
+    colcon        : bool = False
+    IGNORE        : ClassVar[tuple] = ('COLCON_IGNORE', 'AMENT_IGNORE', 'CATKIN_IGNORE')
+    """
+        PackageFinder
+            \_ scan   => base paths crawled with os.scandir, a directory holding a package.xml is a package (not crawled further)
+            \_ index  => ~/.svROS/cache/packages.json, reused while every crawled directory (and package.xml) keeps its mtime
+            \_ colcon => $ colcon list --base-paths ..., only if asked (svROS extract --colcon)
+    """
     def __post_init__(self):
         # Find and set packages list.
-        self.find_packages(paths=[self.ros_workspace, self.ros_distro])
+        if self.colcon: self.find_packages(paths=[self.ros_workspace, self.ros_distro])
+        else: self.scan_packages(paths=[self.ros_workspace, self.ros_distro])
 
     """ === Predefined functions === """
     def find_packages(self, paths):
@@ -293,6 +721,86 @@ class PackageFinder:
                 pkgs[i[0]] = i[1]
         t = self.set_packages(packages=pkgs)
         return t
+
+    # Same packages colcon would list => first base path wins on duplicates (workspace over distro).
+    def scan_packages(self, paths):
+        index, changed, pkgs = PackageFinder.load_index(), False, {}
+        for base in paths:
+            if not base or not os.path.isdir(base): continue
+            entry = index.get(base)
+            if entry is None or not PackageFinder.valid(entry=entry):
+                entry, changed = PackageFinder.crawl(base=base), True
+                index[base] = entry
+            for name, path in entry['packages'].items():
+                if name not in pkgs: pkgs[name] = path
+        if changed: PackageFinder.save_index(index=index)
+        return self.set_packages(packages=pkgs)
+
+    @staticmethod
+    def crawl(base):
+        directories, packages, visited, stack = {}, {}, set(), [base]
+        while stack:
+            directory = stack.pop()
+            real      = os.path.realpath(directory)
+            if real in visited: continue
+            visited.add(real)
+            try:
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.name, reverse=True)
+                directories[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            names = {entry.name for entry in entries}
+            if any(marker in names for marker in PackageFinder.IGNORE): continue
+            if 'package.xml' in names:
+                manifest = os.path.join(directory, 'package.xml')
+                try:
+                    directories[manifest] = os.stat(manifest).st_mtime_ns
+                except OSError:
+                    continue
+                name = PackageFinder.package_name(manifest=manifest)
+                if name and name not in packages: packages[name] = directory
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir() and not entry.name.startswith('.'): stack.append(entry.path)
+                except OSError:
+                    continue
+        return {'directories': directories, 'packages': dict(sorted(packages.items()))}
+
+    @staticmethod
+    def package_name(manifest):
+        try:
+            name = ET.parse(manifest).getroot().findtext('name')
+        except (ET.ParseError, OSError):
+            return None
+        return name.strip() if name else None
+
+    # Warm runs => one stat per crawled directory, no listing and no package.xml parsing.
+    @staticmethod
+    def valid(entry):
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in entry['directories'].items())
+        except OSError:
+            return False
+
+    @staticmethod
+    def load_index():
+        try:
+            with open(INDEX, 'r') as f: index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    @staticmethod
+    def save_index(index):
+        try:
+            os.makedirs(os.path.dirname(INDEX), exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(INDEX), suffix='.tmp', delete=False) as f:
+                json.dump(index, f)
+            os.replace(f.name, INDEX)
+        except OSError:
+            return False
+        return True
     
     def set_packages(self, packages):
         try:
@@ -310,6 +818,9 @@ class svrosExport:
     ros_workspace : str
     project       : str
     project_dir   : str
+    jobs          : int  = None
+    colcon        : bool = False
+    strict        : bool = False
     last_workspace: ClassVar[str]
 
     def __post_init__(self):
@@ -323,26 +834,26 @@ class svrosExport:
     # Main exporter
     def launch_export(self):
         # Get all packages found.
-        package_finder = PackageFinder(ros_workspace=self.ros_workspace, ros_distro=self.ros_distro)
+        package_finder = PackageFinder(ros_workspace=self.ros_workspace, ros_distro=self.ros_distro, colcon=self.colcon)
         all_packages   = package_finder.packages
         for lf in self.launch:
             print(f'[svROS] {color.color("BOLD", color.color("BLUE", "EXPORTING FILE"))} {color.color("BOLD", color.color("UNDERLINE", lf))}')
-            if not self._export(LAUNCH_FILE=lf, ALL_PACKAGES=all_packages):
-                print(f'[svROS] {color.color("BOLD", color.color("RED", "EXPORTING ERROR"))} {color.color("BOLD", color.color("UNDERLINE", lf))}')
-                break
+        # Launch files are independent => parsed at once over jobs processes, merged in the order they are listed.
+        svLaunch.run(files=self.launch, jobs=self.jobs, strict=self.strict, packages=all_packages)
+        packages = svLaunch.merge(files=self.launch)
+        if not self._export(NODES_PACKAGES=packages, ALL_PACKAGES=all_packages):
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "EXPORTING ERROR"))} {color.color("BOLD", color.color("UNDERLINE", ", ".join(self.launch)))}')
+            return False
+        for lf in self.launch:
             print(f'[svROS] {color.color("BOLD", color.color("GREEN", "FINISHED"))} {color.color("BOLD", color.color("UNDERLINE", lf))}')
         # Retrieve information back to the PROJECT FOLDER!
         if not self.generate_artifacts():
             return False
         return True
 
-    def _export(self, LAUNCH_FILE, ALL_PACKAGES):
-        launcher       = LauncherParser(file=LAUNCH_FILE)
-        parser         = launcher.parse()
-        if isinstance(parser, bool):
-            return False
+    def _export(self, NODES_PACKAGES, ALL_PACKAGES):
         # Process package.
-        packages           = parser[1]
+        packages           = NODES_PACKAGES
         __VALID_PACKAGES__ = {package for package in packages}
         VALID_PACKAGES     = dict(filter(lambda package: package[0] in __VALID_PACKAGES__, ALL_PACKAGES.items()))
         if not self.get_valid_nodes(VALID_PACKAGES=VALID_PACKAGES, NODES_PACKAGES=packages):
@@ -350,6 +861,7 @@ class svrosExport:
         return True
     
     def get_valid_nodes(self, VALID_PACKAGES, NODES_PACKAGES):
+        locations = {}
         for package in VALID_PACKAGES:
             PACKAGE_PATH = VALID_PACKAGES[package]
             srcdir       = PACKAGE_PATH[len(self.ros_workspace):]
@@ -357,12 +869,21 @@ class svrosExport:
             srcdir     = os.path.join(self.ros_workspace, srcdir.split(os.sep, 1)[0])
             bindir     = os.path.join(self.ros_workspace, "build")
             cmake_path = os.path.join(PACKAGE_PATH, "CMakeLists.txt")
-
+            locations[package] = (cmake_path, srcdir, bindir, PACKAGE_PATH)
+        # Packages are independent => parsed at once over jobs processes.
+        svExecutables.run(packages=list(locations.values()), jobs=self.jobs)
+        packages = []
+        for package, (cmake_path, srcdir, bindir, PACKAGE_PATH) in locations.items():
             executables_from_package, iscpp, cls_package = svrosExport.executables_from_package(cmake_path=cmake_path, srcdir=srcdir, bindir=bindir, package_path=PACKAGE_PATH, package=package)
             iscpp                                        = isinstance(iscpp, RoscppExtractor)
         
-            nodes_from_package   = dict(map(lambda _node: (_node, executables_from_package.get(_node)), map(lambda node: node.executable, NODES_PACKAGES[package])))
-            nodes = list(map(lambda node: Node.init_node(**(node.__dict__)), NODES_PACKAGES[package]))
+            nodes_from_package   = dict(map(lambda _node: (_node, executables_from_package.get(_node)), map(lambda node: node['executable'], NODES_PACKAGES[package])))
+            nodes = list(map(lambda node: Node.init_node(**node), NODES_PACKAGES[package]))
+            packages.append((cls_package, nodes_from_package, nodes, iscpp))
+        # Source files of every package at once => spread over jobs processes.
+        sources = list(dict.fromkeys([(path, iscpp) for _, nodes_from_package, _, iscpp in packages for files in nodes_from_package.values() for path in (files or [])]))
+        svExtractor.run(sources=sources, jobs=self.jobs, workspace=svrosExport.last_workspace)
+        for cls_package, nodes_from_package, nodes, iscpp in packages:
             if not svrosExport.process_source_files(package=cls_package, nodes_from_package=nodes_from_package, nodes=nodes, iscpp=iscpp):
                 raise svException(message=f'Failed to export source files.')
         return True
@@ -389,50 +910,30 @@ class svrosExport:
             \_ if CPP => True
             \_ if PY  => False
         """
+        # Already parsed by svExecutables.run, otherwise parsed right here.
+        location = (cmake_path, srcdir, bindir, package_path)
+        if location not in svExecutables.EXECUTABLES:
+            svExecutables.run(packages=[location], jobs=1)
+        target_dict, iscpp = svExecutables.EXECUTABLES[location]
+        package   = Package(name=package, path=package_path, nodes=target_dict)
         # CPP PACKAGES.
-        if os.path.isfile(cmake_path):
-            "Courtesy to André's work in HAROS."
-            parser = RosCMakeParser(srcdir, bindir)
-            parser.parse(cmake_path)
-            # Extracted executables information.
-            executables = parser.executables
-            installs = parser.include_dirs
-            target_dict = dict()
-            for target in executables.values():
-                target_dict[target.name] = target.files
-            package   = Package(name=package, path=package_path, nodes=target_dict)
-            extractor = RoscppExtractor(package=package, workspace=svrosExport.last_workspace)
+        if iscpp: extractor = RoscppExtractor(package=package, workspace=svrosExport.last_workspace)
         # PYTHON PACKAGES.
-        else:
-            # Pattern to catch def main.
-            pattern = re.compile(r'^(\t|\s)*\'.*?\s*=\s*(.*?):main\'')
-            setup_path = f'{package_path}/setup.py' 
-            if os.path.exists(setup_path) and os.path.isfile(setup_path):
-                with open(setup_path) as setup:
-                    match = re.findall(r'\'\s*([^\n\s]*?)\s+\=\s+([^\n\s]*?:main)\'', setup.read())
-                    executables = match
-                    if match is None:
-                        raise Exception
-                target_dict = dict()
-                for target in executables:
-                    path = f'{package_path}/{target[1].split(":")[0].replace(".", "/")}.py'
-                    if not os.path.isfile(path):
-                        raise Exception
-                    target_dict[target[0]] = [path]
-            else:
-                raise Exception
-            package   = Package(name=package, path=package_path, nodes=target_dict)
-            extractor = RospyExtractor(package=package, workspace=svrosExport.last_workspace)
+        else:     extractor = RospyExtractor(package=package, workspace=svrosExport.last_workspace)
         return target_dict, extractor, package
     
     # Python exporter
     @staticmethod
     def python_export(source_file):
+        with open(source_file, 'r') as source_content:
+            source_content = source_content.read()
+        # Fast path => stdlib ast.
+        extracted = ExporterAST(content=source_content).extract()
+        if extracted is not None:
+            return extracted
         parser = PyAstParser(workspace=svrosExport.last_workspace)
         parser.parse(f'{source_file}')
         __gs__ = parser.global_scope
-        with open(source_file, 'r') as source_content:
-            source_content = source_content.read()
         from_imports = re.findall(r'(\t|\s)*from\s*(.*?)\s*import\s*(.*?)\s*\n', source_content)
         from_imports = dict(map(lambda pair: (pair[1], f'{pair[0]}.{pair[1]}'), list(map(lambda fi: (fi[1], fi[2]), from_imports))))
         imports      = re.findall(r'(\t|\s)*import\s*(.*?)\s*\n', source_content)
@@ -452,14 +953,9 @@ class svrosExport:
     def cpp_export(source_file):
         with open(source_file, 'r') as source_content:
             source_content = source_content.read()
-        # Exporter CPP
+        # Exporter CPP => publisher and subscriber calls at once.
         cpp  = ExporterCPP(content=source_content)
-        # Publisher calls
-        pubs = cpp.extract_publishers()
-        map(lambda call: node.publishes.append(call), pubs)
-        # Subscriber calls
-        subs = cpp.extract_subscribers()
-        map(lambda call: node.subscribes.append(call), subs)
+        pubs, subs = cpp.extract()
         return pubs, subs
 
     # Function that will origin the needed files to run the analysis.
@@ -484,7 +980,7 @@ class svrosExport:
 
     # Retrieve to a YAML-based file
     def generate_config_file(self):
-        default_configuration = {'project': self.project, 'launch': self.launch, 'model': {'steps': 20, 'inbox': 4, 'behaviour': ['']}}
+        default_configuration = {'project': self.project, 'launch': self.launch, 'model': {'steps': 20, 'inbox': 4, 'escalation': False, 'slicing': True, 'behaviour': ['']}}
         tuple = Node.process_config_file()
         return {'configurations': default_configuration, 'packages': list(set(map(lambda package: package.name.lower(), Package.PACKAGES))), 'nodes': tuple[0], 'topics': tuple[1], 'types': Topic.list_of_types(), 'states': [None] }
 
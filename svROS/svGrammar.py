@@ -67,6 +67,7 @@ GRAMMAR = f"""
 """
 
 from lark import Lark, tree, Token, Transformer
+from .svParser import svParser
 from lark.exceptions import UnexpectedCharacters, UnexpectedToken
 from .svData import svTopic, svState, NonNumeric
 
@@ -81,10 +82,9 @@ class GrammarParser(object):
     @classmethod
     def parse(cls, node, text=''):
         if text == '': return
-        grammar, parser = cls.GRAMMAR, Lark(cls.GRAMMAR, parser="lalr", start='property', transformer=LanguageTransformer(node=node, text=text))
-        # PARSE!
+        # PARSE! => shared parser, transformer holds this property's node and text.
         try:
-            conditions = parser.parse(text)
+            conditions = svParser.transform(grammar=cls.GRAMMAR, start='property', text=text, transformer=LanguageTransformer(node=node, text=text))
         except (UnexpectedToken, UnexpectedCharacters, SyntaxError) as e:
             raise svException(f'Failed to parse property {text}: {e}')
         try:
@@ -0,0 +1,115 @@
+import os, re, threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from .svInfo import color, svException
+from .svValidator import svValidator
+
+"""
+    This file contains the include resolution shared by both launch parsers (<include> and IncludeLaunchDescription).
+    Each included file is parsed once per process; only its argument bindings are evaluated again at every include site.
+"""
+"Included launch files => parsed structure per path, evaluated per include site."
+class svInclude(object):
+    PARSED   = {}
+    # Package => directory, as found by PackageFinder (svrosExport).
+    PACKAGES = {}
+    # Include sites being evaluated => a file that includes itself (directly or not) is an error.
+    STACK    = []
+    LOCK     = threading.Lock()
+    SUBSTITUTION = re.compile(r'\$\(\s*(find-pkg-share|find-pkg-prefix|var|env|dirname)\s*([^)\s]*)\s*\)')
+    """
+        svInclude
+            \_ share      => $(find-pkg-share pkg), FindPackageShare and get_package_share_directory
+            \_ substitute => XML substitutions inside a string (find-pkg-share, var, env, dirname)
+            \_ parse      => validated and parsed file, as plain data (or the reason it failed)
+            \_ load       => every include site of a launch file at once over jobs processes (1 => in-process), kept in PARSED
+            \_ include    => parsed file evaluated with the configurations of one include site
+    """
+    @classmethod
+    def share(cls, package):
+        if package in cls.PACKAGES:
+            return cls.PACKAGES[package]
+        for prefix in filter(None, os.getenv('AMENT_PREFIX_PATH', '').split(os.pathsep)):
+            directory = os.path.join(prefix, 'share', package)
+            if os.path.isdir(directory): return directory
+        return None
+
+    @classmethod
+    def substitute(cls, text, dirname='', lookup=None):
+        if not isinstance(text, str): return None
+        unresolved = []
+        def replace(match):
+            kind, name = match.group(1), match.group(2)
+            if kind in {'find-pkg-share', 'find-pkg-prefix'}: value = cls.share(name)
+            elif kind == 'var': value = lookup(name) if lookup else None
+            elif kind == 'env': value = os.getenv(name)
+            else: value = dirname
+            if value is None: unresolved.append(match.group(0))
+            return value or ''
+        text = cls.SUBSTITUTION.sub(replace, text)
+        return None if unresolved else text
+
+    @staticmethod
+    def path(path, dirname):
+        if not isinstance(path, str) or path == '': return None
+        return os.path.normpath(path if os.path.isabs(path) else os.path.join(dirname, path))
+
+    # Worker => never raises, hands back the parsed file or why it could not be parsed.
+    @staticmethod
+    def parse(path, packages):
+        # Imported here => both launch parsers import this module.
+        from .svLauncherPY import LauncherParserPY
+        # Package index handed over by load => a spawned worker starts without it.
+        svInclude.PACKAGES = packages
+        try:
+            valid, reason = svValidator.validate(file=path)
+            if not valid:
+                return None, reason
+            if path.lower().endswith('.xml'):
+                return ET.parse(path).getroot(), None
+            if path.lower().endswith('.py'):
+                calls = LauncherParserPY.validate_py_schema(file=path)
+                return (calls, None) if calls else (None, 'No LaunchDescription returned by generate_launch_description.')
+            return None, 'Supported formats: .py and .xml.'
+        except Exception as error:
+            return None, f'{type(error).__name__}: {error}'
+
+    @classmethod
+    def load(cls, paths, jobs=None):
+        pending = list(dict.fromkeys(path for path in paths if path not in cls.PARSED))
+        if not pending: return True
+        # Sibling includes are independent subtrees => parsed side by side.
+        jobs = max(1, min(jobs or os.cpu_count() or 1, len(pending)))
+        if jobs == 1:
+            results = [svInclude.parse(path, cls.PACKAGES) for path in pending]
+        else:
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            results  = executor.map(svInclude.parse, pending, [cls.PACKAGES]*len(pending))
+        failed = []
+        try:
+            for path, (structure, error) in zip(pending, results):
+                if error is not None:
+                    print(f'[svROS] {color.color("BOLD", color.color("RED", "INCLUDE ERROR"))} {path}: {error}')
+                    failed.append(path)
+                    continue
+                with cls.LOCK: cls.PARSED[path] = structure
+        finally:
+            if jobs > 1: executor.shutdown()
+        if failed:
+            raise svException(message=f'Failed to parse {len(failed)} included launch file(s): {", ".join(failed)}.')
+        return True
+
+    @classmethod
+    def include(cls, path, configurations, jobs=None):
+        from .svLauncherXML import LauncherParserXML
+        from .svLauncherPY  import LauncherParserPY
+        if path in cls.STACK:
+            raise svException(message=f'Launch files include each other in a cycle: {" -> ".join(cls.STACK[cls.STACK.index(path):] + [path])}.')
+        cls.load(paths=[path], jobs=1)
+        cls.STACK.append(path)
+        try:
+            if path.lower().endswith('.xml'):
+                return LauncherParserXML.evaluate(root=cls.PARSED[path], file=path, configurations=configurations, jobs=jobs)
+            return LauncherParserPY.evaluate(calls=cls.PARSED[path], file=path, configurations=configurations, jobs=jobs)
+        finally:
+            cls.STACK.pop()
@@ -37,6 +37,7 @@ GRAMMAR = f"""
 
 from lark import Lark, tree, Token, Transformer
 from lark.exceptions import UnexpectedCharacters, UnexpectedToken
+from .svParser import svParser
 from .svData import svState
 class GrammarParser(object):
     """
@@ -47,10 +48,9 @@ class GrammarParser(object):
     @classmethod
     def parse(cls, text=''):
         if text == '': return
-        grammar, parser = cls.GRAMMAR, Lark(cls.GRAMMAR, parser="lalr", start='property', transformer=LanguageTransformer())
-        # PARSE!
+        # PARSE! => shared parser.
         try:
-            conditions = parser.parse(text)
+            conditions = svParser.transform(grammar=cls.GRAMMAR, start='property', text=text, transformer=LanguageTransformer())
         except (UnexpectedToken, UnexpectedCharacters, SyntaxError) as e:
             raise svException(f'Failed to parse property {text}: {e}')
         try:
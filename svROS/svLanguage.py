@@ -10,8 +10,8 @@ import xml.etree.ElementTree as ET
 from lark import Lark, tree
 import itertools
 
-from .svGrammar import GrammarParser, Read, Publish, Update
-from .svData import Topic, svNode, svState
+from .svGrammar import GrammarParser, Read, Publish, Update, Evaluate
+from .svData import Topic, svNode, svState, NonNumeric
 
 ###############################
 # === ANALYSING !! YAY :))) ===
@@ -121,6 +121,29 @@ class svPredicate(object):
             raise svException(f"Predicate {signature} is already defined.")
         return cls(signature=signature, node=node, properties=properties, is_sub_predicate=is_sub_predicate)
 
+    # Every publication in the predicate => (topic, published value), value is None unless it is a literal.
+    def publications(self):
+        found, pending, seen = [], list(self.properties or []), set()
+        while pending:
+            obj = pending.pop()
+            if id(obj) in seen: continue
+            seen.add(id(obj))
+            if isinstance(obj, (list, tuple, set)):
+                pending += list(obj)
+                continue
+            # Only the parsed property tree is walked (not topics, states or nodes).
+            if type(obj).__module__ != GrammarParser.__module__: continue
+            if isinstance(obj, Publish): found.append((obj.object, svPredicate.literal(obj.publish)))
+            pending += list(vars(obj).values())
+        return found
+
+    @staticmethod
+    def literal(publish):
+        if not isinstance(publish, Evaluate) or publish.binop != "EQUAL_OPERATOR": return None
+        value = str(publish.value)
+        if value.lstrip("-").isdigit() or NonNumeric.abstract(tag=value) in NonNumeric.VALUES: return value
+        return None
+
     @classmethod
     def node_behaviour(cls):
         return '\n'.join([str(predicate) for predicate in cls.NODE_BEHAVIOURS.values()])
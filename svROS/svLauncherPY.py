@@ -1,36 +1,52 @@
-import os, argparse, time, shutil, glob, warnings, logging, re, sys, subprocess
+import os, argparse, time, shutil, glob, warnings, logging, re, sys, subprocess, ast
 from yaml import *
 from dataclasses import dataclass, field
 from logging import FileHandler
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from typing import ClassVar
 # Parsers
 from lxml import etree
 from lark import Lark, tree, Token
 # InfoHandler => Prints, Exceptions and Warnings
 from .svInfo import color, svException, svWarning
-# Python parser helper
-from bonsai.model import (
-    CodeGlobalScope, CodeReference, CodeFunctionCall, pretty_str
-)
-from bonsai.analysis import (
-    CodeQuery, resolve_reference, resolve_expression, get_control_depth,
-    get_conditions, get_condition_paths, is_under_loop
-)
-from bonsai.py.py_parser import PyAstParser
+from .svParser import svParser
+from .svValidator import svValidator
+from .svInclude import svInclude
+
+"Launch action as written in the launch file => call name, evaluated positional and keyword arguments."
+Action = namedtuple('Action', ('call', 'args', 'keywords'))
 
 "Functions that every class inherits."
 class BaseCall(object):
     """ === Static Methods === """
     @staticmethod
-    def get_value(call):
-        return call.named_args[0].value
-
+    def get_value(action, keyword, position=None):
+        if keyword in action.keywords:
+            return action.keywords[keyword]
+        if position is not None and len(action.args) > position:
+            return action.args[position]
+        return None
+
+    "Evaluated value => plain string, LaunchConfiguration references are followed through the declared arguments."
     @staticmethod
-    def process_code_reference(call):
-        reference = resolve_reference(call)
-        if reference == None:
-            raise svException(message=f'Failed to resolve reference from Launch call.')
-        return reference
+    def resolve(value, seen=frozenset()):
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, ReferenceCall):
+            if value.name in seen:
+                raise svException(message=f'Launch Arg {value.name} references itself.')
+            if value.name in ArgsCall.ARGS:
+                return BaseCall.resolve(ArgsCall.ARGS[value.name].value, seen | {value.name})
+            if value.default is not None:
+                return BaseCall.resolve(value.default, seen | {value.name})
+            raise svException(message=f'Not a valid Launch Arg: {value.name}.')
+        if isinstance(value, (list, tuple)):
+            # Substitution lists are concatenated, as ros2 launch does.
+            parts = [BaseCall.resolve(part, seen) for part in value]
+            if any(part is None for part in parts):
+                return None
+            return ''.join(parts)
+        return None
     """ === Static Methods === """
 
 "Reference through call of LaunchConfiguration."
@@ -38,28 +54,24 @@ class ReferenceCall(BaseCall):
     REQUIRED = ("value")
     """
     ...
-        \_ LaunchConfiguration ==> ReferenceCall
+        \_ LaunchConfiguration ==> ReferenceCall (resolved once the Node that uses it is processed)
     """
-    def __init__(self, name):
-        self.name = name
-        self.referenced = []
-
-    def _add_reference(self, reference):
-        self.referenced.append(reference)
-        return True
+    def __init__(self, name, default=None):
+        self.name    = name
+        self.default = default
 
 "ROS2-based arguments that Nodes instances might use."
 class ArgsCall(BaseCall):
-    CALL_REFERENCES = {}
     ARGS            = {}
+    # Values given by the include site => they win over the default_value of a DeclareLaunchArgument.
+    BINDINGS        = {}
     REQUIRED = ("name", r"(default_value|value)")
     """
         DeclareLaunchArgument/SetEnvironmentVariable
             \__ name
-            \__ named_args
-            \__ arguments => TextSubstitution
-                                \_ named_args
-                                \_ LaunchConfiguration ==> ReferenceCall
+            \__ default_value/value => Text
+                                    => TextSubstitution
+                                    => LaunchConfiguration ==> ReferenceCall
     """
     def __init__(self, name, value):
         self.name   = name
@@ -67,60 +79,26 @@ class ArgsCall(BaseCall):
         ArgsCall.ARGS[self.name] = self
 
     @staticmethod
-    def process_references(name, value):
-        if name in ArgsCall.CALL_REFERENCES:
-            reference = ArgsCall.CALL_REFERENCES[name]
-            for ref in reference.referenced:
-                ref.value = value
-        return True
-
+    def process_argument(action=None):
+        name  = ArgsCall.get_value(action=action, keyword='name', position=0)
+        value = ArgsCall.get_value(action=action, keyword='default_value' if action.call == 'DeclareLaunchArgument' else 'value', position=1)
+        if not isinstance(name, str):
+            raise svException(message=f'Not a valid {action.call} call.')
+        if action.call == 'DeclareLaunchArgument' and name in ArgsCall.BINDINGS:
+            value = ArgsCall.BINDINGS[name]
+        return ArgsCall.init_argument(name=name, value=value)
+
+    # Launch configurations an included file starts from => resolvable ones only.
     @staticmethod
-    def process_argument(call=None):
-        name  = call.arguments[0]
-        value = ArgsCall.get_value(call=call)
-
-        if isinstance(value, str):
-            ArgsCall.process_references(name, value)
-            return ArgsCall.init_argument(name=name, value=value)
-        else:
-            process_argument = ArgsCall.process_argument_value(name=name, value=value, tag=value.name)
-            if process_argument == '':
-                return None
-            value = process_argument
-
-        if isinstance(value, ReferenceCall):
-            if value.name in ArgsCall.ARGS:
-                arg_reference_value = ArgsCall.ARGS[value.name].value
-                return ArgsCall.init_argument(name=name, value=arg_reference_value)    
-            reference = ArgsCall.CALL_REFERENCES[value.name]
-            arg       = ArgsCall.init_argument(name=name, value=value)
-            reference._add_reference(arg)
-            return arg
-        else:
-            # TextSubstitution
-            ArgsCall.process_references(name, value)
-            return ArgsCall.init_argument(name=name, value=value)
-
-    @staticmethod
-    def process_argument_value(name, value, tag):
-        VALID_VALUE_TAGS = {'LaunchConfiguration', 'TextSubstitution'}
-        
-        if tag not in VALID_VALUE_TAGS:
-            return ''
-        # Text substitution is clear.
-        if tag == 'TextSubstitution':
-            value = ArgsCall.get_value(call=value)
-        # LaunchConfiguration might be different.
-        else:
-            value = value.arguments[0]
-            if not value in ArgsCall.CALL_REFERENCES:
-                # Arguments might be a reference => Reference Call.
-                value = ReferenceCall(name=value)
-                ArgsCall.CALL_REFERENCES[value.name] = value
-        
-        if isinstance(value, CodeReference):
-            value = ArgsCall.process_code_reference(value)
-        return value
+    def configurations():
+        configurations = {}
+        for name, argument in ArgsCall.ARGS.items():
+            try:
+                value = ArgsCall.resolve(argument.value)
+            except svException:
+                continue
+            if value is not None: configurations[name] = value
+        return configurations
 
     @classmethod
     def init_argument(cls, name, value):
@@ -135,7 +113,7 @@ class RemapCall(BaseCall):
         self.origin = f
         self.destin = t
         RemapCall.REMAPS.add(self)
-        
+
     @classmethod
     def init_remap(cls, **kwargs):
         return cls(f=kwargs.get('from'), t=kwargs.get('to'))
@@ -144,14 +122,20 @@ class RemapCall(BaseCall):
 class NodeCall(BaseCall):
     NODES          = {}
     PACKAGES_NODES = {}
+    # Every node in launch order, repeated ones included => NODES only keeps the last one of each name.
+    LAUNCHED       = []
     CHILDREN = ("remap", "param")
     REQUIRED = ("package", "executable", "name")
+    # Dashing/Eloquent keywords => current ones.
+    KEYWORDS = {"node_executable": "executable", "node_name": "name", "node_namespace": "namespace"}
     """
         Node
-            \__ named_args
+            \__ keywords
                     \_ Text
                     \_ TextSubstitution
                     \_ LaunchConfiguration ==> ReferenceCall
+                    \_ remappings => (from, to) pairs
+                    \_ arguments/ros_arguments => inline remaps and enclave
     """
     def __init__(self, name, package, executable, remaps, namespace=None, enclave=None):
         self.name       = name
@@ -162,6 +146,7 @@ class NodeCall(BaseCall):
         self.enclave    = enclave
         index = self.name
         NodeCall.NODES[index] = self
+        NodeCall.LAUNCHED.append(self)
         if self.package in NodeCall.PACKAGES_NODES: NodeCall.PACKAGES_NODES[self.package].add(self)
         else: NodeCall.PACKAGES_NODES[self.package] = {self}
 
@@ -171,47 +156,21 @@ class NodeCall(BaseCall):
 
     @staticmethod
     def process_cmd_arg(tree, info_data, tag, enclave=False):
-        data = list(tree.find_data(info_data))
-        if data == []: return {}
-        output = []
-        _data_ = data[len(data)-1]
-        if _data_:
-            output = list(map(lambda v: v.value , list(filter(lambda vv: vv.type == tag, (_data_.scan_values(lambda v: isinstance(v, Token)))))))
-            if enclave == False:
-                output = list(zip(output[0::2], output[1::2]))
+        # Every occurrence, in the given order (e.g. -r a:=b -r c:=d).
+        output = [token.value for complete in tree.children[1:] for data in complete.children[1:] if data.data == info_data for token in data.children if token.type == tag]
+        if enclave == False:
+            output = list(zip(output[0::2], output[1::2]))
         return output
-    
+
     "Grammar to parse inline node arguments."
     @staticmethod
     def parse_cmd_args(args=''):
         output = {}
         output['remaps'] = list()
-            
-        # Grammar to parse arguments.
-        grammar = """
-            sentence: INIT complete?
-            complete: REMAP /\s/ arg_remap
-                    | ENCLAVE /\s/ arg_enclave
-                    | PARAMETER /\s/ arg_parameter
-
-            arg_remap: ARG_R ":=" ARG_R (/\s/ (arg_remap | complete))*
-            arg_enclave: ARG_E (/\s/ complete)*
-            arg_parameter: ARG_P ":=" ARG_P (/\s/ (arg_parameter | complete))*
-
-            INIT: "--ros-args"
-            REMAP:"--remap" | "-r"
-            ENCLAVE: "--enclave" | "-e"
-            PARAMETER: "--parameter" | "-p"
-
-            ARG_R:/(?!\:\=)[a-zA-Z0-9_\/\-.]+/
-            ARG_E:/(?!\s)[a-zA-Z0-9_\/\-.]+/
-            ARG_P:/(?!\:\=)[a-zA-Z0-9_\/\-.]+/
-
-            %import common.WS
-            %ignore WS
-        """
-        parser = Lark(grammar, start='sentence', ambiguity='explicit')
-        tree = parser.parse(f'{args}')
+
+        # Grammar to parse arguments => grammars/helpers.lark (cmd_args).
+        tree = svParser.parse(start='cmd_args', text=args)
+        if tree is None: raise svException(f'Failed to parse node arguments {args}.')
 
         remaps  = NodeCall.process_cmd_arg(tree=tree, info_data="arg_remap", tag='ARG_R')
         enclave = NodeCall.process_cmd_arg(tree=tree, info_data="arg_enclave", tag='ARG_E', enclave=True)
@@ -221,69 +180,30 @@ class NodeCall(BaseCall):
         output['enclave'] = str(enclave) if enclave is not None else None
         return output
 
-    @staticmethod
-    def process_argument_value(value, tag):
-        VALID_VALUE_TAGS = {'LaunchConfiguration', 'TextSubstitution'}
-        if tag not in VALID_VALUE_TAGS:
-            return ''
-        if tag == 'TextSubstitution':
-            value = NodeCall.get_value(call=value)
-        elif tag == 'LaunchConfiguration':
-            value = value.arguments[0]
-            # Reference to argument already processed.
-            if value not in ArgsCall.ARGS:
-                raise svException(message=f'Not a valid Launch Arg.')
-            value = ArgsCall.ARGS[value].value
-        else:
-            raise svException(message=f'Not a valid Launch Arg.')
-
-        if isinstance(value, CodeReference):
-            value = NodeCall.process_code_reference(value)
-        return value
-
-    @staticmethod
-    def process_node_argument(value, tag=None):
-        if isinstance(value, str):
-            return value
-        else:
-            # Parsing-Error processing...
-            process_argument = NodeCall.process_argument_value(value=value, tag=value.name)
-            if process_argument == '':
-                return None
-            value = process_argument
-        return value
-
     @staticmethod
     def process_cmd_args(values):
-        ASSIGNMENT_KEYS = {':=', '/', ':', '='}
-        arguments_cmd = "--ros-args "
-        for v in values:
-            if isinstance(v, str):
-                arg_cmd = v
-            else:
-                arg_cmd = NodeCall.process_node_argument(value=v, tag=v.name)
-            arguments_cmd += f'{arg_cmd} '
-        output = NodeCall.parse_cmd_args(args=arguments_cmd)
+        arguments = [NodeCall.resolve(value) for value in values]
+        if any(argument is None for argument in arguments):
+            raise svException(message=f'Failed to resolve node arguments.')
+        # Every argument is read as a ROS argument => a single --ros-args in front of them.
+        arguments = [argument for argument in arguments if argument not in {'--ros-args', '--'}]
+        output    = NodeCall.parse_cmd_args(args='--ros-args ' + ' '.join(arguments))
         return output.get('enclave'), output.get('remaps')
 
     @staticmethod
     def process_remaps(values):
         remaps = []
-        for v in values:
-            if isinstance(v.value[0], str):
-                _from = v.value[0]
-            else:
-                _from = NodeCall.process_node_argument(value=v.value[0], tag=v.value[0].name)
-            if isinstance(v.value[1], str):
-                _to = v.value[1]
-            else:
-                _to = NodeCall.process_node_argument(value=v.value[1], tag=v.value[1].name)
-            object_remap = {'from': _from, 'to': _to}
-            remaps.append(object_remap)
+        for value in values:
+            if not (isinstance(value, (list, tuple)) and len(value) == 2):
+                raise svException(message=f'Not a valid Launch remap.')
+            _from, _to = NodeCall.resolve(value[0]), NodeCall.resolve(value[1])
+            if _from is None or _to is None:
+                raise svException(message=f'Failed to resolve Launch remap.')
+            remaps.append({'from': _from, 'to': _to})
         return remaps
 
     @staticmethod
-    def process_node_arguments(arguments):
+    def process_node_arguments(keywords):
         """
         Node args to be processed:
             \_ name
@@ -299,38 +219,37 @@ class NodeCall(BaseCall):
             'remappings'
         }
         ARGUMENTS   = {
-            'arguments'
+            'arguments', 'ros_arguments'
         }
         node_arguments = {}
         node_arguments['remaps'] = []
-        base_arguments = list(filter(lambda arg: arg.name in VALID_NODE_ARGUMENTS, arguments))
-        # Node processing through loop iteration.
-        for arg in arguments:
-            if arg.name in VALID_NODE_ARGUMENTS:
-                node_arguments[arg.name] = NodeCall.process_node_argument(value=arg.value, tag=arg.name)
-            elif arg.name in ARGUMENTS:
+        # Node processing through loop iteration => keyword order, as written.
+        for keyword, value in keywords.items():
+            keyword = NodeCall.KEYWORDS.get(keyword, keyword)
+            if keyword in VALID_NODE_ARGUMENTS:
+                node_arguments[keyword] = NodeCall.resolve(value)
+            elif keyword in ARGUMENTS and isinstance(value, (list, tuple)):
                 # Inline cmd node arguments.
-                cmd_enclave, cmd_remaps = NodeCall.process_cmd_args(values=arg.value.value)
-                node_arguments['enclave'] = cmd_enclave
+                cmd_enclave, cmd_remaps = NodeCall.process_cmd_args(values=value)
+                node_arguments['enclave'] = cmd_enclave or node_arguments.get('enclave')
                 for remap in cmd_remaps:
                     node_arguments['remaps'].append(remap)
                     RemapCall.init_remap(**remap)
-            elif arg.name in REMAPPINGS:
-                remaps = NodeCall.process_remaps(values=arg.value.value)
+            elif keyword in REMAPPINGS and isinstance(value, (list, tuple)):
+                remaps = NodeCall.process_remaps(values=value)
                 for remap in remaps:
                     node_arguments['remaps'].append(remap)
                     RemapCall.init_remap(**remap)
         return node_arguments
 
     @staticmethod
-    def process_node(call=None):
-        # in-line arguments
-        inline_arguments = call.named_args
-        arguments        = call.arguments
-        if arguments:
+    def process_node(action=None):
+        if action.args:
             raise svException(message=f'Not a valid Launch Node call.')
-            return None 
-        node_arguments = NodeCall.process_node_arguments(arguments=inline_arguments)
+        node_arguments = NodeCall.process_node_arguments(keywords=action.keywords)
+        for required in NodeCall.REQUIRED:
+            if node_arguments.get(required) is None:
+                raise svException(message=f'Not a valid Launch Node call: {required} is missing or could not be resolved.')
         NodeCall.init_node(**node_arguments)
 
     @property
@@ -340,18 +259,168 @@ class NodeCall(BaseCall):
         else:
             name = self.namespace + '/' + self._name
         return name
-    
+
     @name.setter
     def name(self, value):
         self._name = value
 
-""" 
+"Launch evaluator => single pass over Python's own ast, down to the LaunchDescription that generate_launch_description returns."
+@dataclass
+class EvaluatorAST(ast.NodeVisitor):
+    content: str
+    file   : str = ''
+    # Calls evaluated into launch actions, any other call is left unresolved (None).
+    ACTIONS: ClassVar[set] = {'Node', 'DeclareLaunchArgument', 'SetEnvironmentVariable', 'LaunchDescription', 'IncludeLaunchDescription'}
+    SOURCES: ClassVar[set] = {'PythonLaunchDescriptionSource', 'XMLLaunchDescriptionSource', 'FrontendLaunchDescriptionSource', 'AnyLaunchDescriptionSource'}
+    ENTRY  : ClassVar[str] = 'generate_launch_description'
+    """
+        EvaluatorAST
+            \_ scope    => variables bound so far (module first, then generate_launch_description, in order)
+            \_ value    => str, list/tuple/dict, ReferenceCall (LaunchConfiguration), Action or None
+            \_ paths    => *LaunchDescriptionSource, FindPackageShare, PathJoinSubstitution, os.path, ThisLaunchFileDir and __file__
+            \_ add      => ld.add_action(...)/ld.add_entity(...) on a bound LaunchDescription
+            \_ evaluate => launch actions of the returned LaunchDescription, in order (None if there is none)
+    """
+    def __post_init__(self):
+        self.scope, self.description = {}, None
+
+    def evaluate(self):
+        try:
+            tree = ast.parse(self.content)
+        except (SyntaxError, ValueError):
+            return None
+        self.visit(tree)
+        if not (isinstance(self.description, Action) and self.description.call == 'LaunchDescription'):
+            return None
+        return EvaluatorAST.entities(BaseCall.get_value(self.description, keyword='initial_entities', position=0))
+
+    @staticmethod
+    def entities(value):
+        if isinstance(value, Action):
+            return [value]
+        if isinstance(value, (list, tuple)):
+            return [action for item in value for action in EvaluatorAST.entities(item)]
+        return []
+
+    # Module statements run before the launch description is generated, whatever their position.
+    def visit_Module(self, node):
+        for statement in node.body:
+            self.visit(statement)
+        for statement in node.body:
+            if isinstance(statement, ast.FunctionDef) and statement.name == EvaluatorAST.ENTRY:
+                for inner in statement.body: self.visit(inner)
+
+    # Definitions are not run when declared => only generate_launch_description is (by visit_Module).
+    def visit_FunctionDef(self, node):
+        return None
+
+    visit_AsyncFunctionDef = visit_ClassDef = visit_FunctionDef
+
+    def visit_Assign(self, node):
+        value = self.value(node.value)
+        for target in node.targets:
+            self.bind(target=target, value=value)
+
+    def visit_AnnAssign(self, node):
+        if node.value is not None:
+            self.bind(target=node.target, value=self.value(node.value))
+
+    def visit_Expr(self, node):
+        self.value(node.value)
+
+    def visit_Return(self, node):
+        if node.value is not None:
+            self.description = self.value(node.value)
+
+    def bind(self, target, value):
+        if isinstance(target, ast.Name):
+            self.scope[target.id] = value
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            values = value if isinstance(value, (list, tuple)) and len(value) == len(target.elts) else [None] * len(target.elts)
+            for element, item in zip(target.elts, values): self.bind(target=element, value=item)
+
+    def value(self, node):
+        if isinstance(node, ast.Constant):
+            return node.value if node.value is None or isinstance(node.value, str) else str(node.value)
+        if isinstance(node, ast.Name):
+            return self.file if node.id == '__file__' else self.scope.get(node.id)
+        if isinstance(node, ast.Dict):
+            keys = [self.value(key) if key is not None else None for key in node.keys]
+            return {key: self.value(value) for key, value in zip(keys, node.values) if isinstance(key, str)}
+        if isinstance(node, ast.List):
+            return [self.value(element) for element in node.elts]
+        if isinstance(node, ast.Tuple):
+            return tuple(self.value(element) for element in node.elts)
+        if isinstance(node, ast.JoinedStr):
+            parts = [self.value(part.value if isinstance(part, ast.FormattedValue) else part) for part in node.values]
+            return ''.join(parts) if all(isinstance(part, str) for part in parts) else None
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left, right = self.value(node.left), self.value(node.right)
+            if isinstance(left, str) and isinstance(right, str): return left + right
+            if isinstance(left, list) and isinstance(right, list): return left + right
+            return None
+        if isinstance(node, ast.Call):
+            return self.call(node)
+        return None
+
+    def call(self, node):
+        call = node.func.attr if isinstance(node.func, ast.Attribute) else getattr(node.func, 'id', None)
+        action = Action(call=call, args=[self.value(argument) for argument in node.args], keywords={keyword.arg: self.value(keyword.value) for keyword in node.keywords if keyword.arg})
+        if call in {'add_action', 'add_entity'} and isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
+            return EvaluatorAST.add(description=self.scope.get(node.func.value.id), entities=action.args)
+        if call in EvaluatorAST.ACTIONS:
+            return action
+        if call == 'TextSubstitution':
+            return BaseCall.get_value(action, keyword='text', position=0)
+        if call == 'LaunchConfiguration':
+            name = BaseCall.get_value(action, keyword='variable_name', position=0)
+            return ReferenceCall(name=name, default=action.keywords.get('default')) if isinstance(name, str) else None
+        return self.path(node=node, call=call, action=action)
+
+    # Included launch file paths => substitution lists, joined once resolved.
+    def path(self, node, call, action):
+        if call in EvaluatorAST.SOURCES:
+            return BaseCall.get_value(action, keyword='launch_file_path', position=0)
+        if call in {'FindPackageShare', 'get_package_share_directory'}:
+            package = BaseCall.get_value(action, keyword='package', position=0)
+            return svInclude.share(package) if isinstance(package, str) else None
+        if call == 'ThisLaunchFileDir':
+            return os.path.dirname(self.file)
+        if call == 'PathJoinSubstitution' and action.args and isinstance(action.args[0], (list, tuple)):
+            return EvaluatorAST.join(action.args[0])
+        if call == 'items' and isinstance(node.func, ast.Attribute):
+            value = self.value(node.func.value)
+            return list(value.items()) if isinstance(value, dict) else None
+        # os.path.join/os.path.dirname.
+        if isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Attribute) and node.func.value.attr == 'path':
+            if call == 'join': return EvaluatorAST.join(action.args)
+            if call == 'dirname' and action.args and isinstance(action.args[0], str): return os.path.dirname(action.args[0])
+        return None
+
+    @staticmethod
+    def join(parts):
+        joined = []
+        for part in parts:
+            joined += [part] if not joined else ['/', part]
+        return joined
+
+    @staticmethod
+    def add(description, entities):
+        if not (isinstance(description, Action) and description.call == 'LaunchDescription'):
+            return None
+        # Entities given on construction come first, whichever way they were passed.
+        initial = EvaluatorAST.entities(BaseCall.get_value(description, keyword='initial_entities', position=0))
+        description.keywords.pop('initial_entities', None)
+        description.args[:1] = [initial + EvaluatorAST.entities(entities)]
+        return None
+
+"""
     This file contains the necessary classes and methods to export information from the launch file Python-based specified within the config file.
 
-    SCHEMA that ros2 provides is deprecated also... So we'll try to run ros2 launch -p instead:
+    SCHEMA that ros2 provides is deprecated also... Files are checked statically (svValidator), ros2 launch -p is only run if strict:
         => ros2 launch $file -p
 
-    ROS2 launch is based on python, which I, Luís Ribeiro, test the tool in order to try to retrive some useful structures to ease the parsing process, however, they do not furnish a direct way of acessing those structures. Therefore, this parsing technique might have some attached issues.
+    ROS2 launch is based on python, which I, Luís Ribeiro, test the tool in order to try to retrive some useful structures to ease the parsing process, however, they do not furnish a direct way of acessing those structures. Therefore, the launch file is evaluated from its syntax tree (EvaluatorAST) without running it, which might have some attached issues.
 """
 "Launcher parser in order to retrieve information about possible executables..."
 @dataclass
@@ -367,121 +436,102 @@ class LauncherParserPY:
         "Node": NodeCall, # underlying remap call
         "Remap": RemapCall,
         "DeclareLaunchArgument" : {ArgsCall, ReferenceCall},
-        "SetEnvironmentVariable": {ArgsCall, ReferenceCall}
+        "SetEnvironmentVariable": {ArgsCall, ReferenceCall},
+        "IncludeLaunchDescription": svInclude
 
     }
     file      : str
+    strict    : bool = False
+    jobs      : int  = None
 
     """ === Predefined functions === """
     @staticmethod
-    def validate_schema(file, execute_cmd=(False,'')):
-        # Due to the depecrated xml file, the user might opt to check syntax through execution commands.
-        if execute_cmd[0] == True:
-            cmd = execute_cmd[1].split(' ')
-            try:
-                subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-            except Exception as error:
-                return False
-        return True
-    
+    def validate_schema(file, strict=False):
+        # Static check => in-process, cached per file. The user might opt to also check syntax through ros2 launch -p (strict).
+        valid, reason = svValidator.validate(file=file, strict=strict)
+        if not valid:
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "INVALID LAUNCH FILE"))} {file}: {reason}')
+        return valid
+
     @staticmethod
-    def validate_py_schema(file, workspace):
+    def validate_py_schema(file):
         # PYTHON tags that should be evaluated.
         """ TAGS:
                 . Node tag                  -> Reference to a node
                 . DeclareLaunchArgument tag -> Arguments that can be used inside a node
                 . LaunchConfiguration   tag -> Yet more arguments...
         """
-        VALID_TAGS = {
-            'Node',
-            'DeclareLaunchArgument',
-            'SetEnvironmentVariable'
-        }
-        if workspace == '':
-            return {}, None
         try:
-            parser = PyAstParser(workspace=workspace)
-            parser.parse(file)
-        except:
-            return {}, None
-
-        # Parser => Global Scope
-        __gs__ = parser.global_scope
-        # Python calls to get processed.
-        VALID_TAGS = {tag: CodeQuery(__gs__).all_calls.where_name(tag).get() for tag in VALID_TAGS}
-        CALLABLE_TAGS = {}
-
-        ### GET VALID CALLABLE FUNCTIONS ###
-        callable_functions = (CodeQuery(__gs__).all_calls.where_name('LaunchDescription').get())[0].arguments
-        if not re.findall(r'\#(.*?)[\,\}]\s*',str(callable_functions)):
-            callable_functions = callable_functions[0].value
-            for call in callable_functions:
-                CALLABLE_TAGS[len(CALLABLE_TAGS)] = call
-            return CALLABLE_TAGS, __gs__
-        # Launch Description might have variables associated to tags.
-        for _callable in re.findall(r'\#(.*?)[\,\}]\s*',str(callable_functions)): 
-            scope = CodeQuery(__gs__).all_definitions.where_name(_callable).get()[0].scope
-            call, name = re.findall(r'\=.*?\]\s*(.*?)\((.*?)\)\s*$',str(scope))[0]
-            call = str(call).strip()
-            name = str(name).strip()
-            # TAG VALIDATION #
-            if call in VALID_TAGS:
-                if name == '':
-                        name = str(_callable).strip()
-                        CALLABLE_TAGS[str(_callable).strip()] = call  
-                call = list(filter(lambda n_call: str(_callable).strip() == str(n_call.parent.arguments[0].name.strip()), VALID_TAGS[call]))[0]
-                CALLABLE_TAGS[name] = call
-        return CALLABLE_TAGS, __gs__
+            with open(file, 'r') as f: content = f.read()
+        except OSError:
+            return []
+        return EvaluatorAST(content=content, file=file).evaluate() or []
 
     @staticmethod
-    def launch_py(calls={}, __gs__=None):
-        ARGS_TAGS={
-            'DeclareLaunchArgument',
-            'SetEnvironmentVariable'
-        }
-        if calls == {} or parser is None:
+    def launch_py(calls=[]):
+        if not calls:
             return False
 
-        arguments = list(filter(lambda call: calls[call].name == 'DeclareLaunchArgument', calls))
-        envs      = list(filter(lambda call: calls[call].name == 'SetEnvironmentVariable', calls))
-        nodes     = list(filter(lambda call: calls[call].name == 'Node', calls))
+        arguments = list(filter(lambda call: call.call == 'DeclareLaunchArgument', calls))
+        envs      = list(filter(lambda call: call.call == 'SetEnvironmentVariable', calls))
+        nodes     = list(filter(lambda call: call.call == 'Node', calls))
 
         # Processing...
-        for arg in arguments: ArgsCall.process_argument(call=calls[arg])
-        for env in envs     : ArgsCall.process_argument(call=calls[env])
-        for node in nodes   : NodeCall.process_node(call=calls[node])
+        for arg in arguments: ArgsCall.process_argument(action=arg)
+        for env in envs     : ArgsCall.process_argument(action=env)
+        for node in nodes   : NodeCall.process_node(action=node)
         return True
 
     "Main Launch-Parser."
     def parse(self):
         # Warner the user first...
-        print(f'[svROS] {color.color("BOLD", color.color("YELLOW", "WARNING:"))} Python Launch file parser might be deprecated due to complexity analysis.', f'{color.color("BOLD", color.color("UNDERLINE", "SUPPORTED TAGS"))} Node, LaunchConfiguration, SetEnvironmentVariable, DeclareLaunchArgument and LaunchDescription.')
+        print(f'[svROS] {color.color("BOLD", color.color("YELLOW", "WARNING:"))} Python Launch file parser might be deprecated due to complexity analysis.', f'{color.color("BOLD", color.color("UNDERLINE", "SUPPORTED TAGS"))} Node, LaunchConfiguration, SetEnvironmentVariable, DeclareLaunchArgument, IncludeLaunchDescription and LaunchDescription.')
         filename = self.file
-        
-        if not LauncherParserPY.validate_schema(file=filename, execute_cmd=(True,f'ros2 launch {filename} -p')):
-            return False
-        # Validate schema first... Note that workspace for ros launch packages must be given...
-        CALLABLE_TAGS = LauncherParserPY.validate_py_schema(file=filename, workspace=LauncherParserPY.get_launch_python_workspace())
-        if CALLABLE_TAGS[0] == {}:
-            return False
-        global_scope    = CALLABLE_TAGS[1]
-        CALLABLE_TAGS   = CALLABLE_TAGS[0]
-        # Here the idea is to capture all the possible tags that python launch might have.
-        if not LauncherParserPY.launch_py(calls=CALLABLE_TAGS, __gs__=global_scope):
+
+        if not LauncherParserPY.validate_schema(file=filename, strict=self.strict):
             return False
-        return True
-    
-    # Python workspace getter so that can parse launch file with python extension.
+        # Launch actions of the LaunchDescription returned, in order => parsed once, shared with include sites.
+        return svInclude.include(path=os.path.abspath(filename), configurations=None, jobs=self.jobs)
+
+    "Launch actions evaluation => own scope of arguments if included (configurations of the include site), shared one otherwise."
+    @staticmethod
+    def evaluate(calls, file, configurations=None, jobs=None):
+        scope = ArgsCall.ARGS, ArgsCall.BINDINGS
+        if configurations is not None:
+            ArgsCall.ARGS, ArgsCall.BINDINGS = {}, dict(configurations)
+            for name, value in configurations.items(): ArgsCall.init_argument(name=name, value=value)
+        try:
+            # Here the idea is to capture all the possible tags that python launch might have.
+            if not LauncherParserPY.launch_py(calls=calls):
+                return False
+            # Included files => parsed once (side by side), evaluated once per include site.
+            sites = [LauncherParserPY.include_site(action=call, file=file) for call in calls if call.call == 'IncludeLaunchDescription']
+            svInclude.load(paths=[path for path, _ in sites], jobs=jobs)
+            for path, bindings in sites:
+                if not svInclude.include(path=path, configurations={**ArgsCall.configurations(), **bindings}, jobs=jobs):
+                    return False
+            return True
+        finally:
+            ArgsCall.ARGS, ArgsCall.BINDINGS = scope
+
+    # IncludeLaunchDescription(source, launch_arguments=...) => (path, {arg: value}).
     @staticmethod
-    def get_launch_python_workspace():
-        ros_distro = os.getenv('ROS_DISTRO')
-        locate = f'/opt/ros2/{ros_distro}/lib'
-        workspace_path = os.getenv('PYTHONPATH').split(':')[::-1][0]
-        if not workspace_path.startswith(f'{locate}'):
-            return ''
-        if not workspace_path.endswith('/'):
-            workspace_path += workspace_path + '/'
-        return workspace_path
+    def include_site(action, file):
+        source = BaseCall.get_value(action, keyword='launch_description_source', position=0)
+        path   = svInclude.path(BaseCall.resolve(source), dirname=os.path.dirname(file))
+        if path is None:
+            raise svException(message=f'Failed to resolve included launch file in {file}.')
+        arguments = BaseCall.get_value(action, keyword='launch_arguments', position=1) or []
+        arguments = list(arguments.items()) if isinstance(arguments, dict) else arguments
+        bindings  = {}
+        for argument in arguments:
+            if not (isinstance(argument, (list, tuple)) and len(argument) == 2):
+                raise svException(message=f'Not a valid launch argument of included launch file {path}.')
+            name, value = BaseCall.resolve(argument[0]), BaseCall.resolve(argument[1])
+            if name is None or value is None:
+                raise svException(message=f'Failed to resolve argument {name} of included launch file {path}.')
+            bindings[name] = value
+        return path, bindings
 
     @staticmethod
     def decouple(structure):
@@ -496,4 +546,4 @@ if __name__ == "__main__":
     l = LauncherParserPY(file=file2).parse()
     print('==> NODES:', [NodeCall.NODES[n] for n in NodeCall.NODES])
     print('==> NODES names:', [NodeCall.NODES[n].name for n in NodeCall.NODES])
-    print('==> NODES remaps:', [NodeCall.NODES[n].remaps for n in NodeCall.NODES])
\ No newline at end of file
+    print('==> NODES remaps:', [NodeCall.NODES[n].remaps for n in NodeCall.NODES])
@@ -8,6 +8,9 @@ import xml.etree.ElementTree as ET
 from lark import Lark, tree, Token
 # InfoHandler => Prints, Exceptions and Warnings
 from .svInfo import color, svException, svWarning
+from .svParser import svParser
+from .svValidator import svValidator
+from .svInclude import svInclude
 
 global WORKDIR, SCHEMAS
 WORKDIR = os.path.dirname(__file__)
@@ -35,25 +38,10 @@ class BaseLaunchTag(object):
 
     @staticmethod
     def _arg_grammar(sentence='') -> (bool,str):
-        # Parsing Grammar.
-        grammar = """
-            sentence: /\$/ LP ARG NAME RP
-
-            LP: "("
-            RP: ")"
-            ARG: "var" | "env"
-            NAME: /[a-zA-Z0-9_\/\-.]+/
-            
-            %import common.WS
-            %ignore WS
-        """
-        parser = Lark(grammar, start='sentence', ambiguity='explicit')
-        try:
-                tree   = parser.parse(f'{sentence}')
-        except:
-                return '', ''
-        ARG = list(filter(lambda t: t.type == "ARG" , tree.children))[0].value
-        token = list(filter(lambda t: t.type == "NAME" , tree.children))[0].value
+        # Parsing Grammar => grammars/helpers.lark (launch_arg).
+        tree = svParser.parse(start='launch_arg', text=sentence)
+        if tree is None: return '', ''
+        ARG, token = tree.children[0].value, tree.children[1].value
         if str(ARG) == 'env': return 'set_env', token
         return 'arg', token
 
@@ -73,10 +61,12 @@ class BaseLaunchTag(object):
             if cond:
                 t,v = BaseLaunchTag._arg_grammar(cond)
                 if v == '' or t == '':
-                    return False
+                    # Literal condition (true/false/1/0).
+                    return ArgsTag.evaluate(cond) == bool(conditional == 'if')
+                reference = ReferenceIf(name=v, tag=t, condition=bool(conditional == 'if'))
                 if node_mode:
-                    return ArgsTag.ARGS[(v,t)].isTrue
-                return ReferenceIf(name=v, tag=t, condition=bool(cond=='if'))
+                    return ArgsTag.process_if_reference(reference)
+                return reference
         return True
     """ === Static Methods === """
 
@@ -125,6 +115,8 @@ class RemapTag(BaseLaunchTag):
 class NodeTag(BaseLaunchTag):
     NODES          = {}
     PACKAGES_NODES = {}
+    # Every node in launch order, repeated ones included => NODES only keeps the last one of each name.
+    LAUNCHED       = []
     CHILDREN = ("remap", "param")
     REQUIRED = ("pkg", "exec")
     """
@@ -143,6 +135,7 @@ class NodeTag(BaseLaunchTag):
         self.enclave    = enclave
         index = self.name
         NodeTag.NODES[index] = self
+        NodeTag.LAUNCHED.append(self)
         if self.package in NodeTag.PACKAGES_NODES: NodeTag.PACKAGES_NODES[self.package].add(self)
         else: NodeTag.PACKAGES_NODES[self.package] = {self}
 
@@ -156,7 +149,7 @@ class NodeTag(BaseLaunchTag):
             return None
         tag, value = BaseLaunchTag._arg_grammar(arg)
         if not (tag == '' or value == ''):
-            arg = ArgsTag.ARGS[(value, tag)].value
+            arg = ArgsTag.ARGS[ArgsTag.reference(value, tag)].value
             
         return arg
 
@@ -228,14 +221,10 @@ class NodeTag(BaseLaunchTag):
 
     @staticmethod
     def process_cmd_arg(tree, info_data, tag, enclave=False):
-        data = list(tree.find_data(info_data))
-        if data == []: return {}
-        output = {}
-        _data_ = data[len(data)-1]
-        if _data_:
-            output = list(map(lambda v: v.value , list(filter(lambda vv: str(vv.type) == tag, _data_.scan_values(lambda v: isinstance(v, Token))))))
-            if enclave == False:
-                output = list(zip(output[0::2], output[1::2]))
+        # Every occurrence, in the given order (e.g. -r a:=b -r c:=d).
+        output = [token.value for complete in tree.children[1:] for data in complete.children[1:] if data.data == info_data for token in data.children if token.type == tag]
+        if enclave == False:
+            output = list(zip(output[0::2], output[1::2]))
         return output
     
     "Grammar to parse inline node arguments."
@@ -244,32 +233,10 @@ class NodeTag(BaseLaunchTag):
         output = {}
         output['remaps'] = list()
             
-        # Grammar to parse arguments.
-        grammar = """
-            sentence: INIT complete?
-            complete: REMAP /\s/ arg_remap
-                    | ENCLAVE /\s/ arg_enclave
-                    | PARAMETER /\s/ arg_parameter
-
-            arg_remap: ARG_R ":=" ARG_R (/\s/ (arg_remap | complete))*
-            arg_enclave: ARG_E (/\s/ complete)*
-            arg_parameter: ARG_P ":=" ARG_P (/\s/ (arg_parameter | complete))*
-
-            INIT: "--ros-args"
-            REMAP:"--remap" | "-r"
-            ENCLAVE: "--enclave" | "-e"
-            PARAMETER: "--parameter" | "-p"
-
-            ARG_R:/(?!\:\=)[a-zA-Z0-9_\/\-.]+/
-            ARG_E:/(?!\s)[a-zA-Z0-9_\/\-.]+/
-            ARG_P:/(?!\:\=)[a-zA-Z0-9_\/\-.]+/
-
-            %import common.WS
-            %ignore WS
-        """
-        parser = Lark(grammar, start='sentence', ambiguity='explicit')
-        tree = parser.parse(f'{args}')
-        
+        # Grammar to parse arguments => grammars/helpers.lark (cmd_args).
+        tree = svParser.parse(start='cmd_args', text=args)
+        if tree is None: raise svException(f'Failed to parse node arguments {args}.')
+
         remaps  = NodeTag.process_cmd_arg(tree=tree, info_data="arg_remap", tag='ARG_R')
         enclave = NodeTag.process_cmd_arg(tree=tree, info_data="arg_enclave", tag='ARG_E', enclave=True)
         enclave = next(iter(enclave or []), None)
@@ -293,6 +260,10 @@ class NodeTag(BaseLaunchTag):
 "ROS2-based arguments that Nodes instances might use."
 class ArgsTag(BaseLaunchTag):
     ARGS         = {}
+    # Values given by the include site => they win over the default of an <arg> with the same name.
+    BINDINGS     = {}
+    # Launch configurations of the include site => lowest tier, any local <arg>/<let> with the same name overrides them.
+    INHERITED    = 'inherited'
     REQUIRED = ("name", r"(default|value)")
     """
         ArgTag
@@ -302,12 +273,14 @@ class ArgsTag(BaseLaunchTag):
                 \_ conditionals n references
             \_ set_env
                 \_ conditionals n references
+            \_ inherited => configurations of the include site, referenced only if no local arg/let has the name
+            \_ resolution => topological order of the references, values and conditionals resolved once (cycles are errors)
     """
     def __init__(self, name, tag, value, valid):
         self.name         = name
         self.tag          = tag
         self.value        = value
-        self.valid        = [valid]
+        self.valid        = valid
         self.isTrue       = True
         ArgsTag.ARGS[(name, tag)] = self
 
@@ -322,7 +295,7 @@ class ArgsTag(BaseLaunchTag):
   
         value = arg.get('value')
         if tag == 'arg':
-            value = arg.get('default')
+            value = ArgsTag.BINDINGS.get(arg.get('name'), arg.get('default'))
         t,v = BaseLaunchTag._arg_grammar(value)
         if not (v == '' or t == ''):
             value = ReferenceVar(name=v, tag=t)
@@ -344,63 +317,89 @@ class ArgsTag(BaseLaunchTag):
                 valid = True
         return ArgsTag.init_argument(name, tag, value, valid)
 
+    "Dependency graph => every argument resolved once, after the arguments its value and conditional refer to."
     @classmethod
     def process_valid_arguments(cls):
-        for argument in cls.ARGS:
-            element       = cls.ARGS[argument]
-            element.value = cls.process_var_reference(element)
-            cls.process_if_reference(element)
-            cls.process_valid(element)
+        for argument in cls.topological_order():
+            element        = cls.ARGS[argument]
+            element.value  = cls.process_var_reference(element)
+            element.isTrue = cls.process_valid(element)
         return True
 
+    # $(var name) => arg, or let if there is no such arg, or the value inherited from the include site.
     @staticmethod
-    def process_if_reference(argument):
-        if isinstance(argument.valid[0], ReferenceIf):
-            (name, tag, condition) = (argument.valid[0].name, argument.valid[0].tag, argument.valid[0].condition)
-            reference = ArgsTag.ARGS.get((name,tag))
-            if tag == 'arg':
-                if reference is None:
-                    tag = 'let'
-                    reference = ArgsTag.ARGS.get((name,tag))
-            argument.valid.append(ArgsTag.process_if_reference(reference))
-        else:
-            return bool(argument.valid[0] == ArgsTag.evaluate(argument.value))
-        
+    def reference(name, tag):
+        if (name, tag) not in ArgsTag.ARGS and tag == 'arg':
+            tag = 'let' if (name, 'let') in ArgsTag.ARGS else ArgsTag.INHERITED
+        if (name, tag) not in ArgsTag.ARGS:
+            raise svException(message=f'Not a valid Launch Arg: {name}.')
+        return (name, tag)
+
+    # $(var name) inside any other string => resolved value, None if there is none.
+    @staticmethod
+    def lookup(name):
+        try:
+            value = ArgsTag.ARGS[ArgsTag.reference(name, 'arg')].value
+        except svException:
+            return None
+        return value if isinstance(value, str) else None
+
+    # Launch configurations an included file starts from => let over arg over inherited, valid ones only.
+    @staticmethod
+    def configurations():
+        return {name: argument.value for order in (ArgsTag.INHERITED, 'arg', 'let') for (name, tag), argument in ArgsTag.ARGS.items() if tag == order and argument.isTrue and isinstance(argument.value, str)}
+
+    @staticmethod
+    def dependencies(element):
+        return [ArgsTag.reference(reference.name, reference.tag) for reference in (element.value, element.valid) if isinstance(reference, (ReferenceVar, ReferenceIf))]
+
+    # Iterative depth-first search => deep chains never reach the recursion limit, back edges are cycles.
+    @classmethod
+    def topological_order(cls):
+        order, state = [], {}
+        for root in cls.ARGS:
+            if root in state: continue
+            state[root], stack = 'visiting', [(root, iter(cls.dependencies(cls.ARGS[root])))]
+            while stack:
+                argument, pending = stack[-1]
+                dependency = next(pending, None)
+                if dependency is None:
+                    stack.pop()
+                    state[argument] = 'resolved'
+                    order.append(argument)
+                elif state.get(dependency) == 'visiting':
+                    path  = [visiting for visiting, _ in stack]
+                    cycle = ' -> '.join(name for name, _ in path[path.index(dependency):] + [dependency])
+                    raise svException(message=f'Launch Args reference each other in a cycle: {cycle}.')
+                elif dependency not in state:
+                    state[dependency] = 'visiting'
+                    stack.append((dependency, iter(cls.dependencies(cls.ARGS[dependency]))))
+        return order
+
+    # Conditional holds => referenced argument is itself valid and its (resolved) value matches if/unless.
+    @staticmethod
+    def process_if_reference(reference):
+        argument = ArgsTag.ARGS[ArgsTag.reference(reference.name, reference.tag)]
+        return argument.isTrue and ArgsTag.evaluate(argument.value) == reference.condition
+
     @staticmethod
     def process_valid(argument):
-        boolean_temp = argument.isTrue
-        for condition in argument.valid:
-            if not isinstance(condition, bool):
-                (name, tag, condition) = (condition.name, condition.tag, condition.condition)
-                if tag == 'arg':
-                    reference = ArgsTag.ARGS.get((name,tag))
-                    if reference is None:
-                        tag = 'let'
-                condition = bool(ArgsTag.ARGS[(name,tag)] == condition)
-            boolean_temp = condition and boolean_temp
-            if boolean_temp == False:
-                break
-        argument.isTrue = boolean_temp
-        return True
+        if isinstance(argument.valid, ReferenceIf):
+            return ArgsTag.process_if_reference(argument.valid)
+        return bool(argument.valid)
 
+    # Referenced arguments come first in the order => their value is already resolved.
     @staticmethod
     def process_var_reference(element):
         if isinstance(element.value, ReferenceVar):
-            reference = element.value
-
-            if (reference.name, reference.tag) not in ArgsTag.ARGS:
-                if reference.tag == 'arg':
-                    if (reference.name, 'let') not in ArgsTag.ARGS:
-                        raise svException(message=f'Not a valid Launch Arg.')
-                    reference.tag = 'let'
-            value = ArgsTag.process_var_reference(element=ArgsTag.ARGS[(reference.name, reference.tag)])
-        else:
-            value = element.value
-        return value
+            return ArgsTag.ARGS[ArgsTag.reference(element.value.name, element.value.tag)].value
+        return element.value
 
     @staticmethod
     def evaluate(value):
         returning_boolean = None
+        if not isinstance(value, str):
+            return returning_boolean
         if value.capitalize() in ['True', 'False', '0', '1']:
             returning_boolean = False
             if value.capitalize() in ['True', '1']:
@@ -408,7 +407,7 @@ class ArgsTag(BaseLaunchTag):
         return returning_boolean
 
 """ 
-    SCHEMA that ros2 provides is deprecated also... So we'll try to run ros2 launch -p instead: => ros2 launch $file -p
+    SCHEMA that ros2 provides is deprecated also... schemas/launch.xsd keeps it up to date with the supported tags, ros2 launch -p is only run if strict.
 """
 "Launcher parser in order to retrieve information about possible executables..."
 @dataclass
@@ -418,49 +417,76 @@ class LauncherParserXML:
         "node": NodeTag,
         "remap": RemapTag,
         "arg/let/set_env": ArgsTag,
+        "include": svInclude,
     }
     file      : str
+    strict    : bool = False
+    jobs      : int  = None
     """ === Predifined Functions === """
     @staticmethod
-    def validate_schema(file, schema, execute_cmd=(False, '')):
-        # Due to the depecrated xml file, the user might opt to check syntax through execution commands.
-        if execute_cmd[0] == True:
-            cmd = execute_cmd[1].split(' ')
-            try:
-                subprocess.check_call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
-            except Exception as error:
-                return False
-        else:
-            # Schema Routines.
-            xml_schema = xmlschema.XMLSchema(schema)        
-            try:
-                xml_schema.validate(file)
-            except Exception as error:
-                return False
-        return True
+    def validate_schema(file, schema, strict=False):
+        # Schema Routines => in-process, cached per file. The user might opt to also check syntax through ros2 launch -p (strict).
+        valid, reason = svValidator.validate(file=file, schema=schema, strict=strict)
+        if not valid:
+            print(f'[svROS] {color.color("BOLD", color.color("RED", "INVALID LAUNCH FILE"))} {file}: {reason}')
+        return valid
 
     "Main Launch-Parser."
     def parse(self):
         # Warn the user first...
-        print(f'[svROS] {color.color("BOLD", color.color("YELLOW", "WARNING"))} XML-Launch file parser might be deprecated due to complexity analysis.', f'{color.color("BOLD", color.color("UNDERLINE", "SUPPORTED TAGS"))} Node, Let, Arg, SetEnv, Remaps, If and Unless Conditionals.')
+        print(f'[svROS] {color.color("BOLD", color.color("YELLOW", "WARNING"))} XML-Launch file parser might be deprecated due to complexity analysis.', f'{color.color("BOLD", color.color("UNDERLINE", "SUPPORTED TAGS"))} Node, Let, Arg, SetEnv, Include, Remaps, If and Unless Conditionals.')
         filename = self.file
 
-        if not LauncherParserXML.validate_schema(file=filename, schema=f'{SCHEMAS}/launch.xsd', execute_cmd=(True,f'ros2 launch {filename} -p')):
+        if not LauncherParserXML.validate_schema(file=filename, schema=f'{SCHEMAS}/launch.xsd', strict=self.strict):
             return False
-        tree = ET.parse(filename)
-        root = tree.getroot()
+        return svInclude.include(path=os.path.abspath(filename), configurations=None, jobs=self.jobs)
+
+    "Launch tree evaluation => own scope of arguments if included (configurations of the include site), shared one otherwise."
+    @staticmethod
+    def evaluate(root, file, configurations=None, jobs=None):
         if not root.tag == "launch":
             return False
-        arguments = root.findall('./let') + root.findall('./set_env') + root.findall('./arg')
-        nodes     = root.findall('./node')
+        scope = ArgsTag.ARGS, ArgsTag.BINDINGS
+        if configurations is not None:
+            ArgsTag.ARGS, ArgsTag.BINDINGS = {}, dict(configurations)
+            for name, value in configurations.items(): ArgsTag.init_argument(name=name, tag=ArgsTag.INHERITED, value=value, valid=True)
+        try:
+            arguments = root.findall('./let') + root.findall('./set_env') + root.findall('./arg')
+            nodes     = root.findall('./node')
+            includes  = root.findall('./include')
+
+            # Processing...
+            for arg  in arguments: ArgsTag.process_argument(argument=arg)
+            if not ArgsTag.process_valid_arguments():
+                return False
+            for node in nodes    : NodeTag.process_node(node=node)
+            # Included files => parsed once (side by side), evaluated once per include site.
+            sites = [site for site in map(lambda include: LauncherParserXML.include_site(include=include, file=file), includes) if site is not None]
+            svInclude.load(paths=[path for path, _ in sites], jobs=jobs)
+            for path, bindings in sites:
+                if not svInclude.include(path=path, configurations={**ArgsTag.configurations(), **bindings}, jobs=jobs):
+                    return False
+            return True
+        finally:
+            ArgsTag.ARGS, ArgsTag.BINDINGS = scope
+
+    # <include file="..."> => (path, {arg: value}), None if its conditionals do not hold.
+    @staticmethod
+    def include_site(include, file):
+        if not BaseLaunchTag.set_conditionals(include, node_mode=True):
+            return None
+        dirname = os.path.dirname(file)
+        path    = svInclude.path(svInclude.substitute(include.get('file'), dirname=dirname, lookup=ArgsTag.lookup), dirname=dirname)
+        if path is None:
+            raise svException(message=f'Failed to resolve included launch file {include.get("file")}.')
+        bindings = {}
+        for arg in include.findall('./arg'):
+            value = svInclude.substitute(arg.get('value'), dirname=dirname, lookup=ArgsTag.lookup)
+            if arg.get('name') is None or value is None:
+                raise svException(message=f'Failed to resolve argument {arg.get("name")} of included launch file {path}.')
+            bindings[arg.get('name')] = value
+        return path, bindings
 
-        # Processing...
-        for arg  in arguments: ArgsTag.process_argument(argument=arg)
-        if not ArgsTag.process_valid_arguments():
-            return False
-        for node in nodes    : NodeTag.process_node(node=node)
-        return True 
-    
     @staticmethod
     def decouple(structure):
         if structure is not None:
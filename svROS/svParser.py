@@ -0,0 +1,86 @@
+import os, hashlib, threading
+from lark import Lark
+from lark.exceptions import UnexpectedInput, VisitError
+from .grammars import HELPERS, STARTS
+
+global GRAMMARS
+GRAMMARS = os.path.join(os.path.expanduser("~"), ".svROS", ".bin", "grammars")
+
+"""
+    This file contains the registry of compiled Lark parsers shared by every svROS grammar.
+    Each grammar is built once per process; LALR tables are also kept on disk, so later runs skip grammar analysis.
+"""
+"Registry of compiled parsers, one per (grammar, start, options)."
+class svParser(object):
+    PARSERS = {}
+    LOCK    = threading.Lock()
+    # Text that does not parse, and transformer errors => lark's own classes, plus the copies inside helpers.py once it is loaded.
+    UNEXPECTED = (UnexpectedInput,)
+    VISIT      = (VisitError,)
+    """
+        svParser
+            \_ get       => compiled parser (built on first use)
+            \_ transform => parse with a shared parser, then apply a per-call transformer
+            \_ cache     => ~/.svROS/.bin/grammars/<sha256>.lark (LALR only)
+            \_ helpers   => stand-alone LALR parser of grammars/helpers.lark (one start symbol per helper grammar), generated when building
+    """
+    @classmethod
+    def get(cls, grammar, start, parser='lalr', **options):
+        key = (grammar, start, parser, tuple(sorted(options.items())))
+        with cls.LOCK:
+            if key not in cls.PARSERS:
+                cls.PARSERS[key] = Lark(grammar, start=start, parser=parser, cache=cls.cache(key=key) if parser == 'lalr' else False, **options)
+            return cls.PARSERS[key]
+
+    # On-disk tables => only where the directory can be written, Lark checks the grammar itself when loading.
+    @staticmethod
+    def cache(key):
+        try:
+            os.makedirs(GRAMMARS, exist_ok=True)
+        except OSError:
+            return False
+        if not os.access(GRAMMARS, os.W_OK): return False
+        return os.path.join(GRAMMARS, hashlib.sha256(repr(key).encode()).hexdigest() + '.lark')
+
+    # Generated module (setup.py build_py) => no grammar analysis at all, helpers.lark is only compiled if the module is missing or stale.
+    @classmethod
+    def helpers(cls):
+        with cls.LOCK:
+            if 'helpers' not in cls.PARSERS:
+                cls.PARSERS['helpers'] = cls.standalone()
+        return cls.PARSERS['helpers']
+
+    @classmethod
+    def standalone(cls):
+        with open(HELPERS, 'rb') as f: digest = hashlib.sha256(f.read()).hexdigest()
+        try:
+            from .grammars import helpers
+            if helpers.GRAMMAR_DIGEST == digest:
+                cls.UNEXPECTED, cls.VISIT = (UnexpectedInput, helpers.UnexpectedInput), (VisitError, helpers.VisitError)
+                return helpers.Lark_StandAlone()
+        except (ImportError, AttributeError):
+            pass
+        with open(HELPERS, 'r') as f:
+            grammar = f.read()
+        return Lark(grammar, start=STARTS, parser='lalr', cache=cls.cache(key=(grammar, tuple(STARTS), 'lalr')))
+
+    # Helper grammars are deterministic => a tree, or None if the text does not parse (any other error is raised).
+    @classmethod
+    def parse(cls, start, text):
+        parser = cls.helpers()
+        try:
+            return parser.parse(f'{text}', start=start)
+        except cls.UNEXPECTED:
+            return None
+        except cls.VISIT as error:
+            raise error.orig_exc
+
+    # Per-call state (e.g. node and text of a property) lives in the transformer, never in the shared parser.
+    @classmethod
+    def transform(cls, grammar, start, text, transformer, **options):
+        tree = cls.get(grammar=grammar, start=start, **options).parse(text)
+        try:
+            return transformer.transform(tree)
+        except VisitError as error:
+            # Same exceptions as an inline transformer would raise.
+            raise error.orig_exc
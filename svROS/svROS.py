@@ -108,6 +108,9 @@ class ProjectParser:
     ros_workspace   : str  
     content         : dict    = field(default_factory=dict)   
     log             : logging.getLogger() = None 
+    jobs            : int     = None
+    colcon          : bool    = False
+    strict          : bool    = False
     SCHEMA          : str     = """
 {   
     'project': {
@@ -129,7 +132,7 @@ class ProjectParser:
     # Export using svExport meta classes
     def export(self, default=True):
         if default:
-            export = svrosExport(launch=self.content['launch'], project_dir=self.project_path, project=self.project, ros_distro=self.ros_distro, ros_workspace=self.ros_workspace)
+            export = svrosExport(launch=self.content['launch'], project_dir=self.project_path, project=self.project, ros_distro=self.ros_distro, ros_workspace=self.ros_workspace, jobs=self.jobs, colcon=self.colcon, strict=self.strict)
             if not export.launch_export():
                 raise svException(message='Failed to parse input file and its launch files.')
         return True
@@ -294,6 +297,9 @@ class svEXPORT:
     can_export : bool     = False
     reset      : bool     = False
     ros        : str      = ''
+    jobs       : int      = None
+    colcon     : bool     = False
+    strict     : bool     = False
     log        : logging.getLogger() = None
 
     def __post_init__(self):
@@ -395,7 +401,7 @@ class svEXPORT:
             return False
         # Call another class instance => Project Parser <=
         ros_version, ros_distro, ros_workspace = self._get_ros_info()
-        project_parser = ProjectParser(content=content, log=self.log, ros_distro=ros_distro, ros_workspace=ros_workspace)
+        project_parser = ProjectParser(content=content, log=self.log, ros_distro=ros_distro, ros_workspace=ros_workspace, jobs=self.jobs, colcon=self.colcon, strict=self.strict)
         project_name   = project_parser.project.capitalize()
         # Project directory validater.
         exists, valid_config = self._exists_project_dir(project_name)
@@ -443,6 +449,11 @@ class svRUN:
     _PROJECTS : str
     _DIR      : str      = os.path.join(os.path.expanduser("~"), ".svROS")
     can_run   : bool     = False
+    jobs      : int      = 1
+    timeout   : float    = None
+    memory    : str      = None
+    batch     : bool     = False
+    solver    : str      = None
     log       : logging.getLogger() = None
 
     def __post_init__(self):
@@ -484,12 +495,12 @@ class svRUN:
 
     def _analyze(self):
         project_extractor = svProjectExtractor(project=self.project, PROJECT_DIR=self.project_path)
-        project_analyzer  = svAnalyzer(EXTRACTOR=project_extractor, MODELS_DIR=self._BIN, MODE=1)
-        # VERIFYING SROS
-        # _continue_ = input(svWarning(f'Perform verification of SROS model... [N/y] ')).strip()
-        # if _continue_ in ['y', 'Y']:
-        #     if not project_analyzer.alloy_sros():
-        #        raise svException('Could not initiate running of project => ANALYZER FAILED.')
+        project_analyzer  = svAnalyzer(EXTRACTOR=project_extractor, MODELS_DIR=self._BIN, MODE=1, JOBS=self.jobs, TIMEOUT=self.timeout, MEMORY=self.memory, BATCH=self.batch, SOLVER=self.solver)
+        # VERIFYING SROS => conflicting privileges found in-process when launching, Alloy only if the user asks for it.
+        _continue_ = 'y' if os.path.isfile(f'{self.project_path}data/sros.json') else input(svWarning(f'Perform verification of SROS model... [N/y] ')).strip()
+        if _continue_ in ['y', 'Y']:
+            if not project_analyzer.alloy_sros():
+                raise svException('Could not initiate running of project => ANALYZER FAILED.')
         # VERIFYING ROS
         _continue_ = input(svWarning(f'MODEL-CHECKING VERIFICATION MODEL... [Y/n] ')).strip()
         if not _continue_ in ['y',"", 'Y']: return
@@ -526,8 +537,11 @@ class Launcher:
             '-> optional:
                 --force-init => Force creation of svROS dir           
                 --reset      => Reset project directory 
+                -j (--jobs)  => Source files extracted in parallel
+                --colcon     => Find packages with colcon list
+                --strict     => Also check launch files with ros2 launch -p
         => svROS launch  -p $project
-        => svROS analyze -p $project
+        => svROS analyze -p $project [ , -j $jobs, -t $timeout, -m $memory, -s $solver, --batch]
     """
     # ROS2 environment variables.
     distro      : str
@@ -718,16 +732,19 @@ class Launcher:
             self.log.info(f'Failed to export file {args.file}.')
             return False
 
-        export = svEXPORT(file=args.file, FILE_PATH=os.path.abspath(args.file), _DIR=self._DIR, _BIN=self._BIN, _PROJECTS=self._PROJECTS, can_export=init, reset=args.reset, log=self.log, ros=rf'{self.ros_version}=\t={self.distro}=\t={self.workspace}')
+        export = svEXPORT(file=args.file, FILE_PATH=os.path.abspath(args.file), _DIR=self._DIR, _BIN=self._BIN, _PROJECTS=self._PROJECTS, can_export=init, reset=args.reset, jobs=args.jobs, colcon=args.colcon, strict=args.strict, log=self.log, ros=rf'{self.ros_version}=\t={self.distro}=\t={self.workspace}')
         print(f'[svROS] EXPORTING file {color.color("BOLD", color.color("ORANGE", args.file))} into a project: Setup operation.')
         self.log.info(f"Exporting file {args.file} into a project: Setup operation.")
         return export._default_export()
         
-    # => svROS export -f (--file) $file [, --force-init, --reset] (optional)
+    # => svROS export -f (--file) $file [, --force-init, --reset, -j (--jobs) $jobs, --colcon, --strict] (optional)
     def _export(self, parser):
         parser.add_argument("-f", "--file",  help = "Provide yaml-based file.", required=True)
         parser.add_argument("--force-init",  help = "Force creation of svROS directory, if not created.", action="store_true")
         parser.add_argument("--reset",  help = "Reset the project directory, if it already exists.", action="store_true")
+        parser.add_argument("-j", "--jobs", help = "Number of source files extracted concurrently -> default: number of CPU cores.", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--colcon", help = "Find ROS2 packages with colcon list instead of the built-in scanner.", action="store_true")
+        parser.add_argument("--strict", help = "Also check each launch file with ros2 launch -p, after the built-in validation.", action="store_true")
         parser.set_defaults(func = self.command_export)
 
     # Handler svROS launch
@@ -767,15 +784,20 @@ class Launcher:
             self.log.info(f'Failed to run {args.project}...')
             return False
         
-        run = svRUN(project=args.project.capitalize(), _DIR=self._DIR, _BIN=self._BIN, _PROJECTS=self._PROJECTS, can_run=init, log=self.log)
+        run = svRUN(project=args.project.capitalize(), _DIR=self._DIR, _BIN=self._BIN, _PROJECTS=self._PROJECTS, can_run=init, jobs=args.jobs, timeout=args.timeout, memory=args.memory, batch=args.batch, solver=args.solver, log=self.log)
         project_name = args.project.capitalize()
         self.log.info(f'Analyzing svROS Project => {project_name}.')
         print(f'[svROS] ANALYZING svROS :: Project {color.color("BOLD", color.color("ORANGE", project_name))}')
         return run._analyze()
 
-    # => svROS analyze -p (--project) $project
+    # => svROS analyze -p (--project) $project [, -j (--jobs) $jobs, -t (--timeout) $seconds, -m (--memory) $heap, -s (--solver) $solver, --batch] (optional)
     def _analyze(self, parser):
         parser.add_argument("-p", "--project", help = "Provide a project to be analyzed.", required=True)
+        parser.add_argument("-j", "--jobs", help = "Number of properties checked concurrently -> default: number of CPU cores.", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("-t", "--timeout", help = "Seconds allowed per property before it is reported as UNKNOWN -> default: configurations/model/timeout.", type=float, default=None)
+        parser.add_argument("-m", "--memory", help = "Maximum JVM heap per Alloy process, e.g. 4g -> default: configurations/model/memory.", type=str, default=None)
+        parser.add_argument("-s", "--solver", help = "SAT solver: minisatprover, minisat, glucose, sat4j or portfolio (first answer wins) -> default: configurations/model/solver.", type=str, default=None)
+        parser.add_argument("--batch", help = "Solve every property in a single Alloy invocation instead of long-lived processes.", action="store_true")
         parser.set_defaults(func = self.command_analyze)
     """ === Launcher functions === """
 
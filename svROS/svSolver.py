@@ -0,0 +1,351 @@
+import os, subprocess, json, queue, hashlib, shutil, re, glob, tempfile, threading
+from concurrent.futures import ThreadPoolExecutor
+# InfoHandler => Prints, Exceptions and Warnings
+from .svInfo import color, svException, svWarning, svInfo
+
+global GENERATOR, GENERATED_MODELS, SOLVERS, PORTFOLIO
+GENERATOR        = os.path.join(os.path.expanduser("~"), ".svROS", ".bin", "generator.jar")
+GENERATED_MODELS = os.path.join(tempfile.gettempdir(), "generated_models")
+# SAT backends known by the generator => portfolio races sat4j, minisat and glucose, first answer wins.
+SOLVERS          = ['minisatprover', 'minisat', 'glucose', 'sat4j', 'portfolio']
+PORTFOLIO        = ['sat4j', 'minisat', 'glucose']
+
+"""
+    This file contains the necessary classes and methods to talk to the Alloy generator (generator.jar).
+    Instead of paying JVM startup and model parsing for every check command, a single generator process is kept alive
+    (java -jar generator.jar --daemon) and fed one command per line, keeping the parsed model resident across commands.
+"""
+"Long-lived Alloy generator process."
+class svSolver(object):
+    """
+        svSolver
+            \_ request  => action=solve<TAB>file=...<TAB>output=...<TAB>property=...[<TAB>solver=...]
+            \_ answer   => {"property": ..., "command": ..., "outcome": SAT | UNSAT | UNKNOWN | ERROR, "file": ..., "message": ...}
+            \_ limits   => timeout (seconds, per property) and memory (JVM heap, e.g. 4g)
+    """
+    def __init__(self, jar=GENERATOR, timeout=None, memory=None, solver=None):
+        self.jar, self.timeout, self.memory, self.process, self.lines = jar, timeout, memory, None, None
+        self.solver, self.cancelled = solver, False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        if self.alive: return True
+        if self.cancelled: raise svException('Alloy generator run cancelled.')
+        if not os.path.isfile(self.jar):
+            raise svException(f'Alloy generator not found in {self.jar}: run {color.color("BOLD", "$ svROS init --reset")}.')
+        command = ['java'] + ([f'-Xmx{self.memory}'] if self.memory else []) + ['-jar', self.jar, '--daemon']
+        try:
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, universal_newlines=True, bufsize=1)
+        except OSError:
+            raise svException('Failed to start the Alloy generator: Java must be available in PATH.')
+        # Cancelled while starting => cancel() may have found no process to kill yet.
+        if self.cancelled:
+            self.kill()
+            raise svException('Alloy generator run cancelled.')
+        # Answers are read on a separate thread, so waiting for one can time out.
+        self.lines = queue.Queue()
+        threading.Thread(target=svSolver.reader, args=(self.process.stdout, self.lines), daemon=True).start()
+        if self.receive().get('status') != 'READY':
+            self.stop()
+            raise svException('Alloy generator failed to start.')
+        return True
+
+    @staticmethod
+    def reader(stream, lines):
+        for line in stream: lines.put(line)
+        lines.put(None)
+
+    def stop(self):
+        if self.process is None: return True
+        if self.alive:
+            try:
+                self.send(action='quit')
+                self.process.wait(timeout=5)
+            except (svException, subprocess.TimeoutExpired):
+                self.kill()
+        self.process = None
+        return True
+
+    # Timeout or lost race => the process is killed, a fresh one is started on the next property.
+    def kill(self):
+        process = self.process
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+        self.process = None
+        return True
+
+    # Ctrl-C => killed for good, never started again.
+    def cancel(self):
+        self.cancelled = True
+        return self.kill()
+
+    def send(self, **request):
+        process = self.process
+        if process is None:
+            raise svException('Alloy generator stopped unexpectedly.')
+        try:
+            process.stdin.write('\t'.join([f'{key}={value}' for key, value in request.items()]) + '\n')
+            process.stdin.flush()
+        except OSError:
+            raise svException('Alloy generator stopped unexpectedly.')
+
+    def receive(self, timeout=None):
+        line = self.lines.get(timeout=timeout)
+        if not line:
+            self.process = None
+            raise svException('Alloy generator stopped unexpectedly.')
+        return json.loads(line)
+
+    def solve(self, file, prop, output):
+        self.request(file=file, prop=prop, output=output)
+        return self.answer(prop=prop)
+
+    def request(self, file, prop, output):
+        self.start()
+        self.send(action='solve', file=file, output=output, property=prop, **({'solver': self.solver} if self.solver else {}))
+
+    def answer(self, prop):
+        try:
+            answer = self.receive(timeout=self.timeout)
+        except queue.Empty:
+            self.kill()
+            return {'property': prop, 'outcome': 'UNKNOWN', 'message': 'timeout'}
+        # An exhausted heap leaves the JVM in no shape to go on.
+        if answer.get('outcome') == 'UNKNOWN': self.kill()
+        return answer
+
+"One generator process per SAT backend racing on the same property: the first definite answer wins, the others are killed."
+class svPortfolio(object):
+    """
+        svPortfolio
+            \_ backends => PORTFOLIO, each a warm svSolver (model parsed once per backend, kept across properties)
+            \_ winner   => first SAT/UNSAT answer, losers are killed and restarted lazily on the next property
+            \_ output   => <output>/<property>-<backend>, only the winner's directory is kept
+    """
+    def __init__(self, jar=GENERATOR, timeout=None, memory=None, backends=PORTFOLIO):
+        self.solvers = {backend: svSolver(jar=jar, timeout=timeout, memory=memory, solver=backend) for backend in backends}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def alive(self):
+        return any(solver.alive for solver in self.solvers.values())
+
+    def stop(self):
+        for solver in self.solvers.values(): solver.stop()
+        return True
+
+    def kill(self):
+        for solver in self.solvers.values(): solver.kill()
+        return True
+
+    def cancel(self):
+        for solver in self.solvers.values(): solver.cancel()
+        return True
+
+    @staticmethod
+    def run(solver, backend, prop, answers):
+        try:
+            answer = solver.answer(prop=prop)
+        except svException as error:
+            answer = {'property': prop, 'outcome': 'ERROR', 'message': error.message}
+        answers.put((backend, answer))
+
+    def solve(self, file, prop, output):
+        # Every backend is up and has the property before the race => a killed loser only ever stops waiting, it never restarts mid-race.
+        with ThreadPoolExecutor(max_workers=len(self.solvers)) as executor:
+            list(executor.map(lambda solver: solver.start(), self.solvers.values()))
+        answers, threads, directories = queue.Queue(), {}, {}
+        for backend, solver in self.solvers.items():
+            directories[backend] = os.path.join(output, f'{prop}-{backend}')
+            solver.request(file=file, prop=prop, output=directories[backend])
+        for backend, solver in self.solvers.items():
+            threads[backend] = threading.Thread(target=svPortfolio.run, args=(solver, backend, prop, answers), daemon=True)
+            threads[backend].start()
+        winner, first = None, None
+        for _ in range(len(threads)):
+            backend, answer = answers.get()
+            first = first or (backend, answer)
+            if answer.get('outcome') in ('SAT', 'UNSAT'):
+                winner = (backend, answer)
+                break
+        # No definite answer => the first one received (UNKNOWN or ERROR) stands.
+        backend, answer = winner or first
+        for loser, solver in self.solvers.items():
+            if loser != backend and threads[loser].is_alive(): solver.kill()
+        for thread in threads.values(): thread.join()
+        for loser, directory in directories.items():
+            if loser != backend: shutil.rmtree(directory, ignore_errors=True)
+        return dict(answer, solver=answer.get('solver', backend))
+
+"Pool of generator processes, each solving independent properties into its own output directory."
+class svSolverPool(object):
+    """
+        svSolverPool
+            \_ daemon => jobs warm generator processes, one property at a time each
+            \_ batch  => a single generator invocation per call (model parsed once, jobs threads), no long-lived process
+            \_ portfolio => every daemon slot is an svPortfolio (one process per backend), not available in batch
+    """
+    def __init__(self, jobs=None, jar=GENERATOR, timeout=None, memory=None, batch=False, solver=None):
+        self.jobs, self.jar, self.timeout, self.memory = max(1, jobs or os.cpu_count() or 1), jar, timeout, memory
+        self.batch, self.solver = batch, solver
+        if self.batch and self.solver == 'portfolio':
+            raise svException('The portfolio solver races one generator process per backend: it cannot be combined with --batch.')
+        self.solvers, self.cancelled = [], False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        for solver in self.solvers: solver.stop()
+        return True
+
+    # Solvers are started lazily and kept warm between calls.
+    def workers(self, count):
+        while len(self.solvers) < min(self.jobs, count):
+            if self.solver == 'portfolio':
+                self.solvers.append(svPortfolio(jar=self.jar, timeout=self.timeout, memory=self.memory))
+            else:
+                self.solvers.append(svSolver(jar=self.jar, timeout=self.timeout, memory=self.memory, solver=self.solver))
+        return self.solvers[:min(self.jobs, count)]
+
+    def solve(self, file, properties, output):
+        if not properties: return {}
+        if self.batch: return self.solve_batch(file=file, properties=properties, output=output)
+        idle, solvers = queue.Queue(), self.workers(count=len(properties))
+        for index, solver in enumerate(solvers): idle.put((index, solver))
+        def work(prop):
+            index, solver = idle.get()
+            try:
+                # Checked once a process is free => properties still queued when Ctrl-C was pressed never restart a killed one.
+                if self.cancelled: return {'property': prop, 'outcome': 'UNKNOWN', 'message': 'cancelled'}
+                return solver.solve(file=file, prop=prop, output=os.path.join(output, f'worker-{index}'))
+            except svException as error:
+                return {'property': prop, 'outcome': 'ERROR', 'message': error.message}
+            finally:
+                idle.put((index, solver))
+        executor = ThreadPoolExecutor(max_workers=len(solvers))
+        try:
+            answers = list(executor.map(work, properties))
+        except KeyboardInterrupt:
+            # Ctrl-C => every running solver is killed, nothing else gets started.
+            self.cancelled = True
+            for solver in solvers: solver.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=True)
+        # Gathered in the same order properties were given.
+        return dict(zip(properties, answers))
+
+    # java -jar generator.jar <file> batch p1,p2,... <output> --threads N => one JSON record per line.
+    def solve_batch(self, file, properties, output):
+        if not os.path.isfile(self.jar):
+            raise svException(f'Alloy generator not found in {self.jar}: run {color.color("BOLD", "$ svROS init --reset")}.')
+        command = ['java'] + ([f'-Xmx{self.memory}'] if self.memory else []) + ['-jar', self.jar, file, 'batch', ','.join(properties), output, '--threads', str(self.jobs)] + (['--solver', self.solver] if self.solver else [])
+        # Timeout => the whole invocation gets the budget of every property it solves.
+        timeout, lines, expired = self.timeout * len(properties) if self.timeout else None, '', False
+        try:
+            lines = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, universal_newlines=True, timeout=timeout).stdout
+        except subprocess.TimeoutExpired as error:
+            lines, expired = error.stdout or '', True
+            if isinstance(lines, bytes): lines = lines.decode()
+        except OSError:
+            raise svException('Failed to start the Alloy generator: Java must be available in PATH.')
+        answers = {}
+        for line in lines.splitlines():
+            if line.strip().startswith('{'):
+                answer = json.loads(line)
+                answers[answer.get('property')] = answer
+        missing = {'outcome': 'UNKNOWN', 'message': 'timeout'} if expired else {'outcome': 'ERROR', 'message': 'no answer from the Alloy generator'}
+        return {prop: answers.get(prop, dict(property=prop, **missing)) for prop in properties}
+
+    # Every analysis run gets its own directory => concurrent analyses never share counterexamples.
+    @staticmethod
+    def run_directory(type):
+        os.makedirs(GENERATED_MODELS, exist_ok=True)
+        return tempfile.mkdtemp(prefix=f'{type}-', dir=GENERATED_MODELS)
+
+    # Records written by the generator (one manifest per worker directory).
+    @staticmethod
+    def manifest(output):
+        records = {}
+        for manifest in sorted(glob.glob(os.path.join(output, '**', 'manifest.jsonl'), recursive=True)):
+            with open(manifest, 'r') as f:
+                for line in f:
+                    if not line.strip(): continue
+                    record = json.loads(line)
+                    records[record['property']] = record
+        return records
+
+"Content-addressed store of verdicts: a hit returns the verdict (and counterexample) without starting Java."
+class svCache(object):
+    """
+        svCache
+            \_ key     => sha256(property, model text, steps, inbox, solver options)
+            \_ entries => <key>.json (+ <key>.xml if a counterexample was found)
+            \_ .model  => digest of the model the entries were solved against
+    """
+    def __init__(self, directory, model, options=None):
+        self.directory, self.model, self.options = directory, model, options or {}
+        os.makedirs(self.directory, exist_ok=True)
+        self.invalidate()
+
+    # Every entry is dropped as soon as the generated model changes.
+    def invalidate(self):
+        digest, index = hashlib.sha256(self.model.encode()).hexdigest(), os.path.join(self.directory, '.model')
+        if os.path.isfile(index):
+            with open(index, 'r') as f:
+                if f.read().strip() == digest: return False
+        shutil.rmtree(self.directory)
+        os.makedirs(self.directory)
+        with open(index, 'w+') as f: f.write(digest)
+        return True
+
+    @staticmethod
+    def scopes(model, prop):
+        command = re.search(rf'check\s+{re.escape(prop)}\s+\{{.*\}}\s*for\s+(.*)', model)
+        if command is None: return '', ''
+        steps, inbox = re.search(r'(\d+)\s+steps', command.group(1)), re.search(r'(\d+)\s+seq', command.group(1))
+        return steps.group(1) if steps else '', inbox.group(1) if inbox else ''
+
+    def key(self, prop):
+        steps, inbox = svCache.scopes(model=self.model, prop=prop)
+        content = json.dumps({'property': prop, 'model': self.model, 'steps': steps, 'inbox': inbox, 'options': self.options}, sort_keys=True)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(self, prop):
+        entry = os.path.join(self.directory, f'{self.key(prop)}.json')
+        if not os.path.isfile(entry): return None
+        with open(entry, 'r') as f: answer = json.load(f)
+        if answer.get('file') and not os.path.isfile(answer['file']): return None
+        return answer
+
+    def put(self, prop, answer):
+        # Only definite verdicts are worth keeping.
+        if answer.get('outcome') not in ('SAT', 'UNSAT'): return False
+        key, answer = self.key(prop), dict(answer)
+        if answer.get('file'):
+            xml = os.path.join(self.directory, f'{key}.xml')
+            shutil.copyfile(answer['file'], xml)
+            answer['file'] = xml
+        with open(os.path.join(self.directory, f'{key}.json'), 'w+') as f:
+            json.dump(answer, f, indent=4)
+        return True
@@ -0,0 +1,36 @@
+import os, json, tempfile
+
+global CACHE
+CACHE = os.path.join(os.path.expanduser("~"), ".svROS", "cache")
+
+"""
+    This file contains the on-disk store shared by every svROS cache (extracted sources, packages and launch files).
+"""
+"Persistent JSON entries under ~/.svROS/cache/<kind>/<key>.json."
+class svStore(object):
+    """
+        svStore
+            \_ get => entry, None if missing or unreadable
+            \_ put => written aside and then renamed, concurrent extractions never read half an entry
+    """
+    @staticmethod
+    def get(kind, key):
+        entry = os.path.join(CACHE, kind, f'{key}.json')
+        if key is None or not os.path.isfile(entry): return None
+        try:
+            with open(entry, 'r') as f: return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def put(kind, key, data):
+        if key is None: return False
+        directory = os.path.join(CACHE, kind)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False) as f:
+                json.dump(data, f)
+            os.replace(f.name, os.path.join(directory, f'{key}.json'))
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,119 @@
+import os, ast, hashlib, shutil, subprocess, threading, xmlschema
+import xml.etree.ElementTree as ET
+from .svInfo import svWarning
+from .svStore import svStore
+
+global WORKDIR, SCHEMAS
+WORKDIR = os.path.dirname(__file__)
+SCHEMAS = os.path.join(WORKDIR, 'schemas')
+
+"""
+    This file contains the launch-file validator shared by both launch parsers (XML and Python).
+    Files are checked in-process; ros2 launch -p is only run for XML files launch.xsd rejects, or as an opt-in strict mode.
+"""
+"Launch-file validation => (valid, reason), cached per file content."
+class svValidator(object):
+    VALIDATED = {}
+    COMPILED  = {}
+    DIGESTS   = {}
+    LOCK      = threading.Lock()
+    # Bumped whenever a check changes what it accepts => older cache entries are never read again.
+    VERSION   = 2
+    # Python launch files must define it at module level, ros2 launch calls nothing else.
+    ENTRY     = 'generate_launch_description'
+    """
+        svValidator
+            \_ validate => xml or python check by extension, then ros2 launch -p if strict
+            \_ xml      => well-formed, <launch> root and launch.xsd (XSD 1.1), schema compiled (and hashed) once per process
+            \_ fallback => launch.xsd only covers part of the launch frontend => a file it rejects is left to ros2 launch -p (accepted with a warning without ros2)
+            \_ python   => parses with ast, generate_launch_description defined at module level and returning a value
+            \_ cache    => svStore (launch) keyed by sha256(content, check, VERSION[, schema]), unchanged files are never checked again
+            \_ strict   => $ ros2 launch $file -p (never cached, depends on the installed packages)
+    """
+    @classmethod
+    def validate(cls, file, schema=f'{SCHEMAS}/launch.xsd', strict=False):
+        try:
+            with open(file, 'rb') as f: content = f.read()
+        except OSError as error:
+            return False, f'{type(error).__name__}: {error}'
+        check = 'xml' if file.lower().endswith('.xml') else 'python'
+        key   = cls.key(content=content, check=check, schema=schema if check == 'xml' else None)
+        if key not in cls.VALIDATED:
+            data = svStore.get(kind='launch', key=key)
+            if data is None:
+                valid, reason, advisory = cls.xml(content=content, schema=schema) if check == 'xml' else cls.python(content=content, file=file)
+                data = {'valid': valid, 'reason': reason, 'advisory': advisory}
+                svStore.put(kind='launch', key=key, data=data)
+            cls.VALIDATED[key] = (data['valid'], data['reason'], data['advisory'])
+        valid, reason, advisory = cls.VALIDATED[key]
+        if not valid and advisory:
+            return cls.fallback(file=file, reason=reason)
+        if valid and strict:
+            return cls.strict(file=file)
+        return valid, reason
+
+    @classmethod
+    def key(cls, content, check, schema=None):
+        digest = hashlib.sha256(content)
+        digest.update(f'\0{check}\0{cls.VERSION}'.encode())
+        if schema is not None: digest.update(cls.digest(path=schema).encode())
+        return digest.hexdigest()
+
+    @classmethod
+    def digest(cls, path):
+        with cls.LOCK:
+            if path not in cls.DIGESTS:
+                with open(path, 'rb') as f: cls.DIGESTS[path] = hashlib.sha256(f.read()).hexdigest()
+            return cls.DIGESTS[path]
+
+    # Schema is compiled on first use only => cached files never pay for it.
+    @classmethod
+    def schema(cls, path):
+        with cls.LOCK:
+            if path not in cls.COMPILED:
+                cls.COMPILED[path] = xmlschema.XMLSchema11(path)
+            return cls.COMPILED[path]
+
+    # (valid, reason, advisory) => a schema error is only advisory, malformed files are always invalid.
+    @classmethod
+    def xml(cls, content, schema):
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError as error:
+            return False, f'ParseError: {error}', False
+        if root.tag != 'launch':
+            return False, f'Root element is <{root.tag}>, expected <launch>.', False
+        for error in cls.schema(path=schema).iter_errors(root):
+            return False, f'{error.reason} ({error.path})', True
+        return True, '', False
+
+    @classmethod
+    def python(cls, content, file='<launch>'):
+        try:
+            module = ast.parse(content, filename=file)
+        except (SyntaxError, ValueError) as error:
+            return False, f'{type(error).__name__}: {error}', False
+        entry = [definition for definition in module.body if isinstance(definition, ast.FunctionDef) and definition.name == cls.ENTRY]
+        if not entry:
+            return False, f'{cls.ENTRY} is not defined at module level.', False
+        returns = [node for node in ast.walk(entry[-1]) if isinstance(node, ast.Return) and node.value is not None]
+        if not returns:
+            return False, f'{cls.ENTRY} does not return a launch description.', False
+        return True, '', False
+
+    # Never cached => whatever ros2 launch -p says depends on the installed packages.
+    @classmethod
+    def fallback(cls, file, reason):
+        if shutil.which('ros2') is None:
+            print(svWarning(f'{file} uses launch syntax svROS does not check ({reason}) and ros2 is not available to check it: parsed as is.'))
+            return True, ''
+        valid, error = cls.strict(file=file)
+        return (True, '') if valid else (False, f'{reason}; {error}')
+
+    @staticmethod
+    def strict(file):
+        try:
+            subprocess.check_call(['ros2', 'launch', file, '-p'], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT)
+        except Exception as error:
+            return False, f'ros2 launch {file} -p failed ({type(error).__name__}).'
+        return True, ''
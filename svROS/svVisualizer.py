@@ -28,7 +28,8 @@ class svVisualizer(object):
             return False
         return True
 
-    def run_file(self, type, file=''):
+    # data => already parsed counterexample (nodes, edges), instead of an Alloy XML file.
+    def run_file(self, type, file='', data=None):
         assert type in self.TYPES
         # GENERATE JINJA
         jinja = self.generate_jinja()
@@ -49,8 +50,8 @@ class svVisualizer(object):
             with open(f'{self.directory}/js/{js}', 'w+') as data:
                 data.write(render)
         if type == 'SROS'        : 
-            nodes, edges = SecurityInstanceParser(file=file).parse()
-            file, js = f'{self.directory}/template-sros.html', 'sros-script.js'
+            nodes, edges = data if data is not None else SecurityInstanceParser(file=file).parse()
+            file, js = f'{self.directory}/template-security.html', 'security-script.js'
             template = jinja.get_template(f'{js}')
             render    = template.render(nodes=nodes, edges=edges)
             with open(f'{self.directory}/js/{js}', 'w+') as data:
@@ -74,7 +75,7 @@ class SecurityInstanceParser(object):
         self.path = file
 
     def parse(self):
-        tree = ET.parse(file)
+        tree = ET.parse(self.path)
         root = tree.getroot()
         rule = root.find('.//skolem[@label="$this/different_privileges"]').findall('./tuple')
         if rule == []:
@@ -85,8 +86,8 @@ class SecurityInstanceParser(object):
             # PROCESS TO JSON
             profiles_states_json[f'obj_{object}'] = {'id': f'obj_{object}', 'name': object,  'type': 'object'}
             profiles_states_json[f'prof_{profile}'] = {'id': f'prof_{profile}', 'name': profile, 'type': 'profile'}
-            edges[f'{profile}_to_{object}_priv_all'] = {'relation': f'{profile}_to_{object}_priv_all', 'source': f'prof_{profile}', 'target': f'obj_{object}', 'role': role, 'rule': 'Allow'}
-            edges[f'{profile}_to_{object}_priv_deny'] = {'relation': f'{profile}_to_{object}_priv_deny', 'source': f'prof_{profile}', 'target': f'obj_{object}', 'role': role, 'rule': 'Deny'}
+            edges[f'{profile}_to_{object}_{role.lower()}_priv_all'] = {'relation': f'{profile}_to_{object}_{role.lower()}_priv_all', 'source': f'prof_{profile}', 'target': f'obj_{object}', 'role': role, 'rule': 'Allow'}
+            edges[f'{profile}_to_{object}_{role.lower()}_priv_deny'] = {'relation': f'{profile}_to_{object}_{role.lower()}_priv_deny', 'source': f'prof_{profile}', 'target': f'obj_{object}', 'role': role, 'rule': 'Deny'}
         return list(profiles_states_json.values()), list(edges.values())
 
     def remove_signature(self, value):
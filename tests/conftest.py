@@ -0,0 +1,104 @@
+import os, sys
+import pytest
+from svROS import svStore, svParser
+from svROS.svData import svNode, svTopic
+
+"""
+    Shared fixtures => every test gets its own ~/.svROS caches (svStore entries and LALR tables).
+"""
+@pytest.fixture(autouse=True)
+def caches(tmp_path, monkeypatch):
+    monkeypatch.setattr(svStore, 'CACHE', str(tmp_path / 'cache'))
+    monkeypatch.setattr(svParser, 'GRAMMARS', str(tmp_path / 'grammars'))
+    return tmp_path
+
+# Observed topics => a single secure node with no access of its own (kept out of every slice), empty topic and sync registries.
+class Relay(object):
+    secure, advertise, subscribe, connection = True, None, None, {}
+
+@pytest.fixture
+def relay(monkeypatch):
+    monkeypatch.setattr(svTopic, 'TOPICS', {})
+    monkeypatch.setattr(svNode, 'PUBSYNC', set())
+    monkeypatch.setattr(svNode, 'OBSERVATIONS', set())
+    monkeypatch.setattr(svNode, 'NODES', {'relay': Relay()})
+    return svNode.NODES['relay']
+
+# Launch parser registries => empty for every test (imported here, both launch parsers need lxml).
+@pytest.fixture
+def launches(monkeypatch):
+    from svROS.svInclude import svInclude
+    from svROS.svLauncherXML import NodeTag, ArgsTag
+    from svROS.svLauncherPY import NodeCall, ArgsCall
+    for cls in (NodeTag, NodeCall):
+        monkeypatch.setattr(cls, 'NODES', {})
+        monkeypatch.setattr(cls, 'PACKAGES_NODES', {})
+        monkeypatch.setattr(cls, 'LAUNCHED', [])
+    for cls in (ArgsTag, ArgsCall):
+        monkeypatch.setattr(cls, 'ARGS', {})
+        monkeypatch.setattr(cls, 'BINDINGS', {})
+    monkeypatch.setattr(svInclude, 'PARSED', {})
+    monkeypatch.setattr(svInclude, 'STACK', [])
+    monkeypatch.setattr(svInclude, 'PACKAGES', {})
+    # Names of the nodes launched so far, sorted.
+    return lambda: sorted(node.name for node in NodeTag.LAUNCHED + NodeCall.LAUNCHED)
+
+# Launch files written into the test's own directory => write(name, content) gives back the path.
+@pytest.fixture
+def write(tmp_path):
+    def file(name, content):
+        path = os.path.join(str(tmp_path), name)
+        with open(path, 'w') as f: f.write(content)
+        return path
+    return file
+
+# Stand-in for `java -jar generator.jar` => same protocol, outcome chosen by the property name:
+#   sleep_* never answers, slow_* answers after half a second, wins_<backend> only answers on that backend,
+#   oom_* runs out of heap (UNKNOWN), sat_* is SAT, anything else UNSAT.
+JAVA = '''#!{python}
+import sys, os, json, time
+LOG = os.environ['SVROS_FAKE_LOG']
+def answer(prop, output, solver):
+    with open(LOG, 'a') as f: f.write(f'{{os.getpid()}} {{solver}} {{prop}}\\n')
+    if prop.startswith('sleep') or (prop.startswith('wins_') and prop != f'wins_{{solver}}'): time.sleep(60)
+    if prop.startswith('slow'): time.sleep(0.5)
+    os.makedirs(output, exist_ok=True)
+    record = {{'property': prop, 'command': f'check {{prop}}', 'outcome': 'SAT' if prop.startswith('sat') else 'UNSAT', 'solver': solver}}
+    if prop.startswith('oom'): record.update(outcome='UNKNOWN', message='memory')
+    if record['outcome'] == 'SAT':
+        record['file'] = os.path.join(output, f'{{prop}}.xml')
+        with open(record['file'], 'w') as f: f.write('<alloy/>')
+    with open(os.path.join(output, 'manifest.jsonl'), 'a') as f: f.write(json.dumps(record) + '\\n')
+    return record
+args = sys.argv[sys.argv.index('-jar') + 2:]
+if args == ['--daemon']:
+    print(json.dumps({{'status': 'READY'}}), flush=True)
+    for line in sys.stdin:
+        request = dict(field.split('=', 1) for field in line.rstrip('\\n').split('\\t'))
+        if request['action'] == 'quit': break
+        print(json.dumps(answer(request['property'], request['output'], request.get('solver', 'minisatprover'))), flush=True)
+else:
+    solver = args[args.index('--solver') + 1] if '--solver' in args else 'minisatprover'
+    for prop in args[2].split(','): print(json.dumps(answer(prop, args[3], solver)), flush=True)
+'''
+
+@pytest.fixture
+def generator(tmp_path, monkeypatch):
+    bin = tmp_path / 'bin'
+    bin.mkdir()
+    java = bin / 'java'
+    java.write_text(JAVA.format(python=sys.executable))
+    java.chmod(0o755)
+    jar = tmp_path / 'generator.jar'
+    jar.write_text('')
+    monkeypatch.setenv('PATH', f'{bin}{os.pathsep}{os.environ.get("PATH", "")}')
+    monkeypatch.setenv('SVROS_FAKE_LOG', str(tmp_path / 'java.log'))
+    return str(jar)
+
+# Requests seen by the fake generator => [(pid, backend, property), ...].
+@pytest.fixture
+def received(tmp_path):
+    def requests():
+        log = tmp_path / 'java.log'
+        return [tuple(line.split()) for line in log.read_text().splitlines()] if log.exists() else []
+    return requests
@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip('haros')
+from svROS.svExport import ExporterCPP
+
+"""
+    C++ publishers and subscribers (svExport.ExporterCPP) => a single scan that skips comments, strings and preprocessor lines.
+"""
+def extract(content):
+    pubs, subs = ExporterCPP(content=content).extract()
+    return [(topic.name, topic.type) for topic in pubs], [(topic.name, topic.type) for topic in subs]
+
+def test_ros2_calls():
+    pubs, subs = extract('''
+        pub = this->create_publisher<std_msgs::msg::String>("/chatter", 10);
+        sub = create_subscription<sensor_msgs::msg::Image>("/image", 10, callback);
+    ''')
+    assert pubs == [('/chatter', 'std_msgs/msg/String')]
+    assert subs == [('/image', 'sensor_msgs/msg/Image')]
+
+def test_ros1_calls():
+    pubs, subs = extract('''
+        ros::Publisher pub = n.advertise<std_msgs::String>("/ros1", 1);
+        ros::Subscriber sub = n.subscribe<std_msgs::Bool>("/flag", 1, callback);
+    ''')
+    assert pubs == [('/ros1', 'std_msgs/String')]
+    assert subs == [('/flag', 'std_msgs/Bool')]
+
+def test_calls_in_comments_are_skipped():
+    pubs, subs = extract('''
+        // node->create_publisher<std_msgs::msg::Bool>("/line", 10);
+        /* create_subscription<std_msgs::msg::Bool>("/block", 10, cb);
+           create_publisher<std_msgs::msg::Bool>("/block", 10); */
+    ''')
+    assert pubs == [] and subs == []
+
+def test_calls_in_strings_are_skipped():
+    pubs, subs = extract(r'''
+        auto text = "create_publisher<std_msgs::msg::Bool>(\"/string\", 10)";
+        auto raw  = R"x(create_subscription<std_msgs::msg::Bool>("/raw", 10, cb))x";
+        char c    = '"';
+        pub = create_publisher<std_msgs::msg::Bool>("/real", 10);
+    ''')
+    assert pubs == [('/real', 'std_msgs/msg/Bool')] and subs == []
+
+def test_longer_names_are_not_calls():
+    pubs, subs = extract('my_subscribe<std_msgs::msg::Bool>("/not_a_call"); resubscribe("/neither");')
+    assert pubs == [] and subs == []
+
+def test_topic_names_held_in_constants():
+    pubs, subs = extract('''
+        #define CHATTER "/chatter"
+        const std::string TOPIC = "/named";
+        static const std::string OTHER{"/braced"};
+        pub = create_publisher<std_msgs::msg::String>(CHATTER, 10);
+        sub = create_subscription<std_msgs::msg::String>(TOPIC, 10, cb);
+        sub = create_subscription<std_msgs::msg::String>(OTHER, 10, cb);
+    ''')
+    assert pubs == [('/chatter', 'std_msgs/msg/String')]
+    assert subs == [('/named', 'std_msgs/msg/String'), ('/braced', 'std_msgs/msg/String')]
+
+def test_unknown_topic_names_are_left_out():
+    pubs, subs = extract('pub = create_publisher<std_msgs::msg::String>(topic_name_, 10);')
+    assert pubs == [] and subs == []
+
+def test_files_without_calls():
+    assert extract('#include <vector>\nint main() { return 0; }\n') == ([], [])
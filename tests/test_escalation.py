@@ -0,0 +1,27 @@
+import re
+from svROS.svAnalyzer import svAnalyzer
+from svROS.svData import svNode, svTopic
+from svROS.svSolver import svCache
+
+"""
+    Scope escalation (svNode.bounds, svAnalyzer.escalation_levels) => one check per bound, named <observation>__s<steps>, solved smallest first.
+"""
+def test_bounds_double_up_to_the_limit():
+    assert svNode.bounds(steps=10, inbox=3, escalation=True) == [(2, 2), (4, 3), (8, 3), (10, 3)]
+    assert svNode.bounds(steps=8, inbox=8, escalation=True) == [(2, 2), (4, 4), (8, 8)]
+    assert svNode.bounds(steps=10, inbox=3) == [(10, 3)]
+
+def test_levels_follow_the_number_of_steps():
+    levels = svAnalyzer.escalation_levels(properties=['topic_a__s16', 'topic_a__s2', 'topic_b', 'topic_a__s4'])
+    assert levels == {'topic_a': ['topic_a__s2', 'topic_a__s4', 'topic_a__s16'], 'topic_b': ['topic_b']}
+
+def test_one_check_per_bound(relay):
+    svNode.OBSERVATIONS = {svTopic.init_topic('/sensor')}
+    svNode.observalDeterminism(steps=5, inbox=2, escalation=True)
+    model = '\n'.join(svNode.OBSERVATIONS)
+    properties = re.findall(r'check\s+(.*?)\s+\{', model)
+    assert svAnalyzer.escalation_levels(properties=properties) == {'topic_sensor': ['topic_sensor__s2', 'topic_sensor__s4', 'topic_sensor__s5']}
+    # Every level keeps its own scopes => cached apart.
+    assert [svCache.scopes(model=model, prop=prop) for prop in ('topic_sensor__s2', 'topic_sensor__s4', 'topic_sensor__s5')] == [('2', '2'), ('4', '2'), ('5', '2')]
+    # Publications are synchronised once per topic, not once per level.
+    assert len(svNode.PUBSYNC) == 1
@@ -0,0 +1,43 @@
+import pytest
+from types import SimpleNamespace
+from svROS.svAnalyzer import svAnalyzer
+from svROS.svData import svNode, svState, svTopic
+from svROS.svLanguage import svPredicate
+
+"""
+    Information-flow pre-analysis (svAnalyzer.information_flows) => only topics always published with one literal skip Alloy.
+"""
+@pytest.fixture
+def registries(monkeypatch):
+    monkeypatch.setattr(svTopic, 'TOPICS', {})
+    monkeypatch.setattr(svState, 'STATES', {})
+    monkeypatch.setattr(svState, 'ASSUMPTIONS', set())
+    monkeypatch.setattr(svPredicate, 'NODE_BEHAVIOURS', {})
+    monkeypatch.setattr(svNode, 'OBSERVATIONS', set())
+
+def observe(rosname, *publications):
+    topic = svTopic.init_topic(rosname)
+    svNode.OBSERVATIONS.add(f'check {topic.signature} {{always no none}} for 4 but 2 seq, 1..10 steps')
+    for index, value in enumerate(publications):
+        svPredicate.NODE_BEHAVIOURS[f'{topic.signature}_{index}'] = SimpleNamespace(properties=None, changable_channels=[topic], changable_variables=[], publications=lambda value=value: [(topic, value)])
+    return topic.signature
+
+def test_untainted_publication_is_model_checked(registries):
+    # Nothing private reaches the topic, yet what is published can still follow each trace's inbox.
+    topic = observe('/relay', None)
+    flow = svAnalyzer.information_flows()[topic]
+    assert flow['tainted_by'] == [] and not flow['holds'] and flow['reason'] is None
+
+def test_single_literal_is_pruned(registries):
+    topic = observe('/status', '1', '1')
+    flow = svAnalyzer.information_flows()[topic]
+    assert flow['holds'] and flow['reason'] == 'constant' and flow['values'] == ['1']
+
+def test_different_literals_are_model_checked(registries):
+    topic = observe('/status', '0', '1')
+    assert not svAnalyzer.information_flows()[topic]['holds']
+
+def test_never_published_topic_is_model_checked(registries):
+    topic = observe('/silent')
+    flow = svAnalyzer.information_flows()[topic]
+    assert flow['values'] == [] and not flow['holds']
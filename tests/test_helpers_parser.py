@@ -0,0 +1,60 @@
+import sys, importlib.util, pytest
+from lark import Lark
+from svROS import grammars
+from svROS.grammars import HELPERS, STARTS
+from svROS.grammars.generate import generate, digest
+from svROS.svParser import svParser
+
+"""
+    Helper grammars (grammars/helpers.lark) => LALR, served by the stand-alone module generated from them when it is up to date.
+"""
+SAMPLES = [('launch_arg', '$(var robot)'), ('launch_arg', '$(env HOME)'), ('cmd_args', '--ros-args -r a:=b'), ('state', 'public int speed'), ('state', 'pose'), ('behaviour', 'behaviour as move'), ('behaviour', 'behaviour')]
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(svParser, 'PARSERS', {})
+    monkeypatch.setattr(svParser, 'UNEXPECTED', svParser.UNEXPECTED)
+    monkeypatch.setattr(svParser, 'VISIT', svParser.VISIT)
+
+# Stand-alone module in place of grammars/helpers.py.
+def install(monkeypatch, module):
+    monkeypatch.setitem(sys.modules, 'svROS.grammars.helpers', module)
+    monkeypatch.setattr(grammars, 'helpers', module, raising=False)
+
+@pytest.fixture(scope='module')
+def generated(tmp_path_factory):
+    path = generate(output=str(tmp_path_factory.mktemp('helpers') / 'helpers.py'))
+    spec = importlib.util.spec_from_file_location('helpers', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def test_every_helper_start_parses(registry):
+    for start, text in SAMPLES:
+        assert svParser.parse(start=start, text=text) is not None, text
+
+def test_text_that_does_not_parse_is_none(registry):
+    assert svParser.parse(start='launch_arg', text='$(var)') is None
+    assert svParser.parse(start='state', text='public int') is None
+    assert svParser.parse(start='cmd_args', text='-r a:=b') is None
+
+def test_generated_module_matches_the_grammar(generated):
+    assert generated.GRAMMAR_DIGEST == digest()
+    with open(HELPERS) as f: reference = Lark(f.read(), start=STARTS, parser='lalr')
+    standalone = generated.Lark_StandAlone()
+    for start, text in SAMPLES:
+        assert standalone.parse(text, start=start) == reference.parse(text, start=start), text
+
+def test_up_to_date_module_is_used(registry, generated, monkeypatch):
+    install(monkeypatch, generated)
+    assert not isinstance(svParser.helpers(), Lark)
+    # Its own exception classes => still None, never raised.
+    assert svParser.parse(start='state', text='public int') is None
+
+def test_stale_module_is_never_loaded(registry, generated, monkeypatch):
+    stale = type(sys)('helpers')
+    stale.__dict__.update(vars(generated))
+    stale.GRAMMAR_DIGEST = 'stale'
+    install(monkeypatch, stale)
+    assert isinstance(svParser.helpers(), Lark)
+    assert svParser.parse(start='state', text='public int speed') is not None
@@ -0,0 +1,114 @@
+import os, functools, multiprocessing, pytest
+from concurrent.futures import ProcessPoolExecutor
+
+pytest.importorskip('lxml')
+from svROS.svInfo import svException
+from svROS import svInclude as include
+from svROS.svInclude import svInclude
+
+"""
+    Included launch files (svInclude) => substitutions, per-site bindings and include cycles.
+"""
+@pytest.fixture(autouse=True)
+def registries(launches):
+    return launches
+
+def test_substitutions(monkeypatch):
+    monkeypatch.setenv('ROBOT_MODEL', 'burger')
+    monkeypatch.setattr(svInclude, 'PACKAGES', {'bringup': '/ws/src/bringup'})
+    lookup = {'robot': 'turtle'}.get
+    assert svInclude.substitute('$(find-pkg-share bringup)/launch/a.xml', lookup=lookup) == '/ws/src/bringup/launch/a.xml'
+    assert svInclude.substitute('$(dirname)/b.xml', dirname='/ws/launch') == '/ws/launch/b.xml'
+    assert svInclude.substitute('$(var robot)_$(env ROBOT_MODEL).xml', lookup=lookup) == 'turtle_burger.xml'
+
+def test_unresolved_substitutions(monkeypatch):
+    monkeypatch.delenv('SVROS_UNSET', raising=False)
+    monkeypatch.setenv('AMENT_PREFIX_PATH', '')
+    assert svInclude.substitute('$(var missing).xml', lookup={}.get) is None
+    assert svInclude.substitute('$(env SVROS_UNSET).xml') is None
+    assert svInclude.substitute('$(find-pkg-share unknown)/a.xml') is None
+
+def test_relative_paths():
+    assert svInclude.path('../b.xml', dirname='/ws/launch/sub') == '/ws/launch/b.xml'
+    assert svInclude.path('/abs/a.xml', dirname='/ws') == '/abs/a.xml'
+    assert svInclude.path('', dirname='/ws') is None
+
+def test_bindings_of_each_include_site(tmp_path, write, launches):
+    write('robot.xml', '<launch><arg name="robot" default="default"/><node pkg="p" exec="e" name="$(var robot)"/></launch>')
+    main = write('main.xml', '''<launch>
+        <include file="$(dirname)/robot.xml"><arg name="robot" value="first"/></include>
+        <include file="$(dirname)/robot.xml"><arg name="robot" value="second"/></include>
+        <include file="$(dirname)/robot.xml"/>
+    </launch>''')
+    assert svInclude.include(path=main, configurations=None, jobs=1)
+    assert launches() == ['default', 'first', 'second']
+    # Parsed once, evaluated at every include site.
+    assert list(svInclude.PARSED) == [main, os.path.join(str(tmp_path), 'robot.xml')]
+
+def test_local_let_overrides_inherited_value(write, launches):
+    write('robot.xml', '<launch><let name="robot" value="child"/><node pkg="p" exec="e" name="$(var robot)"/></launch>')
+    main = write('main.xml', '<launch><let name="robot" value="parent"/><include file="$(dirname)/robot.xml"/></launch>')
+    assert svInclude.include(path=main, configurations=None, jobs=1)
+    assert launches() == ['child']
+
+def test_inherited_value_of_an_arg_without_default(write, launches):
+    write('robot.xml', '<launch><arg name="robot"/><node pkg="p" exec="e" name="$(var robot)"/><node pkg="p" exec="e" name="$(var world)"/></launch>')
+    main = write('main.xml', '<launch><let name="robot" value="parent"/><arg name="world" default="house"/><include file="$(dirname)/robot.xml"/></launch>')
+    assert svInclude.include(path=main, configurations=None, jobs=1)
+    assert launches() == ['house', 'parent']
+
+def test_xml_including_python(write, launches):
+    write('robot.launch.py', '''
+from launch import LaunchDescription
+from launch.actions import DeclareLaunchArgument
+from launch.substitutions import LaunchConfiguration
+from launch_ros.actions import Node
+
+def generate_launch_description():
+    return LaunchDescription([
+        DeclareLaunchArgument('robot', default_value='default'),
+        Node(package='p', executable='e', name=LaunchConfiguration('robot')),
+    ])
+''')
+    main = write('main.xml', '<launch><include file="$(dirname)/robot.launch.py"><arg name="robot" value="python"/></include></launch>')
+    assert svInclude.include(path=main, configurations=None, jobs=1)
+    assert launches() == ['python']
+
+def test_include_cycle(write):
+    first  = write('a.xml', '<launch><include file="$(dirname)/b.xml"/></launch>')
+    second = write('b.xml', '<launch><include file="$(dirname)/a.xml"/></launch>')
+    with pytest.raises(svException) as error:
+        svInclude.include(path=first, configurations=None, jobs=1)
+    assert f'cycle: {first} -> {second} -> {first}' in error.value.message
+
+def test_file_including_itself(write):
+    path = write('a.xml', '<launch><include file="$(dirname)/a.xml"/></launch>')
+    with pytest.raises(svException) as error:
+        svInclude.include(path=path, configurations=None, jobs=1)
+    assert f'cycle: {path} -> {path}' in error.value.message
+
+def test_missing_included_file(capsys, write):
+    main = write('main.xml', '<launch><include file="$(dirname)/missing.xml"/></launch>')
+    with pytest.raises(svException):
+        svInclude.include(path=main, configurations=None, jobs=1)
+    assert 'INCLUDE ERROR' in capsys.readouterr().out
+
+def test_spawned_workers_get_the_package_index(monkeypatch, write):
+    # Spawned workers inherit no module state => the package index has to travel with every path.
+    monkeypatch.setattr(include, 'ProcessPoolExecutor', functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context('spawn')))
+    monkeypatch.setattr(svInclude, 'PACKAGES', {'bringup': '/ws/src/bringup'})
+    source = '''
+from launch import LaunchDescription
+from launch.actions import IncludeLaunchDescription
+from launch.launch_description_sources import PythonLaunchDescriptionSource
+from launch.substitutions import PathJoinSubstitution
+from launch_ros.substitutions import FindPackageShare
+
+def generate_launch_description():
+    return LaunchDescription([
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(PathJoinSubstitution([FindPackageShare('bringup'), 'launch', 'robot.launch.py']))),
+    ])
+'''
+    paths = [write(name, source) for name in ('first.launch.py', 'second.launch.py')]
+    assert svInclude.load(paths=paths, jobs=2)
+    assert [svInclude.PARSED[path][0].args[0][0] for path in paths] == ['/ws/src/bringup', '/ws/src/bringup']
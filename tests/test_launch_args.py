@@ -0,0 +1,68 @@
+import pytest
+import xml.etree.ElementTree as ET
+from svROS.svInfo import svException
+from svROS.svLauncherXML import ArgsTag
+
+"""
+    Launch arguments of XML launch files => resolved over their dependency graph (svLauncherXML.ArgsTag).
+"""
+@pytest.fixture(autouse=True)
+def arguments(monkeypatch):
+    monkeypatch.setattr(ArgsTag, 'ARGS', {})
+    monkeypatch.setattr(ArgsTag, 'BINDINGS', {})
+
+def declare(text):
+    root = ET.fromstring(text)
+    for argument in root.findall('./let') + root.findall('./arg'):
+        ArgsTag.process_argument(argument=argument)
+
+def resolve(text):
+    declare(text)
+    ArgsTag.process_valid_arguments()
+    return {name: argument.value for (name, _), argument in ArgsTag.ARGS.items()}
+
+def test_references_come_first_in_the_order():
+    declare('<launch><arg name="c" default="$(var b)"/><arg name="b" default="$(var a)"/><arg name="a" default="robot"/></launch>')
+    order = [name for name, _ in ArgsTag.topological_order()]
+    assert order.index('a') < order.index('b') < order.index('c')
+
+def test_references_are_resolved():
+    values = resolve('<launch><arg name="c" default="$(var b)"/><arg name="b" default="$(var a)"/><arg name="a" default="robot"/></launch>')
+    assert values == {'a': 'robot', 'b': 'robot', 'c': 'robot'}
+
+def test_arg_reference_falls_back_to_let():
+    values = resolve('<launch><let name="robot" value="turtle"/><arg name="name" default="$(var robot)"/></launch>')
+    assert values['name'] == 'turtle'
+
+def test_arg_wins_over_let_with_the_same_name():
+    values = resolve('<launch><let name="robot" value="let"/><arg name="robot" default="arg"/><arg name="name" default="$(var robot)"/></launch>')
+    assert values['name'] == 'arg'
+
+def test_cycle_is_reported_with_its_path():
+    with pytest.raises(svException) as error:
+        resolve('<launch><arg name="a" default="$(var b)"/><arg name="b" default="$(var c)"/><arg name="c" default="$(var a)"/></launch>')
+    assert 'cycle: a -> b -> c -> a' in error.value.message
+
+def test_self_reference_is_a_cycle():
+    with pytest.raises(svException) as error:
+        resolve('<launch><arg name="a" default="$(var a)"/></launch>')
+    assert 'cycle: a -> a' in error.value.message
+
+def test_unknown_reference_is_an_error():
+    with pytest.raises(svException) as error:
+        resolve('<launch><arg name="a" default="$(var missing)"/></launch>')
+    assert 'Not a valid Launch Arg: missing' in error.value.message
+
+def test_deep_chain_does_not_recurse():
+    chain = ''.join(f'<arg name="a{index}" default="$(var a{index + 1})"/>' for index in range(5000))
+    values = resolve(f'<launch>{chain}<arg name="a5000" default="end"/></launch>')
+    assert values['a0'] == 'end'
+
+def test_conditionals_follow_the_referenced_value():
+    resolve('<launch><arg name="sim" default="false"/><arg name="gazebo" default="on" if="$(var sim)"/><arg name="real" default="on" unless="$(var sim)"/></launch>')
+    assert not ArgsTag.ARGS[('gazebo', 'arg')].isTrue
+    assert ArgsTag.ARGS[('real', 'arg')].isTrue
+
+def test_literal_conditionals():
+    values = resolve('<launch><arg name="kept" default="x" if="true"/><arg name="dropped" default="x" if="false"/></launch>')
+    assert 'kept' in values and 'dropped' not in values
@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip('haros')
+from svROS.svInfo import svException
+from svROS.svExport import svLaunch
+
+"""
+    Nodes of the launch files listed in a project (svExport.svLaunch) => merged in the order files are listed, repeated nodes are errors.
+"""
+@pytest.fixture(autouse=True)
+def parsed(monkeypatch):
+    monkeypatch.setattr(svLaunch, 'PARSED', {})
+
+def node(name, package='p', namespace=None):
+    return {'_name': name, 'namespace': namespace, 'package': package, 'executable': 'e', 'remaps': [], 'enclave': None}
+
+def test_nodes_follow_the_order_files_are_listed():
+    svLaunch.PARSED.update({'a': [node('n1'), node('m1', package='q')], 'b': [node('n2')]})
+    assert [n['_name'] for n in svLaunch.merge(files=['b', 'a'])['p']] == ['n2', 'n1']
+    assert [n['_name'] for n in svLaunch.merge(files=['a', 'b'])['p']] == ['n1', 'n2']
+
+def test_namespaces_tell_nodes_apart():
+    svLaunch.PARSED.update({'a': [node('n', namespace='left'), node('n', namespace='right')]})
+    assert len(svLaunch.merge(files=['a'])['p']) == 2
+
+def test_node_in_two_files(capsys):
+    svLaunch.PARSED.update({'a': [node('n')], 'b': [node('n')]})
+    with pytest.raises(svException) as error:
+        svLaunch.merge(files=['a', 'b'])
+    assert 'p/n' in error.value.message
+    assert 'a and b' in capsys.readouterr().out
+
+def test_node_twice_in_one_file(capsys):
+    svLaunch.PARSED.update({'a': [node('n'), node('n')]})
+    with pytest.raises(svException):
+        svLaunch.merge(files=['a'])
+    assert 'a (twice)' in capsys.readouterr().out
+
+def test_file_listed_twice():
+    svLaunch.PARSED.update({'a': [node('n')]})
+    assert len(svLaunch.merge(files=['a', 'a'])['p']) == 1
+
+def test_node_repeated_through_an_include(write):
+    write('robot.launch.py', '''
+from launch import LaunchDescription
+from launch_ros.actions import Node
+
+def generate_launch_description():
+    return LaunchDescription([Node(package='p', executable='e', name='n')])
+''')
+    main = write('main.xml', '<launch><node pkg="p" exec="e" name="n"/><include file="$(dirname)/robot.launch.py"/></launch>')
+    svLaunch.run(files=[main], jobs=1)
+    with pytest.raises(svException) as error:
+        svLaunch.merge(files=[main])
+    assert 'p/n' in error.value.message
@@ -0,0 +1,101 @@
+import os, pytest
+
+pytest.importorskip('lxml')
+from svROS.svInclude import svInclude
+from svROS.svLauncherPY import EvaluatorAST, ReferenceCall
+
+"""
+    Python launch files (svLauncherPY.EvaluatorAST) => evaluated off the syntax tree, never imported nor run.
+"""
+HEADER = '''
+import os
+from launch import LaunchDescription
+from launch.actions import DeclareLaunchArgument, IncludeLaunchDescription
+from launch.launch_description_sources import PythonLaunchDescriptionSource
+from launch.substitutions import LaunchConfiguration, PathJoinSubstitution, TextSubstitution, ThisLaunchFileDir
+from launch_ros.actions import Node
+from launch_ros.substitutions import FindPackageShare
+'''
+
+def actions(content, file='/ws/launch/a.launch.py'):
+    return EvaluatorAST(content=HEADER + content, file=file).evaluate()
+
+def test_actions_in_order():
+    evaluated = actions('''
+def generate_launch_description():
+    return LaunchDescription([
+        DeclareLaunchArgument('robot', default_value='turtle'),
+        Node(package='p', executable='e', name='first'),
+        Node(package='p', executable='e', name='second'),
+    ])
+''')
+    assert [action.call for action in evaluated] == ['DeclareLaunchArgument', 'Node', 'Node']
+    assert [action.keywords.get('name') for action in evaluated[1:]] == ['first', 'second']
+
+def test_add_action_on_a_bound_description():
+    evaluated = actions('''
+def generate_launch_description():
+    ld = LaunchDescription()
+    ld.add_action(Node(package='p', executable='e', name='first'))
+    ld.add_entity(Node(package='p', executable='e', name='second'))
+    return ld
+''')
+    assert [action.keywords['name'] for action in evaluated] == ['first', 'second']
+
+def test_variables_strings_and_unpacking():
+    evaluated = actions('''
+PREFIX = 'robot'
+def generate_launch_description():
+    left, right = 'left', 'right'
+    suffix: str = TextSubstitution(text='_node')
+    nodes = [Node(package='p', executable='e', name=f'{PREFIX}_{side}' + suffix) for side in ('a',)]
+    return LaunchDescription([Node(package='p', executable='e', name=PREFIX + '_' + left + suffix), Node(package='p', executable='e', name=f'{PREFIX}_{right}')])
+''')
+    assert [action.keywords['name'] for action in evaluated] == ['robot_left_node', 'robot_right']
+
+def test_launch_configuration_is_a_reference():
+    evaluated = actions('''
+def generate_launch_description():
+    return LaunchDescription([Node(package='p', executable='e', name=LaunchConfiguration('robot', default='turtle'))])
+''')
+    name = evaluated[0].keywords['name']
+    assert isinstance(name, ReferenceCall) and (name.name, name.default) == ('robot', 'turtle')
+
+def test_helper_functions_are_not_run():
+    evaluated = actions('''
+def helper():
+    return LaunchDescription([Node(package='p', executable='e', name='helper')])
+
+def generate_launch_description():
+    return LaunchDescription([Node(package='p', executable='e', name='main')])
+''')
+    assert [action.keywords['name'] for action in evaluated] == ['main']
+
+def test_included_paths(monkeypatch):
+    monkeypatch.setattr(svInclude, 'PACKAGES', {'bringup': '/ws/src/bringup'})
+    evaluated = actions('''
+def generate_launch_description():
+    return LaunchDescription([
+        IncludeLaunchDescription(PythonLaunchDescriptionSource([ThisLaunchFileDir(), '/b.launch.py'])),
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(PathJoinSubstitution([FindPackageShare('bringup'), 'launch', 'c.launch.py']))),
+        IncludeLaunchDescription(PythonLaunchDescriptionSource(os.path.join(os.path.dirname(__file__), 'd.launch.py'))),
+    ])
+''')
+    assert [action.args[0] for action in evaluated] == [['/ws/launch', '/b.launch.py'], ['/ws/src/bringup', '/', 'launch', '/', 'c.launch.py'], ['/ws/launch', '/', 'd.launch.py']]
+
+@pytest.mark.parametrize('content', ['def generate_launch_description(:\n', 'def generate_launch_description():\n    return None\n', 'def other():\n    return LaunchDescription([])\n'])
+def test_no_launch_description(content):
+    assert actions(content) is None
+
+def test_arguments_reach_the_nodes(launches, write):
+    main = write('main.launch.py', HEADER + '''
+def generate_launch_description():
+    robot = LaunchConfiguration('robot')
+    return LaunchDescription([
+        DeclareLaunchArgument('robot', default_value='turtle'),
+        Node(package='p', executable='e', name=robot),
+        Node(package='p', executable='e', name=LaunchConfiguration('world', default='house')),
+    ])
+''')
+    assert svInclude.include(path=main, configurations=None, jobs=1)
+    assert launches() == ['house', 'turtle']
@@ -0,0 +1,70 @@
+import os, pytest
+
+pytest.importorskip('haros')
+from svROS import svExport
+from svROS.svExport import PackageFinder
+
+"""
+    Package discovery (svExport.PackageFinder) => workspace and distro crawled natively, the index reused while nothing changed.
+"""
+@pytest.fixture(autouse=True)
+def index(tmp_path, monkeypatch):
+    monkeypatch.setattr(svExport, 'INDEX', str(tmp_path / 'cache' / 'packages.json'))
+    return tmp_path / 'cache' / 'packages.json'
+
+def package(directory, name):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'package.xml'), 'w') as f:
+        f.write(f'<?xml version="1.0"?>\n<package format="3"><name>{name}</name><version>0.0.1</version></package>')
+    return str(directory)
+
+def test_packages_of_a_workspace(tmp_path):
+    talker = package(tmp_path / 'ws' / 'src' / 'demos' / 'talker', 'talker')
+    listener = package(tmp_path / 'ws' / 'src' / 'listener', 'listener')
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages == {'listener': listener, 'talker': talker}
+
+def test_package_directories_are_not_crawled_further(tmp_path):
+    outer = package(tmp_path / 'ws' / 'outer', 'outer')
+    package(tmp_path / 'ws' / 'outer' / 'test' / 'inner', 'inner')
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages == {'outer': outer}
+
+@pytest.mark.parametrize('marker', PackageFinder.IGNORE)
+def test_ignore_markers(tmp_path, marker):
+    package(tmp_path / 'ws' / 'skipped' / 'pkg', 'skipped')
+    (tmp_path / 'ws' / 'skipped' / marker).touch()
+    kept = package(tmp_path / 'ws' / 'kept', 'kept')
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages == {'kept': kept}
+
+def test_hidden_directories_are_skipped(tmp_path):
+    package(tmp_path / 'ws' / '.git' / 'pkg', 'hidden')
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages == {}
+
+def test_workspace_wins_over_distro(tmp_path):
+    overlay = package(tmp_path / 'ws' / 'std_msgs', 'std_msgs')
+    package(tmp_path / 'distro' / 'share' / 'std_msgs', 'std_msgs')
+    rclpy = package(tmp_path / 'distro' / 'share' / 'rclpy', 'rclpy')
+    found = PackageFinder(ros_workspace=str(tmp_path / 'ws'), ros_distro=str(tmp_path / 'distro')).packages
+    assert found == {'std_msgs': overlay, 'rclpy': rclpy}
+
+def test_unchanged_workspace_is_not_crawled_again(tmp_path, index, monkeypatch):
+    talker = package(tmp_path / 'ws' / 'talker', 'talker')
+    PackageFinder(ros_workspace=str(tmp_path / 'ws'))
+    assert index.exists()
+    def crawl(base): raise AssertionError(f'{base} crawled again')
+    monkeypatch.setattr(PackageFinder, 'crawl', staticmethod(crawl))
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages == {'talker': talker}
+
+def test_new_package_invalidates_the_index(tmp_path):
+    package(tmp_path / 'ws' / 'talker', 'talker')
+    PackageFinder(ros_workspace=str(tmp_path / 'ws'))
+    listener = package(tmp_path / 'ws' / 'listener', 'listener')
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages['listener'] == listener
+
+def test_renamed_package_invalidates_the_index(tmp_path):
+    directory = package(tmp_path / 'ws' / 'talker', 'talker')
+    PackageFinder(ros_workspace=str(tmp_path / 'ws'))
+    manifest = os.path.join(directory, 'package.xml')
+    stat = os.stat(manifest)
+    package(directory, 'speaker')
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    assert PackageFinder(ros_workspace=str(tmp_path / 'ws')).packages == {'speaker': directory}
@@ -0,0 +1,53 @@
+import os, pytest
+from lark import Transformer
+from svROS.svParser import svParser
+
+"""
+    Parser registry (svParser) => one compiled parser per (grammar, start, options), LALR tables kept on disk.
+"""
+GRAMMAR = '''
+start: WORD+
+WORD: /[a-z]+/
+%import common.WS
+%ignore WS
+'''
+
+class Words(Transformer):
+    def __init__(self, forbidden):
+        super().__init__()
+        self.forbidden = forbidden
+
+    def start(self, children):
+        words = [str(child) for child in children]
+        if self.forbidden in words: raise ValueError(self.forbidden)
+        return words
+
+@pytest.fixture(autouse=True)
+def parsers(monkeypatch):
+    monkeypatch.setattr(svParser, 'PARSERS', {})
+
+def test_parser_is_built_once():
+    parser = svParser.get(grammar=GRAMMAR, start='start')
+    assert svParser.get(grammar=GRAMMAR, start='start') is parser
+    assert svParser.get(grammar=GRAMMAR, start='start', parser='earley') is not parser
+    assert len(svParser.PARSERS) == 2
+
+def test_lalr_tables_are_kept_on_disk(caches):
+    svParser.get(grammar=GRAMMAR, start='start')
+    tables = os.listdir(caches / 'grammars')
+    assert len(tables) == 1 and tables[0].endswith('.lark')
+    # A new process (empty registry) loads the tables instead of analysing the grammar again.
+    svParser.PARSERS.clear()
+    assert svParser.get(grammar=GRAMMAR, start='start').parse('from disk') is not None
+    assert os.listdir(caches / 'grammars') == tables
+
+def test_earley_parsers_are_not_cached_on_disk(caches):
+    svParser.get(grammar=GRAMMAR, start='start', parser='earley')
+    assert not (caches / 'grammars').exists() or os.listdir(caches / 'grammars') == []
+
+def test_transformer_state_is_per_call():
+    assert svParser.transform(grammar=GRAMMAR, start='start', text='a b c', transformer=Words(forbidden='x')) == ['a', 'b', 'c']
+    # Same shared parser, a different transformer => its errors come out as they were raised.
+    with pytest.raises(ValueError):
+        svParser.transform(grammar=GRAMMAR, start='start', text='a x', transformer=Words(forbidden='x'))
+    assert len(svParser.PARSERS) == 1
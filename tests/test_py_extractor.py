@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip('haros')
+from svROS.svExport import ExporterAST
+
+"""
+    Python publishers and subscribers (svExport.ExporterAST) => read off the syntax tree, None whenever bonsai has to take over.
+"""
+def extract(content):
+    extracted = ExporterAST(content=content).extract()
+    if extracted is None: return None
+    pubs, subs = extracted
+    return [(topic.name, topic.type) for topic in pubs], [(topic.name, topic.type) for topic in subs]
+
+def test_from_import_is_spelled_with_slashes():
+    pubs, subs = extract('''
+from std_msgs.msg import String
+from sensor_msgs.msg import Image as Frame
+node.create_publisher(String, '/chatter', 10)
+node.create_subscription(Frame, '/image', callback, 10)
+''')
+    assert pubs == [('/chatter', 'std_msgs/msg/String')]
+    assert subs == [('/image', 'sensor_msgs/msg/Image')]
+
+def test_module_import_is_spelled_as_written():
+    pubs, _ = extract('''
+import std_msgs.msg
+import sensor_msgs.msg as sensors
+node.create_publisher(std_msgs.msg.String, '/chatter', 10)
+node.create_publisher(sensors.Image, '/image', 10)
+''')
+    assert pubs == [('/chatter', 'std_msgs.msg.String'), ('/image', 'sensor_msgs.msg.Image')]
+
+def test_keyword_arguments():
+    pubs, subs = extract('''
+from std_msgs.msg import String, Bool
+node.create_publisher(topic='/chatter', msg_type=String, qos_profile=10)
+rospy.Publisher(name='/ros1', data_class=Bool, queue_size=1)
+rospy.Subscriber('/flag', data_class=Bool, callback=callback)
+''')
+    assert pubs == [('/chatter', 'std_msgs/msg/String'), ('/ros1', 'std_msgs/msg/Bool')]
+    assert subs == [('/flag', 'std_msgs/msg/Bool')]
+
+def test_variable_topic_in_a_ros2_call_is_skipped():
+    pubs, _ = extract('''
+from std_msgs.msg import String
+node.create_publisher(String, self.topic, 10)
+node.create_publisher(String, '/chatter', 10)
+''')
+    assert pubs == [('/chatter', 'std_msgs/msg/String')]
+
+def test_variable_topic_in_a_ros1_call_needs_bonsai():
+    assert extract('from std_msgs.msg import String\nrospy.Publisher(topic, String)\n') is None
+
+@pytest.mark.parametrize('imports', ['from std_msgs.msg import *', 'from .msg import String', 'from . import String'])
+def test_star_and_relative_imports_need_bonsai(imports):
+    assert extract(f'{imports}\nnode.create_publisher(String, "/chatter", 10)\n') is None
+
+def test_unused_star_import_is_harmless():
+    assert extract('from std_msgs.msg import *\nprint("no publishers")\n') == ([], [])
+
+def test_syntax_error_needs_bonsai():
+    assert extract('def broken(:\n') is None
@@ -0,0 +1,38 @@
+import re, pytest
+from svROS.svAnalyzer import svAnalyzer
+from svROS.svData import svNode, svState, svTopic
+from svROS.svLanguage import svPredicate
+
+"""
+    Slicing (svAnalyzer.narrowed) => the registries shrink to one cone while its model is written, and are restored afterwards.
+"""
+@pytest.fixture
+def observed(relay, monkeypatch):
+    monkeypatch.setattr(svState, 'STATES', {})
+    monkeypatch.setattr(svPredicate, 'NODE_BEHAVIOURS', {})
+    topics = [svTopic.init_topic(rosname) for rosname in ('/sensor', '/command', '/log')]
+    svNode.OBSERVATIONS = set(topics)
+    svNode.observalDeterminism(steps=10, inbox=2)
+    return topics
+
+# Synchronisation facts of the model being written, by topic.
+def synchronised():
+    return {re.search(r'publish\[T1, (\w+),', sync).group(1): sync for sync in re.findall(r'\n\talways \(\(some m0.*', svNode.observable_determinism())}
+
+def test_slice_keeps_the_synchronisation_of_its_whole_cone(observed):
+    sensor, command, log = observed
+    full = synchronised()
+    # /command is published from what arrives on /sensor => both are in the cone of /command.
+    with svAnalyzer.narrowed(topic=command, topics={sensor, command}, states=set(), predicates=set()):
+        sliced = synchronised()
+        checks = list(svNode.OBSERVATIONS)
+    assert sliced == {signature: full[signature] for signature in (sensor.signature, command.signature)}
+    assert len(checks) == 1 and checks[0].startswith(f'check {command.signature} ')
+
+def test_registries_are_restored(observed):
+    sensor, command, log = observed
+    pubsync, observations = set(svNode.PUBSYNC), set(svNode.OBSERVATIONS)
+    with svAnalyzer.narrowed(topic=sensor, topics={sensor}, states=set(), predicates=set()):
+        assert list(svTopic.TOPICS.values()) == [sensor]
+    assert svNode.PUBSYNC == pubsync and svNode.OBSERVATIONS == observations
+    assert len(svTopic.TOPICS) == 3
@@ -0,0 +1,36 @@
+import pytest
+from svROS.svSolver import svSolverPool
+from svROS.svInfo import svException
+
+"""
+    Batch mode (svSolverPool.solve_batch) => one generator invocation per call, one JSON record per property on stdout.
+"""
+def test_every_property_in_one_invocation(generator, received, tmp_path):
+    with svSolverPool(jobs=2, jar=generator, batch=True) as pool:
+        answers = pool.solve(file='model.als', properties=['unsat_b', 'sat_a'], output=str(tmp_path / 'run'))
+        assert pool.solvers == []
+    assert list(answers) == ['unsat_b', 'sat_a']
+    assert [answers[prop]['outcome'] for prop in answers] == ['UNSAT', 'SAT']
+    assert len({pid for pid, _, _ in received()}) == 1
+
+def test_solver_is_handed_over(generator, tmp_path):
+    with svSolverPool(jar=generator, batch=True, solver='glucose') as pool:
+        answers = pool.solve(file='model.als', properties=['unsat_a'], output=str(tmp_path / 'run'))
+    assert answers['unsat_a']['solver'] == 'glucose'
+
+def test_timeout_keeps_what_was_answered(generator, tmp_path):
+    # Budget => timeout per property, for the whole invocation.
+    with svSolverPool(jar=generator, batch=True, timeout=1) as pool:
+        answers = pool.solve(file='model.als', properties=['unsat_a', 'sleep_b'], output=str(tmp_path / 'run'))
+    assert answers['unsat_a']['outcome'] == 'UNSAT'
+    assert answers['sleep_b'] == {'property': 'sleep_b', 'outcome': 'UNKNOWN', 'message': 'timeout'}
+
+def test_missing_record_is_an_error(generator, tmp_path, monkeypatch):
+    monkeypatch.setattr('svROS.svSolver.subprocess.run', lambda *args, **kwargs: type('Run', (), {'stdout': 'Parsing model...\n'})())
+    with svSolverPool(jar=generator, batch=True) as pool:
+        answers = pool.solve(file='model.als', properties=['unsat_a'], output=str(tmp_path / 'run'))
+    assert answers['unsat_a']['outcome'] == 'ERROR'
+
+def test_missing_generator(tmp_path):
+    with pytest.raises(svException):
+        svSolverPool(jar=str(tmp_path / 'missing.jar'), batch=True).solve(file='model.als', properties=['unsat_a'], output=str(tmp_path / 'run'))
@@ -0,0 +1,46 @@
+from svROS.svSolver import svCache
+
+"""
+    Verdict cache (svSolver.svCache) => keyed by property, model, scopes and solver options, dropped when the model changes.
+"""
+MODEL = 'check topic_a {always no none} for 4 but 2 seq, 1..10 steps\ncheck topic_b {always no none} for 4 but 3 seq, 1..20 steps\n'
+
+def test_verdict_is_kept(tmp_path):
+    cache = svCache(directory=str(tmp_path / 'ros'), model=MODEL)
+    assert cache.get('topic_a') is None
+    assert cache.put('topic_a', {'property': 'topic_a', 'outcome': 'UNSAT'})
+    assert svCache(directory=str(tmp_path / 'ros'), model=MODEL).get('topic_a')['outcome'] == 'UNSAT'
+
+def test_counterexample_is_copied_into_the_cache(tmp_path):
+    counterexample = tmp_path / 'run' / 'topic_a.xml'
+    counterexample.parent.mkdir()
+    counterexample.write_text('<alloy/>')
+    cache = svCache(directory=str(tmp_path / 'ros'), model=MODEL)
+    cache.put('topic_a', {'property': 'topic_a', 'outcome': 'SAT', 'file': str(counterexample)})
+    counterexample.unlink()
+    answer = cache.get('topic_a')
+    assert answer['file'].startswith(str(tmp_path / 'ros'))
+    with open(answer['file']) as f: assert f.read() == '<alloy/>'
+
+def test_only_definite_verdicts_are_kept(tmp_path):
+    cache = svCache(directory=str(tmp_path / 'ros'), model=MODEL)
+    assert not cache.put('topic_a', {'property': 'topic_a', 'outcome': 'UNKNOWN', 'message': 'timeout'})
+    assert cache.get('topic_a') is None
+
+def test_model_change_drops_every_entry(tmp_path):
+    svCache(directory=str(tmp_path / 'ros'), model=MODEL).put('topic_a', {'property': 'topic_a', 'outcome': 'UNSAT'})
+    changed = svCache(directory=str(tmp_path / 'ros'), model=MODEL + '\nfact {}\n')
+    assert changed.get('topic_a') is None
+    assert svCache(directory=str(tmp_path / 'ros'), model=MODEL).get('topic_a') is None
+
+def test_unchanged_model_keeps_its_entries(tmp_path):
+    svCache(directory=str(tmp_path / 'ros'), model=MODEL).put('topic_a', {'property': 'topic_a', 'outcome': 'UNSAT'})
+    assert not svCache(directory=str(tmp_path / 'ros'), model=MODEL).invalidate()
+
+def test_solver_options_are_part_of_the_key(tmp_path):
+    svCache(directory=str(tmp_path / 'ros'), model=MODEL, options={'solver': 'sat4j'}).put('topic_a', {'property': 'topic_a', 'outcome': 'UNSAT'})
+    assert svCache(directory=str(tmp_path / 'ros'), model=MODEL, options={'solver': 'glucose'}).get('topic_a') is None
+
+def test_scopes_of_a_check_command():
+    assert svCache.scopes(model=MODEL, prop='topic_b') == ('20', '3')
+    assert svCache.scopes(model=MODEL, prop='topic_c') == ('', '')
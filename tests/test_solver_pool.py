@@ -0,0 +1,82 @@
+import os, signal, threading, pytest
+from svROS.svSolver import svSolver, svSolverPool
+from svROS.svInfo import svException
+
+"""
+    Solver pool (svSolver.svSolverPool) => jobs warm generator processes, each property solved by whichever one is idle.
+"""
+def test_answers_follow_the_order_properties_were_given(generator, tmp_path):
+    properties = ['unsat_c', 'sat_a', 'unsat_b']
+    with svSolverPool(jobs=2, jar=generator) as pool:
+        answers = pool.solve(file='model.als', properties=properties, output=str(tmp_path / 'run'))
+    assert list(answers) == properties
+    assert [answers[prop]['outcome'] for prop in properties] == ['UNSAT', 'SAT', 'UNSAT']
+
+def test_properties_are_solved_side_by_side(generator, received, tmp_path):
+    with svSolverPool(jobs=2, jar=generator) as pool:
+        pool.solve(file='model.als', properties=['slow_a', 'slow_b'], output=str(tmp_path / 'run'))
+    # Both were being solved at once => each on its own process, into its own directory.
+    assert len({pid for pid, _, _ in received()}) == 2
+    assert sorted(os.listdir(tmp_path / 'run')) == ['worker-0', 'worker-1']
+    assert sorted(svSolverPool.manifest(output=str(tmp_path / 'run'))) == ['slow_a', 'slow_b']
+
+def test_processes_are_kept_warm_between_calls(generator, received, tmp_path):
+    with svSolverPool(jobs=1, jar=generator) as pool:
+        pool.solve(file='model.als', properties=['unsat_a'], output=str(tmp_path / 'run'))
+        pool.solve(file='model.als', properties=['unsat_b'], output=str(tmp_path / 'run'))
+        assert len(pool.solvers) == 1
+    assert len({pid for pid, _, _ in received()}) == 1
+
+def test_no_more_processes_than_properties(generator, tmp_path):
+    with svSolverPool(jobs=8, jar=generator) as pool:
+        pool.solve(file='model.als', properties=['unsat_a', 'unsat_b'], output=str(tmp_path / 'run'))
+        assert len(pool.solvers) == 2
+        assert pool.solve(file='model.als', properties=[], output=str(tmp_path / 'run')) == {}
+
+def test_every_run_gets_its_own_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr('svROS.svSolver.GENERATED_MODELS', str(tmp_path / 'generated_models'))
+    first, second = svSolverPool.run_directory(type='ros'), svSolverPool.run_directory(type='ros')
+    assert first != second and os.path.basename(first).startswith('ros-')
+
+def test_timeout_is_unknown_and_the_process_is_replaced(generator, received, tmp_path):
+    with svSolverPool(jobs=1, jar=generator, timeout=1) as pool:
+        answers = pool.solve(file='model.als', properties=['sleep_a', 'unsat_b'], output=str(tmp_path / 'run'))
+    assert answers['sleep_a'] == {'property': 'sleep_a', 'outcome': 'UNKNOWN', 'message': 'timeout'}
+    assert answers['unsat_b']['outcome'] == 'UNSAT'
+    assert len({pid for pid, _, _ in received()}) == 2
+
+def test_exhausted_heap_replaces_the_process(generator, received, tmp_path):
+    with svSolverPool(jobs=1, jar=generator) as pool:
+        answers = pool.solve(file='model.als', properties=['oom_a', 'unsat_b'], output=str(tmp_path / 'run'))
+    assert (answers['oom_a']['outcome'], answers['oom_a']['message']) == ('UNKNOWN', 'memory')
+    assert len({pid for pid, _, _ in received()}) == 2
+
+def test_heap_cap_is_given_to_the_jvm(generator):
+    with svSolver(jar=generator, memory='512m') as solver:
+        with open(f'/proc/{solver.process.pid}/cmdline', 'rb') as f: command = f.read().split(b'\0')
+    assert b'-Xmx512m' in command
+
+def test_ctrl_c_kills_every_process(generator, received, tmp_path):
+    # SIGINT reaches the main thread while it waits for the answers.
+    threading.Timer(0.2, os.kill, args=(os.getpid(), signal.SIGINT)).start()
+    with svSolverPool(jobs=2, jar=generator) as pool:
+        with pytest.raises(KeyboardInterrupt):
+            pool.solve(file='model.als', properties=['sleep_a', 'sleep_b', 'sleep_c', 'sleep_d'], output=str(tmp_path / 'run'))
+        assert pool.cancelled and not any(solver.alive for solver in pool.solvers)
+    # Properties still queued never reached a process.
+    assert {prop for _, _, prop in received()} <= {'sleep_a', 'sleep_b'}
+
+def test_nothing_is_solved_once_cancelled(generator, received, tmp_path):
+    with svSolverPool(jobs=2, jar=generator) as pool:
+        pool.cancelled = True
+        answers = pool.solve(file='model.als', properties=['unsat_a', 'unsat_b'], output=str(tmp_path / 'run'))
+    assert {answer['message'] for answer in answers.values()} == {'cancelled'}
+    assert received() == []
+
+def test_cancelled_process_is_never_started_again(generator, received):
+    solver = svSolver(jar=generator)
+    solver.start()
+    solver.cancel()
+    with pytest.raises(svException):
+        solver.solve(file='model.als', prop='unsat_a', output='run')
+    assert not solver.alive and received() == []
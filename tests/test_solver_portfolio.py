@@ -0,0 +1,45 @@
+import os, pytest
+from svROS.svSolver import svSolverPool, svPortfolio
+from svROS.svInfo import svException
+
+"""
+    Portfolio (svSolver.svPortfolio) => one generator process per backend, first definite answer wins, losers are killed.
+"""
+def test_first_definite_answer_wins(generator, tmp_path):
+    with svPortfolio(jar=generator) as portfolio:
+        answer = portfolio.solve(file='model.als', prop='wins_glucose', output=str(tmp_path / 'run'))
+        assert answer['outcome'] == 'UNSAT' and answer['solver'] == 'glucose'
+        # Losers were still solving => killed, the winner stays warm.
+        assert [backend for backend, solver in portfolio.solvers.items() if solver.alive] == ['glucose']
+
+def test_only_the_winner_output_is_kept(generator, tmp_path):
+    output = tmp_path / 'run'
+    with svPortfolio(jar=generator) as portfolio:
+        portfolio.solve(file='model.als', prop='wins_sat4j', output=str(output))
+    assert os.listdir(output) == ['wins_sat4j-sat4j']
+    assert list(svSolverPool.manifest(output=str(output))) == ['wins_sat4j']
+
+def test_killed_backends_restart_on_the_next_property(generator, tmp_path):
+    with svPortfolio(jar=generator) as portfolio:
+        portfolio.solve(file='model.als', prop='wins_minisat', output=str(tmp_path / 'run'))
+        warm = portfolio.solvers['minisat'].process.pid
+        assert portfolio.solvers['sat4j'].process is None and portfolio.solvers['glucose'].process is None
+        # The winner keeps its process (and parsed model), the killed losers come back for the next race.
+        portfolio.solve(file='model.als', prop='wins_minisat', output=str(tmp_path / 'run'))
+        assert portfolio.solvers['minisat'].process.pid == warm
+        assert portfolio.solve(file='model.als', prop='wins_sat4j', output=str(tmp_path / 'run'))['solver'] == 'sat4j'
+
+def test_no_definite_answer_keeps_the_first_one(generator, tmp_path):
+    with svPortfolio(jar=generator, timeout=1) as portfolio:
+        answer = portfolio.solve(file='model.als', prop='sleep_topic', output=str(tmp_path / 'run'))
+    assert answer['outcome'] == 'UNKNOWN' and answer['message'] == 'timeout'
+
+def test_pool_slots_race_every_backend(generator, tmp_path):
+    with svSolverPool(jobs=2, jar=generator, solver='portfolio') as pool:
+        answers = pool.solve(file='model.als', properties=['wins_sat4j', 'wins_glucose'], output=str(tmp_path / 'run'))
+        assert len(pool.solvers) == 2 and all(isinstance(slot, svPortfolio) for slot in pool.solvers)
+    assert {prop: answer['solver'] for prop, answer in answers.items()} == {'wins_sat4j': 'sat4j', 'wins_glucose': 'glucose'}
+
+def test_portfolio_is_not_available_in_batch():
+    with pytest.raises(svException):
+        svSolverPool(batch=True, solver='portfolio')
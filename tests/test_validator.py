@@ -0,0 +1,88 @@
+import os, sys, pytest
+from svROS.svValidator import svValidator
+
+"""
+    Launch-file validation (svValidator) => in-process checks cached per content, launch.xsd only advisory, ros2 launch -p on demand.
+"""
+@pytest.fixture(autouse=True)
+def validated(monkeypatch):
+    monkeypatch.setattr(svValidator, 'VALIDATED', {})
+
+# ros2 on PATH => `ros2 launch <file> -p` exits with the given status and logs every call.
+@pytest.fixture
+def ros2(tmp_path, monkeypatch):
+    bin = tmp_path / 'bin'
+    bin.mkdir()
+    def install(status):
+        script = bin / 'ros2'
+        script.write_text(f'#!{sys.executable}\nimport sys\nopen({str(tmp_path / "ros2.log")!r}, "a").write(" ".join(sys.argv[1:]) + "\\n")\nsys.exit({status})\n')
+        script.chmod(0o755)
+        monkeypatch.setenv('PATH', f'{bin}{os.pathsep}{os.environ.get("PATH", "")}')
+        return tmp_path / 'ros2.log'
+    return install
+
+@pytest.fixture
+def no_ros2(monkeypatch):
+    monkeypatch.setattr('svROS.svValidator.shutil.which', lambda name: None)
+
+def test_valid_xml(write):
+    assert svValidator.validate(file=write('a.xml', '<launch><arg name="a" default="1"/><node pkg="p" exec="e" name="n"/></launch>')) == (True, '')
+
+def test_malformed_xml_is_invalid(write):
+    valid, reason = svValidator.validate(file=write('a.xml', '<launch><node pkg="p"></launch>'))
+    assert not valid and reason.startswith('ParseError')
+
+def test_root_must_be_launch(write):
+    valid, reason = svValidator.validate(file=write('a.xml', '<group/>'))
+    assert not valid and '<group>' in reason
+
+def test_schema_is_only_advisory_without_ros2(write, no_ros2, capsys):
+    assert svValidator.validate(file=write('a.xml', '<launch><frobnicate/></launch>')) == (True, '')
+    assert 'frobnicate' in capsys.readouterr().out
+
+def test_schema_rejection_is_left_to_ros2(write, ros2):
+    ros2(status=1)
+    valid, reason = svValidator.validate(file=write('a.xml', '<launch><frobnicate/></launch>'))
+    assert not valid and 'frobnicate' in reason and 'ros2 launch' in reason
+    ros2(status=0)
+    assert svValidator.validate(file=write('b.xml', '<launch><frobnicate/></launch>')) == (True, '')
+
+def test_strict_runs_ros2_every_time(write, ros2):
+    log = ros2(status=0)
+    path = write('a.xml', '<launch><arg name="a" default="1"/></launch>')
+    assert svValidator.validate(file=path, strict=True) == (True, '')
+    assert svValidator.validate(file=path, strict=True) == (True, '')
+    assert svValidator.validate(file=path) == (True, '')
+    assert log.read_text().splitlines() == [f'launch {path} -p'] * 2
+
+@pytest.mark.parametrize('source, reason', [
+    ('def generate_launch_description(:\n', 'SyntaxError'),
+    ('def other():\n    return LaunchDescription([])\n', 'not defined at module level'),
+    ('def outer():\n    def generate_launch_description():\n        return None\n', 'not defined at module level'),
+    ('def generate_launch_description():\n    LaunchDescription([])\n', 'does not return'),
+])
+def test_invalid_python(write, source, reason):
+    valid, message = svValidator.validate(file=write('a.launch.py', source))
+    assert not valid and reason in message
+
+def test_valid_python(write):
+    assert svValidator.validate(file=write('a.launch.py', 'def generate_launch_description():\n    return LaunchDescription([])\n')) == (True, '')
+
+def test_unchanged_file_is_checked_once(write, monkeypatch):
+    path = write('a.xml', '<launch><arg name="a" default="1"/></launch>')
+    svValidator.validate(file=path)
+    def check(*args, **kwargs): raise AssertionError('checked again')
+    monkeypatch.setattr(svValidator, 'xml', check)
+    # Another process => nothing kept in memory, the on-disk entry answers.
+    svValidator.VALIDATED.clear()
+    assert svValidator.validate(file=path) == (True, '')
+
+def test_changed_file_is_checked_again(write):
+    path = write('a.xml', '<launch><arg name="a" default="1"/></launch>')
+    assert svValidator.validate(file=path)[0]
+    write('a.xml', '<launch><node/>')
+    assert not svValidator.validate(file=path)[0]
+
+def test_missing_file(tmp_path):
+    valid, reason = svValidator.validate(file=str(tmp_path / 'missing.xml'))
+    assert not valid and 'FileNotFoundError' in reason